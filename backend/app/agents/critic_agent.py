@@ -64,12 +64,13 @@ def _build_critic_context(state: SellerState) -> str:
 
 
 @traceable_node("critic_agent")
-def _call_critic_llm(prompt: str) -> CriticLLMOutput:
+async def _call_critic_llm(prompt: str) -> CriticLLMOutput:
     client = get_llm_client()
-    return client.generate_structured(prompt, CriticLLMOutput)
+    # Deterministic critique; temperature 0 also makes it cacheable.
+    return await client.agenerate_structured(prompt, CriticLLMOutput, temperature=0.0)
 
 
-def update_critique(state: SellerState) -> SellerState:
+async def update_critique(state: SellerState) -> SellerState:
     """
     Reflection / Critic Agent.
 
@@ -92,7 +93,7 @@ def update_critique(state: SellerState) -> SellerState:
     logger.info("Critic agent invoking LLM")
 
     try:
-        llm_output = _call_critic_llm(complete_prompt)
+        llm_output = await _call_critic_llm(complete_prompt)
     except LLMError as exc:
         logger.error(
             "Critic LLM call failed; leaving state.critique unchanged",
@@ -220,15 +220,15 @@ def _build_final_context(state: SellerState) -> str:
 
 
 @traceable_node("final_answer_agent")
-def _call_final_answer_llm(prompt: str) -> FinalAnswerLLMOutput:
+async def _call_final_answer_llm(prompt: str) -> FinalAnswerLLMOutput:
     """
     Internal LLM call wrapped with LangSmith tracing.
     """
     client = get_llm_client()
-    return client.generate_structured(prompt, FinalAnswerLLMOutput)
+    return await client.agenerate_structured(prompt, FinalAnswerLLMOutput)
 
 
-def update_final_answer(state: SellerState) -> SellerState:
+async def update_final_answer(state: SellerState) -> SellerState:
     """
     Final Answer Agent.
 
@@ -258,7 +258,7 @@ def update_final_answer(state: SellerState) -> SellerState:
     logger.info("Final answer agent invoking LLM")
 
     try:
-        llm_output = _call_final_answer_llm(complete_prompt)
+        llm_output = await _call_final_answer_llm(complete_prompt)
     except LLMError as exc:
         # Fallback: keep the old, deterministic markdown composition style
         logger.error(
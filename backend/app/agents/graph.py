@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any, Dict, List
 
 from langgraph.graph import END, StateGraph
@@ -217,9 +218,9 @@ def analysis_join_node(state: GraphState) -> Dict[str, Any]:
 
 
 @traceable_node("graph.planner")
-def planner_node(state: GraphState) -> Dict[str, Any]:
+async def planner_node(state: GraphState) -> Dict[str, Any]:
     seller_state = _to_seller_state(state)
-    seller_state = update_action_plan(seller_state)
+    seller_state = await update_action_plan(seller_state)
     return {
         "action_plan": seller_state.action_plan,
         "listing_branch_actions": [],
@@ -332,9 +333,9 @@ def action_join_node(state: GraphState) -> Dict[str, Any]:
 
 
 @traceable_node("graph.critic")
-def critic_node(state: GraphState) -> Dict[str, Any]:
+async def critic_node(state: GraphState) -> Dict[str, Any]:
     seller_state = _to_seller_state(state)
-    seller_state = update_critique(seller_state)
+    seller_state = await update_critique(seller_state)
     return {
         "critique": seller_state.critique,
         "execution_trace": _record_step("critic", tools=["llm"]),
@@ -342,9 +343,9 @@ def critic_node(state: GraphState) -> Dict[str, Any]:
 
 
 @traceable_node("graph.final_answer")
-def final_answer_node(state: GraphState) -> Dict[str, Any]:
+async def final_answer_node(state: GraphState) -> Dict[str, Any]:
     seller_state = _to_seller_state(state)
-    seller_state = update_final_answer(seller_state)
+    seller_state = await update_final_answer(seller_state)
     return {
         "final_answer": seller_state.final_answer,
         "execution_trace": _record_step("final_answer", tools=["llm"]),
@@ -417,3 +418,16 @@ def create_copilot_graph() -> Any:
     graph.add_edge("hitl", END)
 
     return graph.compile()
+
+
+@lru_cache(maxsize=1)
+def get_copilot_graph() -> Any:
+    """
+    Process-wide compiled copilot graph.
+
+    Compiling the LangGraph is expensive, so every caller (API endpoints,
+    evals) shares this single instance instead of compiling their own.
+    """
+    compiled = create_copilot_graph()
+    logger.info("Compiled copilot graph", extra={"graph_id": id(compiled)})
+    return compiled
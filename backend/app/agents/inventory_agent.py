@@ -6,9 +6,9 @@ from typing import Dict, List, Optional
 from ..db import seller_repository
 from ..observability.logging import get_logger
 from ..tools.demand_tool import (
+    DemandForecastCompactResponse,
     DemandForecastRequest,
-    DemandForecastResponse,
-    forecast_demand,
+    forecast_demand_compact,
 )
 from .state import InventoryAnalysis, InventoryRiskLevel, SellerState
 
@@ -38,19 +38,17 @@ def _choose_product_ids_for_inventory(
 
 def _compute_days_of_cover(
     current_stock: int,
-    forecast: DemandForecastResponse,
+    forecast: DemandForecastCompactResponse,
 ) -> Optional[float]:
     """
     Approximate how many days of demand the current stock can cover.
 
     We use average expected_units across the horizon as a proxy.
     """
-    if current_stock <= 0 or not forecast.forecast:
+    if current_stock <= 0 or not forecast.expected_units:
         return None
 
-    avg_daily = sum(pt.expected_units for pt in forecast.forecast) / len(
-        forecast.forecast
-    )
+    avg_daily = sum(forecast.expected_units) / len(forecast.expected_units)
     if avg_daily <= 0:
         return None
 
@@ -134,7 +132,7 @@ def update_inventory_analyses(
       - Select products
       - For each product:
           * fetch inventory record
-          * run demand_tool.forecast_demand
+          * run demand_tool.forecast_demand_compact
           * compute projected days of cover
           * assign a qualitative risk level
       - Populate SellerState.inventory_analyses
@@ -164,7 +162,7 @@ def update_inventory_analyses(
             )
             continue
 
-        forecast = forecast_demand(
+        forecast = forecast_demand_compact(
             DemandForecastRequest(
                 product_id=product_id,
                 horizon_days=forecast_horizon_days,
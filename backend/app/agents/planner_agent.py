@@ -182,15 +182,17 @@ def _build_planner_context(state: SellerState) -> str:
 
 
 @traceable_node("planner_agent")
-def _call_planner_llm(prompt: str) -> PlannerLLMOutput:
+async def _call_planner_llm(prompt: str) -> PlannerLLMOutput:
     """
     Internal LLM call wrapped with LangSmith tracing.
     """
     client = get_llm_client()
-    return client.generate_structured(prompt, PlannerLLMOutput)
+    # Greedy decoding: the output is structured analysis, and temperature 0
+    # lets repeated identical prompts hit the client's response cache.
+    return await client.agenerate_structured(prompt, PlannerLLMOutput, temperature=0.0)
 
 
-def update_action_plan(state: SellerState) -> SellerState:
+async def update_action_plan(state: SellerState) -> SellerState:
     """
     Planner Agent.
 
@@ -216,7 +218,7 @@ def update_action_plan(state: SellerState) -> SellerState:
     logger.info("Planner agent invoking LLM for action plan")
 
     try:
-        llm_output = _call_planner_llm(complete_prompt)
+        llm_output = await _call_planner_llm(complete_prompt)
     except LLMError as exc:
         # On failure, fall back to a placeholder action plan rather than
         # failing the entire graph run.
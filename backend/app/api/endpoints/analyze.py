@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import asyncio
 import re
 import time
 from uuid import uuid4
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set
 
+import orjson
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
 
-from ...agents.graph import create_copilot_graph
+from ...agents.graph import get_copilot_graph
 from ...agents.state import (
     Critique,
     FinalAnswer,
@@ -37,8 +40,8 @@ logger = get_logger("api.analyze")
 
 router = APIRouter(tags=["analyze"])
 
-# Compile the LangGraph once at import time.
-_copilot_graph = create_copilot_graph()
+# Awaited with the node name each time a graph node finishes.
+NodeCallback = Callable[[str], Awaitable[None]]
 
 # Pydantic request/response models for the endpoint
 
@@ -181,7 +184,8 @@ def _mode_label_from_state(state: SellerState) -> str:
 
 
 def _extract_used_tools(execution_trace: List[str]) -> List[str]:
-    tools: Set[str] = set()
+    # dict keeps first-seen order with O(1) dedup, so no final sort is needed.
+    tools: Dict[str, None] = {}
     for item in execution_trace:
         if "tools=" not in item:
             continue
@@ -189,8 +193,8 @@ def _extract_used_tools(execution_trace: List[str]) -> List[str]:
         for tool in tools_str.split(","):
             cleaned = tool.strip()
             if cleaned:
-                tools.add(cleaned)
-    return sorted(tools)
+                tools[cleaned] = None
+    return list(tools)
 
 
 def _extract_rag_evidence(state: SellerState, max_items: int = 10) -> List[str]:
@@ -297,8 +301,23 @@ async def _run_graph_with_trace(
     initial_state: Dict[str, Any],
     session_id: Optional[str],
     request_id: str,
+    on_node: Optional[NodeCallback] = None,
 ) -> Dict[str, Any]:
-    return await _copilot_graph.ainvoke(initial_state)
+    graph = get_copilot_graph()
+    if on_node is None:
+        return await graph.ainvoke(initial_state)
+
+    # Same run as ainvoke, but report each node as it finishes; the last
+    # "values" chunk is the final state ainvoke would have returned.
+    final_state: Dict[str, Any] = initial_state
+    async for mode, chunk in graph.astream(initial_state, stream_mode=["updates", "values"]):
+        if mode == "values":
+            final_state = chunk
+            continue
+        for node_name in chunk:
+            if not node_name.startswith("__"):
+                await on_node(node_name)
+    return final_state
 
 
 def _extract_seller_name_from_text(text: str) -> Optional[str]:
@@ -332,6 +351,63 @@ async def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
       - Domain metrics (requests + latency per mode)
       - JSON logs with trace/span from logging factory
     """
+    return await _analyze(req)
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    return b"event: " + event.encode() + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post(
+    "/analyze/stream",
+    summary="Analyze with server-sent progress events.",
+)
+async def analyze_stream(req: AnalyzeRequest) -> StreamingResponse:
+    """
+    Same flow as /analyze, streamed as server-sent events so clients can
+    show progress instead of blocking on the whole run:
+
+      - `node`: {"node": <name>} each time a graph node finishes
+      - `result`: the AnalyzeResponse payload (sent once, last)
+      - `error`: {"status_code": ..., "detail": ...} instead of a result
+    """
+    queue: asyncio.Queue[Optional[bytes]] = asyncio.Queue()
+
+    async def on_node(node_name: str) -> None:
+        await queue.put(_sse_event("node", {"node": node_name}))
+
+    async def run() -> None:
+        try:
+            response = await _analyze(req, on_node=on_node)
+            await queue.put(_sse_event("result", response.model_dump(mode="json")))
+        except HTTPException as exc:
+            await queue.put(
+                _sse_event("error", {"status_code": exc.status_code, "detail": exc.detail})
+            )
+        finally:
+            await queue.put(None)
+
+    async def events() -> AsyncIterator[bytes]:
+        task = asyncio.create_task(run())
+        try:
+            while (item := await queue.get()) is not None:
+                yield item
+        finally:
+            # Client went away: stop the graph run rather than finish it unseen.
+            if not task.done():
+                task.cancel()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _analyze(
+    req: AnalyzeRequest,
+    on_node: Optional[NodeCallback] = None,
+) -> AnalyzeResponse:
     start_time = time.perf_counter()
     requested_mode_label = req.mode.value if req.mode else "auto"
 
@@ -392,6 +468,7 @@ async def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
             initial_state=initial_state_dict,
             session_id=session_id,
             request_id=request_id,
+            on_node=on_node,
         )
 
         final_state = SellerState.model_validate(final_state_dict)
@@ -409,6 +486,7 @@ async def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
                     initial_state=rerun_state.model_dump(),
                     session_id=session_id,
                     request_id=request_id,
+                    on_node=on_node,
                 )
                 final_state = SellerState.model_validate(rerun_state_dict)
                 final_state.answer_quality_signals["fallback_applied"] = 1.0
@@ -446,16 +524,21 @@ async def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
             },
         )
 
+        used_tools = _extract_used_tools(final_state.execution_trace)
+        used_rag_evidence = _extract_rag_evidence(final_state)
+        rag_debug = _build_rag_debug(final_state)
+        routing_debug = _build_routing_debug(final_state)
+
         add_message(
             session_id=session_id,
             role="assistant",
             content=final_state.final_answer.answer_markdown,
             request_id=request_id,
             metadata={
-                "used_tools": _extract_used_tools(final_state.execution_trace),
-                "used_rag_evidence": _extract_rag_evidence(final_state),
-                "rag_debug": _build_rag_debug(final_state),
-                "routing_debug": _build_routing_debug(final_state),
+                "used_tools": used_tools,
+                "used_rag_evidence": used_rag_evidence,
+                "rag_debug": rag_debug,
+                "routing_debug": routing_debug,
                 "execution_trace": final_state.execution_trace,
                 "citations": (
                     final_state.final_answer.citations
@@ -478,10 +561,10 @@ async def analyze(req: AnalyzeRequest) -> AnalyzeResponse:
             critique=final_state.critique,
             hitl_feedback=final_state.hitl_feedback,
             execution_trace=final_state.execution_trace,
-            used_tools=_extract_used_tools(final_state.execution_trace),
-            used_rag_evidence=_extract_rag_evidence(final_state),
-            rag_debug=_build_rag_debug(final_state),
-            routing_debug=_build_routing_debug(final_state),
+            used_tools=used_tools,
+            used_rag_evidence=used_rag_evidence,
+            rag_debug=rag_debug,
+            routing_debug=routing_debug,
             session_id=session_id,
             request_id=request_id,
             state=final_state,
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import os
 from enum import Enum
-from functools import lru_cache
+from functools import cached_property
 from pathlib import Path
-from typing import Literal, Optional
+from typing import Any, Dict, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
-from pydantic_settings import BaseSettings
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AppEnv(str, Enum):
@@ -15,7 +16,13 @@ class AppEnv(str, Enum):
     PROD = "prod"
 
 
+_APP_ENV_BY_VALUE: Dict[str, AppEnv] = {env.value: env for env in AppEnv}
+_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+
 class AppSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(default="Marketplace Seller Intelligence Copilot")
     env: AppEnv = Field(default=AppEnv.DEV)
     host: str = Field(default="0.0.0.0")
@@ -33,11 +40,18 @@ class AppSettings(BaseModel):
 
 
 class OTELSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     service_name: str = Field(default="marketplace-copilot-api")
     exporter_otlp_endpoint: str = Field(default="http://alloy:4317")
     exporter_otlp_protocol: Literal["grpc", "http/protobuf", "http/json"] = Field(
         default="grpc"
     )
+    # BatchSpanProcessor tuning: large batches, bounded queue.
+    max_queue_size: int = Field(default=8192, ge=1)
+    max_export_batch_size: int = Field(default=1024, ge=1)
+    schedule_delay_millis: int = Field(default=1000, ge=1)
+    export_timeout_millis: int = Field(default=10000, ge=1)
 
 
 class WarehouseSettings(BaseModel):
@@ -50,22 +64,35 @@ class WarehouseSettings(BaseModel):
     and the repository implementation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     seller_warehouse_dsn: str = Field(
         default="duckdb:///app_storage/seller_warehouse.duckdb"
     )
     seller_data_root: str = Field(default="data/seller")
+    pool_size: int = Field(default=4, ge=1)
 
 
 class RAGSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     backend: Literal["opensearch", "local_file"] = Field(default="opensearch")
     vector_store_url: str = Field(default="http://rag-vector-store:8000")
     vector_store_collection: str = Field(default="marketplace_policies")
     opensearch_url: str = Field(default="http://localhost:9200")
     opensearch_index: str = Field(default="marketplace_policies")
     opensearch_timeout_seconds: float = Field(default=10.0)
+    max_concurrent: int = Field(default=16, ge=1)
+    # Search pipeline that normalizes + combines native hybrid query scores.
+    opensearch_hybrid_pipeline: str = Field(default="copilot-hybrid")
+    # Retrieval result LRU; 0 disables it.
+    result_cache_size: int = Field(default=1024, ge=0)
+    result_cache_ttl_seconds: float = Field(default=300.0, gt=0)
 
 
 class LLMSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     provider: Literal["hybrid", "ollama", "groq"] = Field(default="hybrid")
     model: str = Field(default="qwen3:14b")
     primary_provider: Literal["ollama", "groq"] = Field(default="ollama")
@@ -76,15 +103,22 @@ class LLMSettings(BaseModel):
     groq_base_url: str = Field(default="https://api.groq.com/openai/v1")
     groq_model: str = Field(default="llama-3.3-70b-versatile")
     embed_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
+    # "onnx" runs the query embedder through ONNX Runtime (see rag.onnx_export).
+    embed_backend: Literal["torch", "onnx"] = Field(default="torch")
+    embed_onnx_file: Optional[str] = None
 
 
 class LLMObservabilitySettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     tracing_v2: bool = False
     langsmith_api_key: Optional[str] = None
     langsmith_project: Optional[str] = "marketplace-copilot"
 
 
 class PromptVersionSettings(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     planner: str = Field(default="v1")
     critic: str = Field(default="v1")
     final_answer: str = Field(default="v1")
@@ -95,6 +129,37 @@ class PromptVersionSettings(BaseModel):
     profit_agent: str = Field(default="v1")
 
 
+# Default instances, built once so the Settings fallbacks below read plain
+# attributes instead of constructing a throwaway model per field.
+_APP_DEFAULTS = AppSettings()
+_OTEL_DEFAULTS = OTELSettings()
+_WAREHOUSE_DEFAULTS = WarehouseSettings()
+_RAG_DEFAULTS = RAGSettings()
+_LLM_DEFAULTS = LLMSettings()
+_LLM_OBS_DEFAULTS = LLMObservabilitySettings()
+_PROMPT_DEFAULTS = PromptVersionSettings()
+
+# Legacy (un-prefixed) env vars consulted as fallbacks by Settings.
+_LEGACY_KEYS = frozenset(
+    {
+        "APP_NAME",
+        "APP_ENV",
+        "APP_HOST",
+        "APP_PORT",
+        "LOG_LEVEL",
+        "OTEL_SERVICE_NAME",
+        "OTEL_EXPORTER_OTLP_ENDPOINT",
+        "OTEL_EXPORTER_OTLP_PROTOCOL",
+        "COPILOT_SELLER_WAREHOUSE_DSN",
+        "COPILOT_SELLER_DATA_ROOT",
+        "GROQ_API_KEY",
+        "LANGCHAIN_TRACING_V2",
+        "LANGCHAIN_API_KEY",
+        "LANGCHAIN_PROJECT",
+    }
+)
+
+
 class Settings(BaseSettings):
     """
     Top-level application settings loaded from environment.
@@ -102,6 +167,9 @@ class Settings(BaseSettings):
     Priority:
       1. COPILOT_* variables (new, namespaced)
       2. Legacy APP_* / OTEL_* where appropriate
+
+    The grouped views (app, otel, llm, ...) are computed on first access
+    and cached on the instance.
     """
 
     # App
@@ -115,10 +183,15 @@ class Settings(BaseSettings):
     otel_service_name: Optional[str] = None
     otel_exporter_otlp_endpoint: Optional[str] = None
     otel_exporter_otlp_protocol: Optional[str] = None
+    otel_max_queue_size: Optional[int] = None
+    otel_max_export_batch_size: Optional[int] = None
+    otel_schedule_delay_millis: Optional[int] = None
+    otel_export_timeout_millis: Optional[int] = None
 
     # Warehouse
     seller_warehouse_dsn: Optional[str] = None
     seller_data_root: Optional[str] = None
+    warehouse_pool_size: Optional[int] = None
 
     # RAG
     rag_vector_store_url: Optional[str] = None
@@ -127,6 +200,10 @@ class Settings(BaseSettings):
     opensearch_url: Optional[str] = None
     opensearch_index: Optional[str] = None
     opensearch_timeout_seconds: Optional[float] = None
+    rag_max_concurrent: Optional[int] = None
+    opensearch_hybrid_pipeline: Optional[str] = None
+    rag_result_cache_size: Optional[int] = None
+    rag_result_cache_ttl_seconds: Optional[float] = None
 
     # LLM
     llm_provider: Optional[str] = None
@@ -139,6 +216,8 @@ class Settings(BaseSettings):
     groq_base_url: Optional[str] = None
     groq_model: Optional[str] = None
     embed_model: Optional[str] = None
+    embed_backend: Optional[Literal["torch", "onnx"]] = None
+    embed_onnx_file: Optional[str] = None
 
     # LLM Observability
     langchain_tracing_v2: Optional[str] = None
@@ -157,82 +236,112 @@ class Settings(BaseSettings):
     inventory_agent_prompt_version: Optional[str] = None
     profit_agent_prompt_version: Optional[str] = None
 
-    class Config:
-        env_prefix = "COPILOT_"
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    _legacy: Dict[str, Optional[str]] = PrivateAttr(default_factory=dict)
+
+    model_config = SettingsConfigDict(
+        env_prefix="COPILOT_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+    )
+
+    def model_post_init(self, __context: Any) -> None:
+        # Env vars do not change during the process lifetime; snapshot the
+        # legacy ones once instead of calling os.getenv per property.
+        self._legacy = {key: os.environ.get(key) for key in _LEGACY_KEYS}
 
-    @property
+    @cached_property
     def app(self) -> AppSettings:
-        name = self.app_name or self._get_legacy("APP_NAME") or AppSettings().name
-        env_str = self.app_env or self._get_legacy("APP_ENV") or AppSettings().env
-        host = self.app_host or self._get_legacy("APP_HOST") or AppSettings().host
-        port = self.app_port or int(self._get_legacy("APP_PORT", "8000"))
+        name = self.app_name or self._get_legacy("APP_NAME") or _APP_DEFAULTS.name
+        env_str = self.app_env or self._get_legacy("APP_ENV") or _APP_DEFAULTS.env
+        host = self.app_host or self._get_legacy("APP_HOST") or _APP_DEFAULTS.host
+        legacy_port = self._get_legacy("APP_PORT")
+        port = self.app_port or (int(legacy_port) if legacy_port else _APP_DEFAULTS.port)
         log_level = (
-            self.log_level or self._get_legacy("LOG_LEVEL") or AppSettings().log_level
+            self.log_level or self._get_legacy("LOG_LEVEL") or _APP_DEFAULTS.log_level
         )
 
+        env = _APP_ENV_BY_VALUE.get(env_str)
+        if env is not None and log_level in _LOG_LEVELS and 1 <= port <= 65535:
+            # Every field is already known-valid; skip re-validation.
+            return AppSettings.model_construct(
+                name=name, env=env, host=host, port=port, log_level=log_level
+            )
+
         return AppSettings(
             name=name,
-            env=AppEnv(env_str),
+            env=env_str,
             host=host,
             port=port,
             log_level=log_level,  # validated by AppSettings
         )
 
-    @property
+    @cached_property
     def otel(self) -> OTELSettings:
         service_name = (
             self.otel_service_name
             or self._get_legacy("OTEL_SERVICE_NAME")
-            or OTELSettings().service_name
+            or _OTEL_DEFAULTS.service_name
         )
         endpoint = (
             self.otel_exporter_otlp_endpoint
             or self._get_legacy("OTEL_EXPORTER_OTLP_ENDPOINT")
-            or OTELSettings().exporter_otlp_endpoint
+            or _OTEL_DEFAULTS.exporter_otlp_endpoint
         )
         protocol = (
             self.otel_exporter_otlp_protocol
             or self._get_legacy("OTEL_EXPORTER_OTLP_PROTOCOL")
-            or OTELSettings().exporter_otlp_protocol
+            or _OTEL_DEFAULTS.exporter_otlp_protocol
         )
 
         return OTELSettings(
             service_name=service_name,
             exporter_otlp_endpoint=endpoint,
             exporter_otlp_protocol=protocol,
+            max_queue_size=self.otel_max_queue_size or _OTEL_DEFAULTS.max_queue_size,
+            max_export_batch_size=(
+                self.otel_max_export_batch_size
+                or _OTEL_DEFAULTS.max_export_batch_size
+            ),
+            schedule_delay_millis=(
+                self.otel_schedule_delay_millis
+                or _OTEL_DEFAULTS.schedule_delay_millis
+            ),
+            export_timeout_millis=(
+                self.otel_export_timeout_millis
+                or _OTEL_DEFAULTS.export_timeout_millis
+            ),
         )
 
-    @property
+    @cached_property
     def warehouse(self) -> WarehouseSettings:
         dsn = (
             self.seller_warehouse_dsn
             or self._get_legacy("COPILOT_SELLER_WAREHOUSE_DSN")
-            or WarehouseSettings().seller_warehouse_dsn
+            or _WAREHOUSE_DEFAULTS.seller_warehouse_dsn
         )
         data_root = (
             self.seller_data_root
             or
             self._get_legacy("COPILOT_SELLER_DATA_ROOT")
-            or WarehouseSettings().seller_data_root
+            or _WAREHOUSE_DEFAULTS.seller_data_root
         )
         return WarehouseSettings(
             seller_warehouse_dsn=dsn,
             seller_data_root=data_root,
+            pool_size=self.warehouse_pool_size or _WAREHOUSE_DEFAULTS.pool_size,
         )
 
-    @property
+    @cached_property
     def rag(self) -> RAGSettings:
-        url = self.rag_vector_store_url or RAGSettings().vector_store_url
+        url = self.rag_vector_store_url or _RAG_DEFAULTS.vector_store_url
         collection = (
-            self.rag_vector_store_collection or RAGSettings().vector_store_collection
+            self.rag_vector_store_collection or _RAG_DEFAULTS.vector_store_collection
         )
-        backend = self.rag_backend or RAGSettings().backend
-        opensearch_url = self.opensearch_url or RAGSettings().opensearch_url
-        opensearch_index = self.opensearch_index or RAGSettings().opensearch_index
+        backend = self.rag_backend or _RAG_DEFAULTS.backend
+        opensearch_url = self.opensearch_url or _RAG_DEFAULTS.opensearch_url
+        opensearch_index = self.opensearch_index or _RAG_DEFAULTS.opensearch_index
         opensearch_timeout_seconds = (
-            self.opensearch_timeout_seconds or RAGSettings().opensearch_timeout_seconds
+            self.opensearch_timeout_seconds or _RAG_DEFAULTS.opensearch_timeout_seconds
         )
         return RAGSettings(
             backend=backend,
@@ -241,33 +350,51 @@ class Settings(BaseSettings):
             opensearch_url=opensearch_url,
             opensearch_index=opensearch_index,
             opensearch_timeout_seconds=opensearch_timeout_seconds,
+            max_concurrent=self.rag_max_concurrent or _RAG_DEFAULTS.max_concurrent,
+            opensearch_hybrid_pipeline=(
+                self.opensearch_hybrid_pipeline
+                or _RAG_DEFAULTS.opensearch_hybrid_pipeline
+            ),
+            result_cache_size=(
+                self.rag_result_cache_size
+                if self.rag_result_cache_size is not None
+                else _RAG_DEFAULTS.result_cache_size
+            ),
+            result_cache_ttl_seconds=(
+                self.rag_result_cache_ttl_seconds
+                or _RAG_DEFAULTS.result_cache_ttl_seconds
+            ),
         )
 
-    @property
+    @cached_property
     def llm(self) -> LLMSettings:
         return LLMSettings(
-            provider=self.llm_provider or LLMSettings().provider,
-            model=self.llm_model or LLMSettings().model,
+            provider=self.llm_provider or _LLM_DEFAULTS.provider,
+            model=self.llm_model or _LLM_DEFAULTS.model,
             primary_provider=self.llm_primary_provider
-            or LLMSettings().primary_provider,
+            or _LLM_DEFAULTS.primary_provider,
             fallback_provider=self.llm_fallback_provider
-            or LLMSettings().fallback_provider,
-            ollama_base_url=self.ollama_base_url or LLMSettings().ollama_base_url,
-            ollama_model=self.ollama_model or LLMSettings().ollama_model,
+            or _LLM_DEFAULTS.fallback_provider,
+            ollama_base_url=self.ollama_base_url or _LLM_DEFAULTS.ollama_base_url,
+            ollama_model=self.ollama_model or _LLM_DEFAULTS.ollama_model,
             groq_api_key=self.groq_api_key
             or self._get_legacy("GROQ_API_KEY")
-            or LLMSettings().groq_api_key,
-            groq_base_url=self.groq_base_url or LLMSettings().groq_base_url,
-            groq_model=self.groq_model or LLMSettings().groq_model,
-            embed_model=self.embed_model or LLMSettings().embed_model,
+            or _LLM_DEFAULTS.groq_api_key,
+            groq_base_url=self.groq_base_url or _LLM_DEFAULTS.groq_base_url,
+            groq_model=self.groq_model or _LLM_DEFAULTS.groq_model,
+            embed_model=self.embed_model or _LLM_DEFAULTS.embed_model,
+            embed_backend=self.embed_backend or _LLM_DEFAULTS.embed_backend,
+            embed_onnx_file=self.embed_onnx_file or _LLM_DEFAULTS.embed_onnx_file,
         )
 
-    @property
+    @cached_property
     def llm_obs(self) -> LLMObservabilitySettings:
-        tracing_raw = self.langchain_tracing_v2 or self._get_legacy(
-            "LANGCHAIN_TRACING_V2", "false"
+        tracing_raw = self.langchain_tracing_v2 or self._get_legacy("LANGCHAIN_TRACING_V2")
+        tracing_v2 = (
+            str(tracing_raw).strip().lower() in ("1", "true", "yes", "on")
+            if tracing_raw
+            else _LLM_OBS_DEFAULTS.tracing_v2
         )
-        tracing_v2 = str(tracing_raw).strip().lower() in ("1", "true", "yes", "on")
 
         return LLMObservabilitySettings(
             tracing_v2=tracing_v2,
@@ -277,49 +404,52 @@ class Settings(BaseSettings):
             langsmith_project=self.langsmith_project
             or self.langchain_project
             or self._get_legacy("LANGCHAIN_PROJECT")
-            or LLMObservabilitySettings().langsmith_project,
+            or _LLM_OBS_DEFAULTS.langsmith_project,
         )
 
-    @property
+    @cached_property
     def prompts(self) -> PromptVersionSettings:
         return PromptVersionSettings(
-            planner=self.planner_prompt_version or PromptVersionSettings().planner,
-            critic=self.critic_prompt_version or PromptVersionSettings().critic,
+            planner=self.planner_prompt_version or _PROMPT_DEFAULTS.planner,
+            critic=self.critic_prompt_version or _PROMPT_DEFAULTS.critic,
             final_answer=self.final_answer_prompt_version
-            or PromptVersionSettings().final_answer,
+            or _PROMPT_DEFAULTS.final_answer,
             listing_agent=self.listing_agent_prompt_version
-            or PromptVersionSettings().listing_agent,
+            or _PROMPT_DEFAULTS.listing_agent,
             pricing_agent=self.pricing_agent_prompt_version
-            or PromptVersionSettings().pricing_agent,
+            or _PROMPT_DEFAULTS.pricing_agent,
             compliance_agent=self.compliance_agent_prompt_version
-            or PromptVersionSettings().compliance_agent,
+            or _PROMPT_DEFAULTS.compliance_agent,
             inventory_agent=self.inventory_agent_prompt_version
-            or PromptVersionSettings().inventory_agent,
+            or _PROMPT_DEFAULTS.inventory_agent,
             profit_agent=self.profit_agent_prompt_version
-            or PromptVersionSettings().profit_agent,
+            or _PROMPT_DEFAULTS.profit_agent,
         )
 
     # Helpers
 
-    @staticmethod
-    def _get_legacy(name: str, default: Optional[str] = None) -> Optional[str]:
-        """Read legacy env vars (APP_*, OTEL_*) directly if needed."""
-        import os
+    def _get_legacy(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Read legacy env vars (APP_*, OTEL_*) from the startup snapshot."""
+        value = self._legacy.get(name)
+        return default if value is None else value
+
 
-        return os.getenv(name, default)
+_SETTINGS: Optional[Settings] = None
 
 
-@lru_cache()
 def get_settings() -> Settings:
     """
-    Cached settings instance to avoid re-parsing env on every import.
+    Process-wide settings instance to avoid re-parsing env on every import.
 
     Usage:
         from backend.app.core.config import get_settings
         settings = get_settings()
         settings.app.name, settings.app.port, ...
     """
-    return Settings()
+    global _SETTINGS
+    if _SETTINGS is None:
+        _SETTINGS = Settings()
+    return _SETTINGS
 
 
 settings = get_settings()
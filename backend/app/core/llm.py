@@ -1,20 +1,36 @@
 from __future__ import annotations
 
-import json
+import asyncio
+import atexit
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from functools import lru_cache
-from typing import Any, Dict, Optional, Type, TypeVar
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 import httpx
+import orjson
 from pydantic import BaseModel
 
 from ..observability.logging import get_logger
 from .config import settings
 
-try:
-    from openai import OpenAI
-except Exception:  # pragma: no cover - optional import at runtime
-    OpenAI = None  # type: ignore[assignment]
-
 logger = get_logger("core.llm")
 
 T = TypeVar("T", bound=BaseModel)
@@ -24,9 +40,336 @@ class LLMError(Exception):
     """Raised when the LLM provider returns an error or invalid response."""
 
 
-class LLMClient:
+class _LeaderInterrupted(Exception):
+    """Set on a coalesced call's future when its leader stopped without a result."""
+
+
+class _TransientLLMError(LLMError):
+    """Provider failure worth retrying (timeout, 429, 5xx)."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+_DEFAULT_SYSTEM_PROMPT = (
+    "You are a strict JSON-producing assistant. "
+    "You NEVER output anything except pure JSON that matches the requested schema."
+)
+# Immutable parts of chat payloads, shared across calls (never mutated).
+_DEFAULT_SYSTEM_MESSAGE = {"role": "system", "content": _DEFAULT_SYSTEM_PROMPT}
+
+# Responses are only memoized for (near-)deterministic sampling.
+_RESPONSE_CACHE_MAX_TEMPERATURE = 0.05
+_RESPONSE_CACHE_SIZE = 1024
+
+# Exponential backoff with full jitter for transient provider failures.
+_RETRY_ATTEMPTS = 5
+_RETRY_BASE_DELAY = 0.5
+_RETRY_MAX_DELAY = 16.0
+# Wall-clock budget for one provider call including its retries. A single
+# read timeout (60s) already exceeds it, so a hung provider fails (and the
+# hybrid provider fails over) after one attempt, and primary + fallback
+# still fit inside the UI's 180s request timeout.
+_RETRY_BUDGET_SECONDS = 45.0
+
+_HTTP_TIMEOUT = httpx.Timeout(60.0, connect=10.0)
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+
+def _is_retryable_status(status_code: Optional[int]) -> bool:
+    return status_code is not None and (status_code == 429 or status_code >= 500)
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After is either delta-seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _retry_delay(attempt: int, retry_after: Optional[float]) -> float:
+    if retry_after is not None:
+        return min(retry_after, _RETRY_MAX_DELAY)
+    return random.uniform(0.0, min(_RETRY_MAX_DELAY, _RETRY_BASE_DELAY * (2**attempt)))
+
+
+def _backoff_or_raise(
+    provider: str, attempt: int, exc: _TransientLLMError, deadline: float
+) -> float:
+    """
+    Seconds to wait before retrying after `exc` on `attempt` (0-based).
+
+    Re-raises `exc` once the attempts are exhausted or the next attempt
+    would start after `deadline` (time.monotonic()); shared by the sync and
+    async retry loops, which differ only in how they sleep.
+    """
+    if attempt >= _RETRY_ATTEMPTS - 1:
+        raise exc
+    delay = _retry_delay(attempt, exc.retry_after)
+    if time.monotonic() + delay >= deadline:
+        raise exc
+    logger.warning(
+        "Transient LLM provider error; retrying",
+        extra={
+            "provider": provider,
+            "attempt": attempt + 1,
+            "delay_s": round(delay, 3),
+            "error": str(exc),
+        },
+    )
+    return delay
+
+
+@lru_cache(maxsize=1)
+def _openai_module() -> Optional[Any]:
+    """
+    Import the OpenAI SDK on first Groq use only.
+
+    Ollama-only deployments (and the hybrid happy path) never pay for the
+    openai import graph.
+    """
+    try:
+        import openai
+    except Exception:  # pragma: no cover - optional import at runtime
+        return None
+    return openai
+
+
+@lru_cache(maxsize=32)
+def _ollama_options(temperature: float) -> Dict[str, Any]:
+    """Shared Ollama `options` sub-dict; agents only use a handful of temperatures."""
+    return {"temperature": temperature}
+
+
+def _system_message(system_prompt: Optional[str]) -> Dict[str, str]:
+    if system_prompt:
+        return {"role": "system", "content": system_prompt}
+    return _DEFAULT_SYSTEM_MESSAGE
+
+
+@lru_cache(maxsize=64)
+def _validator_for(output_model: Type[BaseModel]) -> Callable[[Any], Any]:
+    """Direct reference to the compiled pydantic-core validator of a model."""
+    return output_model.__pydantic_validator__.validate_python
+
+
+class _CircuitBreaker:
+    """
+    Per-provider breaker used by the hybrid provider.
+
+    closed -> open after `failure_threshold` consecutive failures; open ->
+    half-open once `reset_timeout` has elapsed, letting a single probe
+    through; the probe's outcome closes or re-opens the breaker.
+    """
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failure_count = 0
+        self.last_failure_time = 0.0
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if (
+                self.state == "open"
+                and time.monotonic() - self.last_failure_time >= self.reset_timeout
+            ):
+                self.state = "half_open"
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = "closed"
+            self.failure_count = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failure_count += 1
+            self.last_failure_time = time.monotonic()
+            if self.state == "half_open" or self.failure_count >= self.failure_threshold:
+                self.state = "open"
+
+    def record_interrupted(self) -> None:
+        """
+        Settle a call that ended without an answer (e.g. it was cancelled).
+
+        Says nothing about the provider's health, so it never counts as a
+        failure; it only hands an unfinished half-open probe back to `open`
+        so a later request can probe again.
+        """
+        with self._lock:
+            if self.state == "half_open":
+                self.state = "open"
+                self.last_failure_time = time.monotonic()
+
+
+class _OllamaStreamCollector:
+    """
+    Accumulate streamed `message.content` deltas into one JSON document.
+
+    Fails fast when the first non-whitespace output cannot start a JSON
+    value, instead of waiting for the model to finish generating.
+    """
+
+    __slots__ = ("buf", "started")
+
     def __init__(self) -> None:
+        self.buf = bytearray()
+        self.started = False
+
+    def feed(self, line: str) -> bool:
+        """Consume one NDJSON event; returns True once the stream is done."""
+        if not line:
+            return False
+        try:
+            event = orjson.loads(line)
+        except orjson.JSONDecodeError as exc:
+            raise LLMError("Ollama returned a non-JSON stream event") from exc
+        if event.get("error"):
+            raise LLMError(f"Ollama stream error: {event['error']}")
+
+        delta = (event.get("message") or {}).get("content") or ""
+        if delta:
+            if not self.started:
+                head = delta.lstrip()
+                if head:
+                    if head[0] not in "{[":
+                        raise LLMError("Ollama returned non-JSON content")
+                    self.started = True
+            self.buf += delta.encode("utf-8")
+        return bool(event.get("done"))
+
+    def result(self) -> bytes:
+        return bytes(self.buf)
+
+
+# Shared by default: provider health is a property of the process, not of
+# a particular LLMClient instance.
+_PROCESS_BREAKERS: Dict[str, _CircuitBreaker] = {
+    "ollama": _CircuitBreaker(),
+    "groq": _CircuitBreaker(),
+}
+
+
+class _LoopResources:
+    """
+    Async provider clients and in-flight futures owned by one event loop.
+
+    httpx/OpenAI async clients and asyncio futures are bound to the loop
+    that created them, so each running loop gets its own set.
+    """
+
+    __slots__ = ("http", "groq", "inflight")
+
+    def __init__(self) -> None:
+        self.http: Optional[httpx.AsyncClient] = None
+        self.groq: Optional[Any] = None
+        self.inflight: Dict[Hashable, asyncio.Future] = {}
+
+    async def aclose(self) -> None:
+        if self.http is not None:
+            await self.http.aclose()
+            self.http = None
+        if self.groq is not None:
+            await self.groq.close()
+            self.groq = None
+
+
+class LLMClient:
+    def __init__(self, breakers: Optional[Dict[str, _CircuitBreaker]] = None) -> None:
+        """
+        `breakers` overrides the process-wide per-provider circuit breakers
+        (tests pass fresh ones so breaker state does not leak between them).
+        """
         self.cfg = settings.llm
+        self._breakers = _PROCESS_BREAKERS if breakers is None else breakers
+        # Resolved once; the base URL does not change for a client's lifetime.
+        self._ollama_chat_url = self.cfg.ollama_base_url.rstrip("/") + "/api/chat"
+
+        # Pooled HTTP client for Ollama, created on first use and reused so
+        # keep-alive connections survive between LLM calls.
+        self._http: Optional[httpx.Client] = None
+        self._http_lock = threading.Lock()
+        self._groq_client: Optional[Any] = None
+        # Async counterparts, one set per running event loop (a second
+        # asyncio.run must not reuse clients bound to a closed loop).
+        self._loop_resources: Dict[asyncio.AbstractEventLoop, _LoopResources] = {}
+        self._loop_resources_lock = threading.Lock()
+
+        self._cache_lock = threading.Lock()
+        self._response_cache: OrderedDict[Hashable, BaseModel] = OrderedDict()
+        self._last_response: Optional[Tuple[Hashable, BaseModel]] = None
+
+        # Single-flight: concurrent identical calls share one provider request.
+        self._inflight_lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def __enter__(self) -> "LLMClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release pooled provider connections."""
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+            if self._groq_client is not None:
+                self._groq_client.close()
+                self._groq_client = None
+
+    async def aclose(self) -> None:
+        """
+        Release pooled connections of the sync clients and of the async
+        clients owned by the running event loop.
+        """
+        self.close()
+        loop = asyncio.get_running_loop()
+        with self._loop_resources_lock:
+            resources = self._loop_resources.pop(loop, None)
+        if resources is not None:
+            await resources.aclose()
+
+    def _aresources(self) -> _LoopResources:
+        loop = asyncio.get_running_loop()
+        resources = self._loop_resources.get(loop)
+        if resources is None:
+            with self._loop_resources_lock:
+                # Forget loops that have been closed (e.g. by a finished
+                # asyncio.run); their clients cannot be used or awaited.
+                for stale in [lp for lp in self._loop_resources if lp.is_closed()]:
+                    del self._loop_resources[stale]
+                resources = self._loop_resources.setdefault(loop, _LoopResources())
+        return resources
+
+    def _http_client(self) -> httpx.Client:
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                if self._http is None:
+                    self._http = httpx.Client(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+                http = self._http
+        return http
 
     def generate_structured(
         self,
@@ -34,6 +377,58 @@ class LLMClient:
         output_model: Type[T],
         system_prompt: Optional[str] = None,
         temperature: float = 0.2,
+    ) -> T:
+        call_key = self._call_key(prompt, output_model, system_prompt, temperature)
+        cacheable = temperature <= _RESPONSE_CACHE_MAX_TEMPERATURE
+        if cacheable:
+            cached = self._get_cached_response(call_key)
+            if cached is not None:
+                return cached  # type: ignore[return-value]
+
+        while True:
+            with self._inflight_lock:
+                future = self._inflight.get(call_key)
+                is_leader = future is None
+                if is_leader:
+                    # Re-check under the lock: a previous leader may have just
+                    # stored its result and left.
+                    cached = self._get_cached_response(call_key) if cacheable else None
+                    if cached is not None:
+                        return cached  # type: ignore[return-value]
+                    future = Future()
+                    self._inflight[call_key] = future
+            if is_leader:
+                break
+            try:
+                return future.result()
+            except _LeaderInterrupted:
+                # The leader was interrupted, not the provider; try again,
+                # possibly as the new leader.
+                continue
+
+        try:
+            result = self._generate_uncached(prompt, output_model, system_prompt, temperature)
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            future.set_exception(_LeaderInterrupted())
+            raise
+        else:
+            if cacheable:
+                self._store_cached_response(call_key, result)
+            future.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(call_key, None)
+
+    def _generate_uncached(
+        self,
+        prompt: str,
+        output_model: Type[T],
+        system_prompt: Optional[str],
+        temperature: float,
     ) -> T:
         raw: Dict[str, Any]
         if self.cfg.provider == "ollama":
@@ -45,27 +440,126 @@ class LLMClient:
         else:
             raise LLMError(f"Unsupported LLM provider: {self.cfg.provider}")
 
+        return self._validate(raw, output_model)
+
+    @staticmethod
+    def _validate(raw: Dict[str, Any], output_model: Type[T]) -> T:
         try:
-            return output_model.model_validate(raw)
+            return _validator_for(output_model)(raw)
         except Exception as exc:
             logger.error("Failed to parse LLM JSON into output model", extra={"error": str(exc)})
             raise LLMError("Failed to parse LLM output into Pydantic model") from exc
 
-    def _strict_json_system_prompt(self, system_prompt: Optional[str]) -> str:
-        if system_prompt:
-            return system_prompt
+    async def agenerate_structured(
+        self,
+        prompt: str,
+        output_model: Type[T],
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.2,
+    ) -> T:
+        """
+        Async counterpart of `generate_structured`.
+
+        Shares the response cache with the sync path; identical concurrent
+        calls on the event loop are coalesced onto one asyncio future. A
+        cancelled leader does not cancel its followers: they retry, and one
+        of them becomes the new leader.
+        """
+        call_key = self._call_key(prompt, output_model, system_prompt, temperature)
+        cacheable = temperature <= _RESPONSE_CACHE_MAX_TEMPERATURE
+        inflight = self._aresources().inflight
+        while True:
+            if cacheable:
+                cached = self._get_cached_response(call_key)
+                if cached is not None:
+                    return cached  # type: ignore[return-value]
+            pending = inflight.get(call_key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except _LeaderInterrupted:
+                continue
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        inflight[call_key] = future
+        try:
+            raw = await self._agenerate_raw(prompt, system_prompt, temperature)
+            result = self._validate(raw, output_model)
+        except Exception as exc:
+            future.set_exception(exc)
+            # Retrieved here so an un-awaited future does not log a warning.
+            future.exception()
+            raise
+        except BaseException:
+            # Cancelled: only this caller went away, not the followers.
+            future.set_exception(_LeaderInterrupted())
+            future.exception()
+            raise
+        else:
+            if cacheable:
+                self._store_cached_response(call_key, result)
+            future.set_result(result)
+            return result
+        finally:
+            inflight.pop(call_key, None)
+
+    def _call_key(
+        self,
+        prompt: str,
+        output_model: Type[BaseModel],
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Hashable:
+        # Keys hold a fixed-size digest instead of references to the (often
+        # multi-KB) prompt strings, so the cache size bounds its memory too.
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update((system_prompt or "").encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(prompt.encode("utf-8"))
         return (
-            "You are a strict JSON-producing assistant. "
-            "You NEVER output anything except pure JSON that matches the requested schema."
+            self.cfg.provider,
+            self.cfg.model,
+            system_prompt is None,
+            round(temperature, 3),
+            output_model,
+            digest.digest(),
         )
 
+    def _get_cached_response(self, key: Hashable) -> Optional[BaseModel]:
+        """
+        Look up a memoized response.
+
+        A size-1 "last used" slot is checked before the LRU so back-to-back
+        repeats of the same request skip the ordered-dict bookkeeping.
+        """
+        last = self._last_response
+        if last is not None and last[0] == key:
+            return last[1]
+
+        with self._cache_lock:
+            cached = self._response_cache.get(key)
+            if cached is None:
+                return None
+            self._response_cache.move_to_end(key)
+            self._last_response = (key, cached)
+            return cached
+
+    def _store_cached_response(self, key: Hashable, value: BaseModel) -> None:
+        with self._cache_lock:
+            self._response_cache[key] = value
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+            self._last_response = (key, value)
+
     def _parse_json_content(self, content: Any, provider: str) -> Dict[str, Any]:
         if isinstance(content, dict):
             return content
-        if isinstance(content, str):
+        if isinstance(content, (str, bytes)):
             try:
-                return json.loads(content)
-            except json.JSONDecodeError as exc:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError as exc:
                 raise LLMError(f"{provider} returned non-JSON content") from exc
         raise LLMError(f"{provider} returned unexpected content type: {type(content).__name__}")
 
@@ -77,95 +571,376 @@ class LLMClient:
     ) -> Dict[str, Any]:
         primary = self.cfg.primary_provider
         fallback = self.cfg.fallback_provider
+        breaker = self._breakers[primary]
 
-        try:
-            if primary == "ollama":
-                return self._generate_with_ollama(prompt, system_prompt, temperature)
-            return self._generate_with_groq(prompt, system_prompt, temperature)
-        except LLMError as exc:
-            logger.error(
-                "Primary LLM provider failed, attempting fallback",
-                extra={"primary_provider": primary, "fallback_provider": fallback, "error": str(exc)},
-            )
+        if breaker.allow_request():
+            try:
+                if primary == "ollama":
+                    result = self._generate_with_ollama(prompt, system_prompt, temperature)
+                else:
+                    result = self._generate_with_groq(prompt, system_prompt, temperature)
+            except LLMError as exc:
+                breaker.record_failure()
+                self._log_fallback(exc)
+            except BaseException:
+                # Cancelled (client went away) or crashed: not the provider's
+                # fault, but a half-open probe must not stay half-open forever.
+                breaker.record_interrupted()
+                raise
+            else:
+                breaker.record_success()
+                return result
 
         if fallback == "ollama":
             return self._generate_with_ollama(prompt, system_prompt, temperature)
         return self._generate_with_groq(prompt, system_prompt, temperature)
 
-    def _generate_with_ollama(
+    def _log_fallback(self, exc: LLMError) -> None:
+        logger.error(
+            "Primary LLM provider failed, attempting fallback",
+            extra={
+                "primary_provider": self.cfg.primary_provider,
+                "fallback_provider": self.cfg.fallback_provider,
+                "error": str(exc),
+            },
+        )
+
+    def _ollama_payload(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
-    ) -> Dict[str, Any]:
-        url = self.cfg.ollama_base_url.rstrip("/") + "/api/chat"
+    ) -> bytes:
         payload: Dict[str, Any] = {
             "model": self.cfg.ollama_model or self.cfg.model,
             "messages": [
-                {"role": "system", "content": self._strict_json_system_prompt(system_prompt)},
+                _system_message(system_prompt),
                 {"role": "user", "content": prompt},
             ],
             "format": "json",
-            "options": {"temperature": temperature},
+            "options": _ollama_options(temperature),
+            "stream": True,
         }
+        return orjson.dumps(payload)
+
+    @staticmethod
+    def _ollama_status_error(resp: httpx.Response, body: bytes) -> LLMError:
+        # Decode only the head of the body; error pages can be large.
+        head = body[:512].decode("utf-8", errors="replace")
+        message = f"Ollama returned status {resp.status_code}: {head}"
+        if _is_retryable_status(resp.status_code):
+            return _TransientLLMError(
+                message, retry_after=_parse_retry_after(resp.headers.get("retry-after"))
+            )
+        return LLMError(message)
+
+    def _with_retries(self, provider: str, call: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Run one provider call, retrying transient failures with backoff.
 
+        Only after retries (or the retry budget) are exhausted does the
+        error reach the caller (and, for the hybrid provider, trigger the
+        fallback).
+        """
+        deadline = time.monotonic() + _RETRY_BUDGET_SECONDS
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                return call()
+            except _TransientLLMError as exc:
+                delay = _backoff_or_raise(provider, attempt, exc, deadline)
+            time.sleep(delay)
+        raise AssertionError("unreachable")
+
+    async def _awith_retries(
+        self,
+        provider: str,
+        call: Callable[[], Awaitable[Dict[str, Any]]],
+    ) -> Dict[str, Any]:
+        deadline = time.monotonic() + _RETRY_BUDGET_SECONDS
+        for attempt in range(_RETRY_ATTEMPTS):
+            try:
+                return await call()
+            except _TransientLLMError as exc:
+                delay = _backoff_or_raise(provider, attempt, exc, deadline)
+            await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+    def _generate_with_ollama(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        return self._with_retries(
+            "ollama", lambda: self._ollama_once(prompt, system_prompt, temperature)
+        )
+
+    def _ollama_once(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
         try:
-            with httpx.Client(timeout=60.0) as client:
-                resp = client.post(url, json=payload)
+            with self._http_client().stream(
+                "POST",
+                self._ollama_chat_url,
+                content=self._ollama_payload(prompt, system_prompt, temperature),
+                headers=_JSON_HEADERS,
+            ) as resp:
+                if resp.status_code != 200:
+                    raise self._ollama_status_error(resp, resp.read())
+                content = self._collect_ollama_stream(resp.iter_lines())
+        except LLMError:
+            raise
+        except httpx.TimeoutException as exc:
+            raise _TransientLLMError("Ollama chat request timed out") from exc
         except Exception as exc:
             raise LLMError("Ollama chat request failed") from exc
 
-        if resp.status_code != 200:
-            raise LLMError(f"Ollama returned status {resp.status_code}: {resp.text[:300]}")
-
-        data = resp.json()
-        content = (data.get("message") or {}).get("content")
         return self._parse_json_content(content, "ollama")
 
-    def _generate_with_groq(
+    @staticmethod
+    def _collect_ollama_stream(lines: Iterable[str]) -> bytes:
+        collector = _OllamaStreamCollector()
+        for line in lines:
+            if collector.feed(line):
+                break
+        return collector.result()
+
+    def _groq_kwargs(
         self,
         prompt: str,
         system_prompt: Optional[str],
         temperature: float,
     ) -> Dict[str, Any]:
-        if OpenAI is None:
+        return {
+            "model": self.cfg.groq_model,
+            "temperature": temperature,
+            "response_format": {"type": "json_object"},
+            "messages": [
+                _system_message(system_prompt),
+                {"role": "user", "content": prompt},
+            ],
+        }
+
+    @staticmethod
+    def _groq_error(exc: Exception) -> LLMError:
+        """Classify an OpenAI SDK exception; the SDK's own retries are disabled."""
+        openai = _openai_module()
+        if openai is not None and isinstance(exc, openai.APITimeoutError):
+            return _TransientLLMError("Groq chat request timed out")
+        status_code = getattr(exc, "status_code", None)
+        if _is_retryable_status(status_code):
+            response = getattr(exc, "response", None)
+            retry_after = (
+                _parse_retry_after(response.headers.get("retry-after"))
+                if response is not None
+                else None
+            )
+            return _TransientLLMError(
+                f"Groq returned status {status_code}", retry_after=retry_after
+            )
+        return LLMError("Groq chat request failed")
+
+    def _groq_content(self, response: Any) -> Dict[str, Any]:
+        if not response.choices:
+            raise LLMError("Groq returned no choices")
+        content = response.choices[0].message.content
+        return self._parse_json_content(content, "groq")
+
+    def _openai_sdk(self) -> Any:
+        openai = _openai_module()
+        if openai is None:
             raise LLMError("openai package is not installed; cannot call Groq")
         if not self.cfg.groq_api_key:
             raise LLMError("COPILOT_GROQ_API_KEY is not set")
+        return openai
+
+    def _groq(self) -> Any:
+        """Build the Groq (OpenAI-compatible) client once and reuse its pool."""
+        client = self._groq_client
+        if client is not None:
+            return client
+
+        openai = self._openai_sdk()
+        with self._http_lock:
+            if self._groq_client is None:
+                self._groq_client = openai.OpenAI(
+                    api_key=self.cfg.groq_api_key,
+                    base_url=self.cfg.groq_base_url,
+                    max_retries=0,
+                    http_client=httpx.Client(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS),
+                )
+            return self._groq_client
+
+    def _generate_with_groq(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        client = self._groq()
+        kwargs = self._groq_kwargs(prompt, system_prompt, temperature)
+
+        def _once() -> Dict[str, Any]:
+            try:
+                response = client.chat.completions.create(**kwargs)
+            except Exception as exc:
+                raise self._groq_error(exc) from exc
+            return self._groq_content(response)
+
+        return self._with_retries("groq", _once)
 
-        client = OpenAI(
-            api_key=self.cfg.groq_api_key,
-            base_url=self.cfg.groq_base_url,
+    # Async providers
+
+    async def _agenerate_raw(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        if self.cfg.provider == "ollama":
+            return await self._agenerate_with_ollama(prompt, system_prompt, temperature)
+        if self.cfg.provider == "groq":
+            return await self._agenerate_with_groq(prompt, system_prompt, temperature)
+        if self.cfg.provider == "hybrid":
+            return await self._agenerate_hybrid(prompt, system_prompt, temperature)
+        raise LLMError(f"Unsupported LLM provider: {self.cfg.provider}")
+
+    async def _agenerate_hybrid(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        breaker = self._breakers[self.cfg.primary_provider]
+
+        if breaker.allow_request():
+            try:
+                if self.cfg.primary_provider == "ollama":
+                    result = await self._agenerate_with_ollama(prompt, system_prompt, temperature)
+                else:
+                    result = await self._agenerate_with_groq(prompt, system_prompt, temperature)
+            except LLMError as exc:
+                breaker.record_failure()
+                self._log_fallback(exc)
+            except BaseException:
+                # Cancelled (client went away) or crashed: not the provider's
+                # fault, but a half-open probe must not stay half-open forever.
+                breaker.record_interrupted()
+                raise
+            else:
+                breaker.record_success()
+                return result
+
+        if self.cfg.fallback_provider == "ollama":
+            return await self._agenerate_with_ollama(prompt, system_prompt, temperature)
+        return await self._agenerate_with_groq(prompt, system_prompt, temperature)
+
+    def _async_http_client(self) -> httpx.AsyncClient:
+        # Only touched from the owning loop's thread, so no lock is needed.
+        resources = self._aresources()
+        if resources.http is None:
+            resources.http = httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS)
+        return resources.http
+
+    async def _agenerate_with_ollama(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        return await self._awith_retries(
+            "ollama", lambda: self._aollama_once(prompt, system_prompt, temperature)
         )
+
+    async def _aollama_once(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        collector = _OllamaStreamCollector()
         try:
-            response = client.chat.completions.create(
-                model=self.cfg.groq_model,
-                temperature=temperature,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": self._strict_json_system_prompt(system_prompt)},
-                    {"role": "user", "content": prompt},
-                ],
-            )
+            async with self._async_http_client().stream(
+                "POST",
+                self._ollama_chat_url,
+                content=self._ollama_payload(prompt, system_prompt, temperature),
+                headers=_JSON_HEADERS,
+            ) as resp:
+                if resp.status_code != 200:
+                    raise self._ollama_status_error(resp, await resp.aread())
+                async for line in resp.aiter_lines():
+                    if collector.feed(line):
+                        break
+        except LLMError:
+            raise
+        except httpx.TimeoutException as exc:
+            raise _TransientLLMError("Ollama chat request timed out") from exc
         except Exception as exc:
-            raise LLMError("Groq chat request failed") from exc
+            raise LLMError("Ollama chat request failed") from exc
 
-        if not response.choices:
-            raise LLMError("Groq returned no choices")
-        content = response.choices[0].message.content
-        return self._parse_json_content(content, "groq")
+        return self._parse_json_content(collector.result(), "ollama")
+
+    def _async_groq(self) -> Any:
+        resources = self._aresources()
+        if resources.groq is None:
+            openai = self._openai_sdk()
+            resources.groq = openai.AsyncOpenAI(
+                api_key=self.cfg.groq_api_key,
+                base_url=self.cfg.groq_base_url,
+                max_retries=0,
+                http_client=httpx.AsyncClient(timeout=_HTTP_TIMEOUT, limits=_HTTP_LIMITS),
+            )
+        return resources.groq
+
+    async def _agenerate_with_groq(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+    ) -> Dict[str, Any]:
+        client = self._async_groq()
+        kwargs = self._groq_kwargs(prompt, system_prompt, temperature)
+
+        async def _once() -> Dict[str, Any]:
+            try:
+                response = await client.chat.completions.create(**kwargs)
+            except Exception as exc:
+                raise self._groq_error(exc) from exc
+            return self._groq_content(response)
+
+        return await self._awith_retries("groq", _once)
+
+
+_llm_client: Optional[LLMClient] = None
+_llm_client_lock = threading.Lock()
 
 
-@lru_cache()
 def get_llm_client() -> LLMClient:
-    llm_settings = settings.llm
-    logger.info(
-        "Initializing LLM client",
-        extra={
-            "provider": llm_settings.provider,
-            "primary_provider": llm_settings.primary_provider,
-            "fallback_provider": llm_settings.fallback_provider,
-            "model": llm_settings.model,
-        },
-    )
-    return LLMClient()
+    global _llm_client
+    client = _llm_client
+    if client is not None:
+        return client
+    with _llm_client_lock:
+        if _llm_client is None:
+            llm_settings = settings.llm
+            logger.info(
+                "Initializing LLM client",
+                extra={
+                    "provider": llm_settings.provider,
+                    "primary_provider": llm_settings.primary_provider,
+                    "fallback_provider": llm_settings.fallback_provider,
+                    "model": llm_settings.model,
+                },
+            )
+            _llm_client = LLMClient()
+            atexit.register(_llm_client.close)
+        return _llm_client
+
+
+async def aclose_llm_client() -> None:
+    """Close the shared client's connections for the running loop, if it exists."""
+    if _llm_client is not None:
+        await _llm_client.aclose()
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
-from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Tuple
 
 from .config import settings
 
@@ -46,7 +45,20 @@ def _resolve_version(agent: str, override: str | None) -> str:
     return "v1"
 
 
-@lru_cache(maxsize=32)
+def _warm_prompt_cache() -> Dict[str, Tuple[int, str]]:
+    """Read every prompt template once at import; keys are file stems."""
+    if not PROMPT_ROOT.is_dir():
+        return {}
+    return {
+        path.stem: (path.stat().st_mtime_ns, path.read_text(encoding="utf-8"))
+        for path in PROMPT_ROOT.glob("*.md")
+    }
+
+
+# {"{agent}_{version}": (file st_mtime_ns, template text)}
+_PROMPT_CACHE: Dict[str, Tuple[int, str]] = _warm_prompt_cache()
+
+
 def load_prompt(agent: str, version: str | None = None) -> str:
     """
     Load the prompt template for a given agent and version.
@@ -57,12 +69,22 @@ def load_prompt(agent: str, version: str | None = None) -> str:
     Examples:
         load_prompt("planner") -> prompts/planner_v1.md (by default)
         load_prompt("planner", "v2") -> prompts/planner_v2.md
-    """
-    resolved_version = _resolve_version(agent, version)
-    filename = f"{agent}_{resolved_version}.md"
-    path = PROMPT_ROOT / filename
-
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {path}")
 
-    return path.read_text(encoding="utf-8")
+    Templates are served from an in-memory cache warmed at import and keyed
+    on the file's mtime: each call costs one stat(), and an edited (or newly
+    added) file is re-read without restarting the process.
+    """
+    key = f"{agent}_{_resolve_version(agent, version)}"
+    path = PROMPT_ROOT / f"{key}.md"
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {path}") from None
+
+    cached = _PROMPT_CACHE.get(key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    text = path.read_text(encoding="utf-8")
+    _PROMPT_CACHE[key] = (mtime_ns, text)
+    return text
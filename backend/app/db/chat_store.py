@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 import sqlite3
+import threading
 import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Iterator, List, Optional
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import orjson
 
 
 CHAT_DB_PATH = Path("app_storage/chat_sessions.sqlite3")
@@ -33,22 +36,60 @@ class ChatMessage:
     metadata: Dict[str, object]
 
 
+@dataclass
+class NewChatMessage:
+    role: str
+    content: str
+    request_id: Optional[str] = None
+    metadata: Optional[Dict[str, object]] = None
+
+
+def _dump_metadata(metadata: Optional[Dict[str, object]]) -> str:
+    return orjson.dumps(metadata or {}, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
 def _ensure_parent_dir() -> None:
     CHAT_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
 
-@contextmanager
-def _connect() -> Iterator[sqlite3.Connection]:
+_conn: Optional[sqlite3.Connection] = None
+_conn_lock = threading.RLock()
+
+
+def _open_connection() -> sqlite3.Connection:
     _ensure_parent_dir()
-    conn = sqlite3.connect(str(CHAT_DB_PATH))
+    conn = sqlite3.connect(str(CHAT_DB_PATH), check_same_thread=False)
     conn.row_factory = sqlite3.Row
-    try:
-        yield conn
-    finally:
-        conn.close()
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA mmap_size=268435456")
+    return conn
 
 
-def init_chat_store() -> None:
+@contextmanager
+def _connect() -> Iterator[sqlite3.Connection]:
+    """
+    Yield the process-wide SQLite connection, serialized by a lock.
+
+    The connection is opened once (in WAL mode) instead of per call; the
+    lock is held for the whole block so multi-statement writes stay atomic.
+    """
+    global _conn
+
+    with _conn_lock:
+        if _conn is None:
+            _conn = _open_connection()
+        try:
+            yield _conn
+        except BaseException:
+            _conn.rollback()
+            raise
+
+
+@lru_cache(maxsize=1)
+def _ensure_initialized() -> bool:
+    """Create / migrate the chat schema once per process."""
     with _connect() as conn:
         conn.executescript(
             """
@@ -80,6 +121,15 @@ def init_chat_store() -> None:
                 PRIMARY KEY(session_id, fact_key),
                 FOREIGN KEY(session_id) REFERENCES chat_sessions(session_id)
             );
+
+            CREATE INDEX IF NOT EXISTS idx_messages_session_id
+                ON chat_messages(session_id, id);
+
+            CREATE INDEX IF NOT EXISTS idx_sessions_seller_updated
+                ON chat_sessions(seller_id, updated_at DESC);
+
+            CREATE INDEX IF NOT EXISTS idx_sessions_updated
+                ON chat_sessions(updated_at DESC);
             """
         )
         cols = {
@@ -88,7 +138,11 @@ def init_chat_store() -> None:
         }
         if "metadata_json" not in cols:
             conn.execute("ALTER TABLE chat_messages ADD COLUMN metadata_json TEXT")
-        conn.commit()
+    return True
+
+
+def init_chat_store() -> None:
+    _ensure_initialized()
 
 
 def create_session(
@@ -96,7 +150,7 @@ def create_session(
     seller_name: Optional[str] = None,
     title: Optional[str] = None,
 ) -> ChatSession:
-    init_chat_store()
+    _ensure_initialized()
     session_id = uuid.uuid4().hex
     session_title = title or "Seller chat"
     with _connect() as conn:
@@ -116,7 +170,7 @@ def ensure_session(
     seller_id: Optional[str] = None,
     seller_name: Optional[str] = None,
 ) -> ChatSession:
-    init_chat_store()
+    _ensure_initialized()
     existing = get_session(session_id)
     if existing is not None:
         if seller_name and seller_name != existing.seller_name:
@@ -150,7 +204,7 @@ def update_session_seller_name(session_id: str, seller_name: str) -> None:
 
 
 def get_session(session_id: str) -> Optional[ChatSession]:
-    init_chat_store()
+    _ensure_initialized()
     with _connect() as conn:
         row = conn.execute(
             """
@@ -173,7 +227,7 @@ def get_session(session_id: str) -> Optional[ChatSession]:
 
 
 def list_sessions(seller_id: Optional[str] = None, limit: int = 50) -> List[ChatSession]:
-    init_chat_store()
+    _ensure_initialized()
     with _connect() as conn:
         if seller_id:
             rows = conn.execute(
@@ -216,21 +270,24 @@ def add_message(
     request_id: Optional[str] = None,
     metadata: Optional[Dict[str, object]] = None,
 ) -> ChatMessage:
-    init_chat_store()
+    _ensure_initialized()
     with _connect() as conn:
-        cur = conn.execute(
+        # One transaction: INSERT ... RETURNING gives us id + created_at, so
+        # the message is built locally instead of re-read with get_message().
+        row = conn.execute(
             """
             INSERT INTO chat_messages(session_id, role, content, request_id, metadata_json)
             VALUES (?, ?, ?, ?, ?)
+            RETURNING id, created_at
             """,
             (
                 session_id,
                 role,
                 content,
                 request_id,
-                json.dumps(metadata or {}, ensure_ascii=True),
+                _dump_metadata(metadata),
             ),
-        )
+        ).fetchone()
         conn.execute(
             """
             UPDATE chat_sessions
@@ -240,23 +297,85 @@ def add_message(
             (session_id,),
         )
         conn.commit()
-        message_id = int(cur.lastrowid)
 
-    return get_message(message_id)
+    return ChatMessage(
+        id=int(row["id"]),
+        session_id=session_id,
+        role=role,
+        content=content,
+        created_at=row["created_at"],
+        request_id=request_id,
+        metadata=dict(metadata or {}),
+    )
 
 
-def get_message(message_id: int) -> ChatMessage:
+def add_messages(
+    session_id: str,
+    msgs: Sequence[NewChatMessage],
+) -> List[ChatMessage]:
+    """
+    Persist several messages of one turn in a single transaction.
+
+    One executemany + one session bump + one commit, instead of paying the
+    full add_message() round trip per message.
+    """
+    if not msgs:
+        return []
+    _ensure_initialized()
     with _connect() as conn:
-        row = conn.execute(
+        conn.executemany(
             """
-            SELECT id, session_id, role, content, created_at, request_id, metadata_json
+            INSERT INTO chat_messages(session_id, role, content, request_id, metadata_json)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    session_id,
+                    msg.role,
+                    msg.content,
+                    msg.request_id,
+                    _dump_metadata(msg.metadata),
+                )
+                for msg in msgs
+            ],
+        )
+        # executemany() discards RETURNING rows; the write lock is held until
+        # commit, so this session's newest len(msgs) rows are the ones above.
+        rows = conn.execute(
+            """
+            SELECT id, created_at
             FROM chat_messages
-            WHERE id = ?
+            WHERE session_id = ?
+            ORDER BY id DESC
+            LIMIT ?
             """,
-            (message_id,),
-        ).fetchone()
-    if row is None:
-        raise ValueError(f"Message not found: {message_id}")
+            (session_id, len(msgs)),
+        ).fetchall()
+        conn.execute(
+            """
+            UPDATE chat_sessions
+            SET updated_at = CURRENT_TIMESTAMP
+            WHERE session_id = ?
+            """,
+            (session_id,),
+        )
+        conn.commit()
+
+    return [
+        ChatMessage(
+            id=int(row["id"]),
+            session_id=session_id,
+            role=msg.role,
+            content=msg.content,
+            created_at=row["created_at"],
+            request_id=msg.request_id,
+            metadata=dict(msg.metadata or {}),
+        )
+        for msg, row in zip(msgs, reversed(rows))
+    ]
+
+
+def _row_to_message(row: sqlite3.Row) -> ChatMessage:
     return ChatMessage(
         id=int(row["id"]),
         session_id=row["session_id"],
@@ -265,15 +384,30 @@ def get_message(message_id: int) -> ChatMessage:
         created_at=row["created_at"],
         request_id=row["request_id"],
         metadata=(
-            json.loads(row["metadata_json"])
+            orjson.loads(row["metadata_json"])
             if row["metadata_json"]
             else {}
         ),
     )
 
 
+def get_message(message_id: int) -> ChatMessage:
+    with _connect() as conn:
+        row = conn.execute(
+            """
+            SELECT id, session_id, role, content, created_at, request_id, metadata_json
+            FROM chat_messages
+            WHERE id = ?
+            """,
+            (message_id,),
+        ).fetchone()
+    if row is None:
+        raise ValueError(f"Message not found: {message_id}")
+    return _row_to_message(row)
+
+
 def list_messages(session_id: str, limit: int = 100) -> List[ChatMessage]:
-    init_chat_store()
+    _ensure_initialized()
     with _connect() as conn:
         rows = conn.execute(
             """
@@ -285,36 +419,33 @@ def list_messages(session_id: str, limit: int = 100) -> List[ChatMessage]:
             """,
             (session_id, limit),
         ).fetchall()
-    return [
-        ChatMessage(
-            id=int(row["id"]),
-            session_id=row["session_id"],
-            role=row["role"],
-            content=row["content"],
-            created_at=row["created_at"],
-            request_id=row["request_id"],
-            metadata=(
-                json.loads(row["metadata_json"])
-                if row["metadata_json"]
-                else {}
-            ),
-        )
-        for row in rows
-    ]
+    return [_row_to_message(row) for row in rows]
+
+
+def _list_recent_messages(session_id: str, n: int) -> List[ChatMessage]:
+    """Newest ``n`` messages of a session, oldest first (tail index seek)."""
+    _ensure_initialized()
+    with _connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, session_id, role, content, created_at, request_id, metadata_json
+            FROM chat_messages
+            WHERE session_id = ?
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (session_id, n),
+        ).fetchall()
+    return [_row_to_message(row) for row in reversed(rows)]
 
 
 def get_recent_turns(session_id: str, limit_pairs: int = 3) -> List[str]:
-    messages = list_messages(session_id, limit=limit_pairs * 2 + 2)
-    if not messages:
-        return []
-    turns: List[str] = []
-    for msg in messages[-(limit_pairs * 2) :]:
-        turns.append(f"{msg.role}: {msg.content}")
-    return turns
+    messages = _list_recent_messages(session_id, n=limit_pairs * 2)
+    return [f"{msg.role}: {msg.content}" for msg in messages]
 
 
 def upsert_memory_fact(session_id: str, fact_key: str, fact_value: str) -> None:
-    init_chat_store()
+    _ensure_initialized()
     with _connect() as conn:
         conn.execute(
             """
@@ -339,7 +470,7 @@ def upsert_memory_fact(session_id: str, fact_key: str, fact_value: str) -> None:
 
 
 def get_memory_facts(session_id: str) -> Dict[str, str]:
-    init_chat_store()
+    _ensure_initialized()
     with _connect() as conn:
         rows = conn.execute(
             """
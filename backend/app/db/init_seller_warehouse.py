@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import csv
 from pathlib import Path
-from typing import Final
+from typing import Final, Optional, Tuple
 
-import pandas as pd
+import duckdb
 
 from ..core.config import settings
 from ..db.session import get_warehouse_connection
+from ..observability.logging import get_logger
+
+logger = get_logger("db.init_seller_warehouse")
 
 # Table names we expect in the warehouse.
 PRODUCTS_TABLE: Final[str] = "products"
@@ -14,26 +18,89 @@ COMPETITORS_TABLE: Final[str] = "competitors"
 INVENTORY_TABLE: Final[str] = "inventory"
 REVIEWS_TABLE: Final[str] = "reviews"
 SALES_HISTORY_TABLE: Final[str] = "sales_history"
+# Derived at load time: products with their total gross revenue.
+PRODUCT_REVENUE_TABLE: Final[str] = "product_revenue"
+
 
+def _csv_shape(path: Path) -> Tuple[int, bool]:
+    """Header width and whether the file has any data rows."""
+    with path.open(newline="", encoding="utf-8") as fh:
+        reader = csv.reader(fh)
+        header = next(reader, [])
+        has_rows = next(reader, None) is not None
+    return len(header), has_rows
 
-def _load_csv(path: Path) -> pd.DataFrame:
+
+def _load_csv_table(
+    conn,
+    table_name: str,
+    path: Path,
+    order_by: Optional[str] = None,
+) -> None:
     """
-    Read CSV resiliently for messy real-world seller exports.
+    (Re)create a table from CSV with DuckDB's native (parallel) reader.
+
+    Resilient to messy real-world seller exports: malformed rows are
+    skipped. Files whose dialect DuckDB cannot sniff (broken quoting that
+    collapses every row into one column, or rejects every row) fall back
+    to the lenient pandas parser.
+
+    `order_by` clusters the stored rows so DuckDB's per-row-group min/max
+    zone maps can skip row groups for selective filters.
     """
-    return pd.read_csv(
-        path,
-        engine="python",
-        on_bad_lines="skip",
-    )
+    order_clause = f"ORDER BY {order_by}" if order_by else ""
+    try:
+        conn.execute(
+            f"""
+            CREATE OR REPLACE TABLE {table_name} AS
+            SELECT * FROM read_csv_auto(?, header = true, ignore_errors = true)
+            {order_clause}
+            """,
+            [path.as_posix()],
+        )
+        width = len(conn.execute(f"SELECT * FROM {table_name} LIMIT 0").description)
+        (row_count,) = conn.execute(f"SELECT count(*) FROM {table_name}").fetchone()
+        expected_width, has_rows = _csv_shape(path)
+        if width == expected_width and (row_count > 0 or not has_rows):
+            return
+    except duckdb.InvalidInputException:
+        pass
 
+    logger.warning(
+        "DuckDB could not parse CSV; falling back to pandas",
+        extra={"table": table_name, "path": str(path)},
+    )
+    import pandas as pd
 
-def _write_table(conn, table_name: str, df: pd.DataFrame) -> None:
+    df = pd.read_csv(path, engine="python", on_bad_lines="skip")
     temp_name = f"_{table_name}_df"
     conn.register(temp_name, df)
-    conn.execute(f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM {temp_name}")
+    conn.execute(
+        f"CREATE OR REPLACE TABLE {table_name} AS SELECT * FROM {temp_name} {order_clause}"
+    )
     conn.unregister(temp_name)
 
 
+def _build_product_revenue(conn) -> None:
+    """
+    Precompute per-product revenue so the Product Selector's top-N lookup
+    does not re-aggregate sales_history on every request.
+    """
+    conn.execute(
+        f"""
+        CREATE OR REPLACE TABLE {PRODUCT_REVENUE_TABLE} AS
+        SELECT
+            p.*,
+            COALESCE(SUM(s.gross_revenue), 0.0) AS total_revenue
+        FROM {PRODUCTS_TABLE} p
+        LEFT JOIN {SALES_HISTORY_TABLE} s
+          ON p.product_id = s.product_id
+        GROUP BY ALL
+        ORDER BY total_revenue DESC, p.product_id
+        """
+    )
+
+
 def init_seller_warehouse() -> None:
     """
     Initialize and (re)load the seller warehouse from CSV files.
@@ -49,12 +116,15 @@ def init_seller_warehouse() -> None:
     reviews_csv = data_root / "reviews.csv"
     sales_history_csv = data_root / "sales_history.csv"
 
-    with get_warehouse_connection() as conn:
-        _write_table(conn, PRODUCTS_TABLE, _load_csv(products_csv))
-        _write_table(conn, COMPETITORS_TABLE, _load_csv(competitors_csv))
-        _write_table(conn, INVENTORY_TABLE, _load_csv(inventory_csv))
-        _write_table(conn, REVIEWS_TABLE, _load_csv(reviews_csv))
-        _write_table(conn, SALES_HISTORY_TABLE, _load_csv(sales_history_csv))
+    with get_warehouse_connection(read_only=False) as conn:
+        _load_csv_table(conn, PRODUCTS_TABLE, products_csv)
+        _load_csv_table(conn, COMPETITORS_TABLE, competitors_csv)
+        _load_csv_table(conn, INVENTORY_TABLE, inventory_csv)
+        _load_csv_table(conn, REVIEWS_TABLE, reviews_csv)
+        _load_csv_table(
+            conn, SALES_HISTORY_TABLE, sales_history_csv, order_by="product_id, date"
+        )
+        _build_product_revenue(conn)
 
 
 if __name__ == "__main__":
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import Iterable, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Type
 
+import duckdb
+import numpy as np
+from pydantic import BaseModel, TypeAdapter
+
+from ..observability.logging import get_logger
 from ..schemas.seller import (
     CompetitorRecord,
     InventoryRecord,
@@ -13,18 +19,201 @@ from ..schemas.seller import (
 from .init_seller_warehouse import (
     COMPETITORS_TABLE,
     INVENTORY_TABLE,
+    PRODUCT_REVENUE_TABLE,
     PRODUCTS_TABLE,
     REVIEWS_TABLE,
     SALES_HISTORY_TABLE,
 )
 from .session import get_warehouse_connection
 
+logger = get_logger("db.seller_repository")
+
+
+def _columns(model_cls: Type[BaseModel], alias: Optional[str] = None) -> str:
+    """
+    Projection list for a model's declared fields.
+
+    Only the columns pydantic will keep cross the DuckDB -> Python boundary.
+    """
+    prefix = f"{alias}." if alias else ""
+    return ", ".join(f'{prefix}"{name}"' for name in model_cls.model_fields)
+
+
+_PRODUCT_COLUMNS = _columns(Product)
+
+# Query text is built once at import rather than per call.
+_SQL_LIST_PRODUCTS = f"""
+    SELECT {_PRODUCT_COLUMNS}
+    FROM {PRODUCTS_TABLE}
+    LIMIT ?
+    OFFSET ?
+"""
+
+_SQL_GET_PRODUCT = f"""
+    SELECT {_PRODUCT_COLUMNS}
+    FROM {PRODUCTS_TABLE}
+    WHERE product_id = ?
+"""
+
+_SQL_LIST_COMPETITORS = f"""
+    SELECT {_columns(CompetitorRecord)}
+    FROM {COMPETITORS_TABLE}
+    WHERE product_id = ?
+"""
+
+_SQL_GET_INVENTORY = f"""
+    SELECT {_columns(InventoryRecord)}
+    FROM {INVENTORY_TABLE}
+    WHERE product_id = ?
+"""
+
+_SQL_LIST_REVIEWS = f"""
+    SELECT {_columns(ReviewRecord)}
+    FROM {REVIEWS_TABLE}
+    WHERE product_id = ?
+    ORDER BY date DESC
+    LIMIT ?
+"""
+
+_SQL_TOP_PRODUCTS_BY_REVENUE = f"""
+    SELECT {_PRODUCT_COLUMNS}
+    FROM {PRODUCT_REVENUE_TABLE}
+    ORDER BY total_revenue DESC, product_id
+    LIMIT ?
+"""
+
+# Used when the warehouse predates the product_revenue table.
+_SQL_TOP_PRODUCTS_BY_REVENUE_LIVE = f"""
+    SELECT {_columns(Product, alias="p")}
+    FROM {PRODUCTS_TABLE} p
+    LEFT JOIN {SALES_HISTORY_TABLE} s
+      ON p.product_id = s.product_id
+    GROUP BY ALL
+    ORDER BY COALESCE(SUM(s.gross_revenue), 0.0) DESC, p.product_id
+    LIMIT ?
+"""
+
+
+def _sales_history_sql(
+    with_start: bool, with_end: bool, bounded: bool, projection: str
+) -> str:
+    conditions = ["product_id = ?"]
+    # Older warehouses store date as VARCHAR; the cast lets DATE params bind.
+    if with_start:
+        conditions.append("CAST(date AS DATE) >= ?")
+    if with_end:
+        conditions.append("CAST(date AS DATE) <= ?")
+    where = " AND ".join(conditions)
+    if not bounded:
+        return f"""
+    SELECT {projection}
+    FROM {SALES_HISTORY_TABLE}
+    WHERE {where}
+    ORDER BY date, marketplace
+"""
+    # Keep the most recent `limit` rows, returned in ascending date order.
+    return f"""
+    SELECT *
+    FROM (
+        SELECT {projection}
+        FROM {SALES_HISTORY_TABLE}
+        WHERE {where}
+        ORDER BY date DESC, marketplace DESC
+        LIMIT ?
+    )
+    ORDER BY date, marketplace
+"""
+
+
+_SQL_LATEST_SALE_DATE = f"""
+    SELECT MAX(CAST(date AS DATE))
+    FROM {SALES_HISTORY_TABLE}
+    WHERE product_id = ?
+"""
+
+
+# Numeric sales columns cast to the SalesRecord types, for columnar reads.
+_SALES_METRIC_COLUMNS = """
+        CAST(date AS DATE) AS date, marketplace,
+        CAST(units_sold AS BIGINT) AS units_sold,
+        CAST(gross_revenue AS DOUBLE) AS gross_revenue,
+        CAST(returns AS BIGINT) AS returns,
+        CAST(ad_spend AS DOUBLE) AS ad_spend,
+        CAST(page_views AS BIGINT) AS page_views
+"""
+
+# One statement per (start bound, end bound, row limit) combination.
+_SQL_SALES_HISTORY: Dict[Tuple[bool, bool, bool], str] = {
+    (with_start, with_end, bounded): _sales_history_sql(
+        with_start, with_end, bounded, _columns(SalesRecord)
+    )
+    for with_start in (False, True)
+    for with_end in (False, True)
+    for bounded in (False, True)
+}
+_SQL_SALES_HISTORY_COLUMNS: Dict[Tuple[bool, bool, bool], str] = {
+    (with_start, with_end, bounded): _sales_history_sql(
+        with_start, with_end, bounded, _SALES_METRIC_COLUMNS
+    )
+    for with_start in (False, True)
+    for with_end in (False, True)
+    for bounded in (False, True)
+}
+
+
+def _sales_history_params(
+    product_id: str,
+    start_date: Optional[date],
+    end_date: Optional[date],
+    limit: Optional[int],
+) -> Tuple[Tuple[bool, bool, bool], List[object]]:
+    params: List[object] = [product_id]
+    if start_date is not None:
+        params.append(start_date)
+    if end_date is not None:
+        params.append(end_date)
+    if limit is not None:
+        # One extra row tells us whether the history was truncated.
+        params.append(limit + 1)
+    key = (start_date is not None, end_date is not None, limit is not None)
+    return key, params
+
+
+def _warn_truncated(product_id: str, limit: int) -> None:
+    logger.warning(
+        "Sales history truncated to the most recent rows",
+        extra={"product_id": product_id, "limit": limit},
+    )
+
+
+def _query_dicts(
+    conn: duckdb.DuckDBPyConnection,
+    sql: str,
+    params: Sequence[object],
+) -> List[Dict[str, Any]]:
+    """
+    Run a query and return its rows as plain dicts, skipping the pandas hop.
+    """
+    cursor = conn.execute(sql, params)
+    cols = [d[0] for d in cursor.description]
+    return [dict(zip(cols, row)) for row in cursor.fetchall()]
+
+
+@lru_cache(maxsize=32)
+def _list_adapter(model_cls: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[model_cls])  # type: ignore[valid-type]
+
 
 def _rows_to_models(rows: Iterable[dict], model_cls):
     """
     Helper to convert DuckDB result rows into Pydantic models.
+
+    The whole list is validated in one pydantic-core call; the list
+    adapter is built once per model class.
     """
-    return [model_cls.model_validate(row) for row in rows]
+    return _list_adapter(model_cls).validate_python(
+        rows if isinstance(rows, list) else list(rows)
+    )
 
 
 def list_products(limit: int = 100, offset: int = 0) -> List[Product]:
@@ -32,17 +221,13 @@ def list_products(limit: int = 100, offset: int = 0) -> List[Product]:
     Return a page of products from the warehouse.
     """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT *
-            FROM {PRODUCTS_TABLE}
-            LIMIT ?
-            OFFSET ?
-            """,
+        rows = _query_dicts(
+            conn,
+            _SQL_LIST_PRODUCTS,
             [limit, offset],
-        ).df()
+        )
 
-    return _rows_to_models(df.to_dict(orient="records"), Product)
+    return _rows_to_models(rows, Product)
 
 
 def get_product(product_id: str) -> Optional[Product]:
@@ -50,19 +235,16 @@ def get_product(product_id: str) -> Optional[Product]:
     Fetch a single product by product_id.
     """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT *
-            FROM {PRODUCTS_TABLE}
-            WHERE product_id = ?
-            """,
+        rows = _query_dicts(
+            conn,
+            _SQL_GET_PRODUCT,
             [product_id],
-        ).df()
+        )
 
-    if df.empty:
+    if not rows:
         return None
 
-    row = df.to_dict(orient="records")[0]
+    row = rows[0]
     return Product.model_validate(row)
 
 
@@ -71,16 +253,13 @@ def list_competitors(product_id: str) -> List[CompetitorRecord]:
     Return competitor records for a given product_id.
     """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT *
-            FROM {COMPETITORS_TABLE}
-            WHERE product_id = ?
-            """,
+        rows = _query_dicts(
+            conn,
+            _SQL_LIST_COMPETITORS,
             [product_id],
-        ).df()
+        )
 
-    return _rows_to_models(df.to_dict(orient="records"), CompetitorRecord)
+    return _rows_to_models(rows, CompetitorRecord)
 
 
 def get_inventory(product_id: str) -> Optional[InventoryRecord]:
@@ -88,19 +267,16 @@ def get_inventory(product_id: str) -> Optional[InventoryRecord]:
     Return inventory position for a given product_id, if any.
     """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT *
-            FROM {INVENTORY_TABLE}
-            WHERE product_id = ?
-            """,
+        rows = _query_dicts(
+            conn,
+            _SQL_GET_INVENTORY,
             [product_id],
-        ).df()
+        )
 
-    if df.empty:
+    if not rows:
         return None
 
-    row = df.to_dict(orient="records")[0]
+    row = rows[0]
     return InventoryRecord.model_validate(row)
 
 
@@ -109,53 +285,69 @@ def list_reviews(product_id: str, limit: int = 100) -> List[ReviewRecord]:
     Return recent reviews for a given product.
     """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT *
-            FROM {REVIEWS_TABLE}
-            WHERE product_id = ?
-            ORDER BY date DESC
-            LIMIT ?
-            """,
+        rows = _query_dicts(
+            conn,
+            _SQL_LIST_REVIEWS,
             [product_id, limit],
-        ).df()
+        )
 
-    return _rows_to_models(df.to_dict(orient="records"), ReviewRecord)
+    return _rows_to_models(rows, ReviewRecord)
 
 
 def list_sales_history(
     product_id: str,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
+    limit: Optional[int] = None,
 ) -> List[SalesRecord]:
     """
     Return sales history for a given product, optionally filtered by date range.
+
+    With a `limit`, only the most recent `limit` rows are returned (still in
+    ascending date order) and a warning is logged when older rows were cut.
     """
-    conditions = ["product_id = ?"]
-    params: List[object] = [product_id]
+    key, params = _sales_history_params(product_id, start_date, end_date, limit)
+    with get_warehouse_connection() as conn:
+        rows = _query_dicts(conn, _SQL_SALES_HISTORY[key], params)
 
-    if start_date is not None:
-        conditions.append("date >= ?")
-        params.append(start_date)
+    if limit is not None and len(rows) > limit:
+        _warn_truncated(product_id, limit)
+        rows = rows[len(rows) - limit :]
+    return _rows_to_models(rows, SalesRecord)
 
-    if end_date is not None:
-        conditions.append("date <= ?")
-        params.append(end_date)
 
-    where_clause = " AND ".join(conditions)
+def list_sales_history_columns(
+    product_id: str,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    limit: Optional[int] = None,
+) -> Dict[str, np.ndarray]:
+    """
+    Same rows as list_sales_history, as one numpy array per column.
+
+    For callers that aggregate: no per-row Python objects are created.
+    "date" is datetime64[D]; counts are int64 and money columns float64.
+    """
+    key, params = _sales_history_params(product_id, start_date, end_date, limit)
+    with get_warehouse_connection() as conn:
+        cols = conn.execute(_SQL_SALES_HISTORY_COLUMNS[key], params).fetchnumpy()
 
+    if limit is not None and len(cols["date"]) > limit:
+        _warn_truncated(product_id, limit)
+        cut = len(cols["date"]) - limit
+        cols = {name: values[cut:] for name, values in cols.items()}
+    cols["date"] = np.asarray(cols["date"]).astype("datetime64[D]")
+    return cols
+
+
+def get_latest_sale_date(product_id: str) -> Optional[date]:
+    """
+    Return the most recent sales_history date for a product, if any.
+    """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT *
-            FROM {SALES_HISTORY_TABLE}
-            WHERE {where_clause}
-            ORDER BY date
-            """,
-            params,
-        ).df()
+        row = conn.execute(_SQL_LATEST_SALE_DATE, [product_id]).fetchone()
 
-    return _rows_to_models(df.to_dict(orient="records"), SalesRecord)
+    return row[0] if row else None
 
 
 def list_top_products_by_revenue(limit: int = 50) -> List[Product]:
@@ -166,20 +358,9 @@ def list_top_products_by_revenue(limit: int = 50) -> List[Product]:
     to focus on for deeper analysis.
     """
     with get_warehouse_connection() as conn:
-        df = conn.execute(
-            f"""
-            SELECT
-                p.*,
-                COALESCE(SUM(s.gross_revenue), 0.0) AS total_revenue
-            FROM {PRODUCTS_TABLE} p
-            LEFT JOIN {SALES_HISTORY_TABLE} s
-              ON p.product_id = s.product_id
-            GROUP BY ALL
-            ORDER BY total_revenue DESC
-            LIMIT ?
-            """,
-            [limit],
-        ).df()
-
-    # We ignore total_revenue when constructing Product models.
-    return _rows_to_models(df.to_dict(orient="records"), Product)
+        try:
+            rows = _query_dicts(conn, _SQL_TOP_PRODUCTS_BY_REVENUE, [limit])
+        except duckdb.CatalogException:
+            rows = _query_dicts(conn, _SQL_TOP_PRODUCTS_BY_REVENUE_LIVE, [limit])
+
+    return _rows_to_models(rows, Product)
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import atexit
 import errno
+import queue
+import threading
 from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Iterator
+from typing import Iterator, Optional
 
 import duckdb
 
 from ..core.config import settings
 
 
+@lru_cache(maxsize=8)
 def _resolve_duckdb_path(raw_dsn: str) -> str:
     """
     Resolve DuckDB DSN/path into a concrete filesystem path understood by duckdb.connect.
@@ -19,6 +24,9 @@ def _resolve_duckdb_path(raw_dsn: str) -> str:
       - "/absolute/path.duckdb"
       - "relative/path.duckdb"
       - ":memory:"
+
+    Memoized per DSN: relative paths are resolved against the cwd at first
+    use, so don't chdir at runtime (call cache_clear() if you must).
     """
     if raw_dsn == ":memory:":
         return raw_dsn
@@ -48,17 +56,178 @@ def _resolve_duckdb_path(raw_dsn: str) -> str:
     return path.as_posix()
 
 
+_shared_conn: Optional[duckdb.DuckDBPyConnection] = None
+# Built alongside _shared_conn so settings.warehouse.pool_size is read when
+# the connection opens, not at import.
+_cursor_pool: Optional["queue.Queue[duckdb.DuckDBPyConnection]"] = None
+# Guards the shared connection's lifecycle. Readers are counted so a writer
+# (e.g. init_seller_warehouse) can wait for them, close the read-only handle
+# (DuckDB refuses a read-write open of a file already open read-only in the
+# same process) and let the next reader reopen it.
+_state = threading.Condition()
+_active_readers = 0
+_writer_active = False
+_atexit_registered = False
+
+
+def _open_shared_connection(db_path: str) -> duckdb.DuckDBPyConnection:
+    # Caller holds _state.
+    global _shared_conn, _cursor_pool, _atexit_registered
+
+    conn = duckdb.connect(db_path, read_only=True)
+    pool: "queue.Queue[duckdb.DuckDBPyConnection]" = queue.Queue(
+        maxsize=settings.warehouse.pool_size
+    )
+    # Pre-open the pooled cursors so the first requests skip setup.
+    for _ in range(pool.maxsize):
+        pool.put_nowait(conn.cursor())
+    if not _atexit_registered:
+        atexit.register(_close_shared_connection)
+        _atexit_registered = True
+    _shared_conn = conn
+    _cursor_pool = pool
+    return conn
+
+
+def _close_shared_connection() -> None:
+    # Caller holds _state (or the process is exiting).
+    global _shared_conn, _cursor_pool
+
+    pool, _cursor_pool = _cursor_pool, None
+    while pool is not None:
+        try:
+            pool.get_nowait().close()
+        except queue.Empty:
+            break
+    if _shared_conn is not None:
+        _shared_conn.close()
+        _shared_conn = None
+
+
+def _begin_read(db_path: str) -> Optional[duckdb.DuckDBPyConnection]:
+    """
+    Register a reader and return the shared read-only connection.
+
+    Returns None when the file does not exist yet (or for ":memory:"): a
+    read-only open would fail, so the caller uses a throwaway in-memory
+    connection instead.
+    """
+    global _active_readers
+
+    with _state:
+        while _writer_active:
+            _state.wait()
+        conn = _shared_conn
+        if conn is None:
+            if db_path == ":memory:" or not Path(db_path).exists():
+                return None
+            conn = _open_shared_connection(db_path)
+        _active_readers += 1
+        return conn
+
+
+def _end_read() -> None:
+    global _active_readers
+
+    with _state:
+        _active_readers -= 1
+        if _active_readers == 0:
+            _state.notify_all()
+
+
+def _acquire_cursor(conn: duckdb.DuckDBPyConnection) -> duckdb.DuckDBPyConnection:
+    # Registered readers keep the pool alive: writers wait for them to finish.
+    try:
+        return _cursor_pool.get_nowait()
+    except queue.Empty:
+        # Pool drained by concurrent readers: never block, just open one more.
+        return conn.cursor()
+
+
+def _release_cursor(cursor: duckdb.DuckDBPyConnection) -> None:
+    try:
+        _cursor_pool.put_nowait(cursor)
+    except queue.Full:
+        cursor.close()
+
+
 @contextmanager
-def get_warehouse_connection() -> Iterator[duckdb.DuckDBPyConnection]:
+def _exclusive_writer() -> Iterator[None]:
+    """
+    Wait out active readers, then drop the shared read-only connection for
+    the duration of a write; readers arriving meanwhile wait for it.
+    """
+    global _writer_active
+
+    with _state:
+        while _writer_active or _active_readers:
+            _state.wait()
+        _writer_active = True
+        _close_shared_connection()
+    try:
+        yield
+    finally:
+        with _state:
+            _writer_active = False
+            _state.notify_all()
+
+
+@contextmanager
+def get_warehouse_connection(
+    read_only: bool = True,
+    isolated: bool = False,
+) -> Iterator[duckdb.DuckDBPyConnection]:
     """
     Context manager for the seller warehouse connection.
 
     The DSN comes from settings.warehouse.seller_warehouse_dsn and can be
     switched to Postgres/Snowflake/etc. later without changing call sites.
+
+    Reads borrow a cursor on the shared read-only connection (DuckDB
+    cursors are safe to use from separate threads) from a small pool of
+    settings.warehouse.pool_size idle cursors; writers such as the offline
+    ETL get a dedicated read-write connection. A writer closes the shared
+    connection first (after in-flight reads finish) and the next read
+    reopens it, so re-initialising the warehouse in a running process works.
+    If the warehouse file does not exist yet, reads get an empty in-memory
+    database (queries raise CatalogException) and the file is not created.
+
+    Temp tables and SET options live per cursor, and pooled cursors are
+    reused by later callers. Pass isolated=True to get a fresh cursor that
+    is closed on exit instead (still no file open or catalog reload).
     """
     db_path = _resolve_duckdb_path(settings.warehouse.seller_warehouse_dsn)
-    conn = duckdb.connect(db_path)
+
+    if not read_only:
+        with _exclusive_writer():
+            conn = duckdb.connect(db_path)
+            try:
+                yield conn
+            finally:
+                conn.close()
+        return
+
+    shared = _begin_read(db_path)
+    if shared is None:
+        conn = duckdb.connect(":memory:")
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
     try:
-        yield conn
+        if isolated:
+            cursor = shared.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+        else:
+            cursor = _acquire_cursor(shared)
+            try:
+                yield cursor
+            finally:
+                _release_cursor(cursor)
     finally:
-        conn.close()
+        _end_read()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .agents.graph import get_copilot_graph
 from .api.router import router as api_router
 from .core.config import settings
+from .core.llm import aclose_llm_client
 from .db.chat_store import init_chat_store
 from .observability import otel
 from .observability.logging import setup_logging
@@ -12,11 +17,19 @@ from .observability.metrics import MetricsMiddleware, metrics_router
 from .observability.middleware import TraceLoggingMiddleware
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    # Async LLM clients belong to the server's event loop; close them with it.
+    await aclose_llm_client()
+
+
 def create_app() -> FastAPI:
     """
     Application factory.
 
     - Sets up JSON logging with trace/span IDs
+    - Compiles the copilot graph once per process
     - Configures OpenTelemetry tracing
     - Attaches HTTP middlewares (CORS, tracing logs, metrics)
     - Registers versioned API routes and metrics endpoint
@@ -24,6 +37,8 @@ def create_app() -> FastAPI:
     # Configure logging
     setup_logging()
     init_chat_store()
+    # Compile the LangGraph once per process, before the first request.
+    get_copilot_graph()
 
     app = FastAPI(
         title=settings.app.name,
@@ -31,6 +46,7 @@ def create_app() -> FastAPI:
         openapi_url="/api/v1/openapi.json",
         docs_url="/api/docs",
         redoc_url="/api/redoc",
+        lifespan=_lifespan,
     )
 
     # Observability: tracing via OTLP to Alloy -> Tempo
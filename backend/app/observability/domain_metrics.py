@@ -8,8 +8,12 @@ copilot_requests_total = Counter(
     ["mode"],
 )
 
+# Analyze runs LLM calls, so its buckets cover seconds rather than millis.
+_ANALYZE_LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
 copilot_request_latency_seconds = Histogram(
     "copilot_request_latency_seconds",
     "Latency of copilot analyze requests in seconds",
     ["mode"],
+    buckets=_ANALYZE_LATENCY_BUCKETS,
 )
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import functools
+import inspect
 import os
+import threading
 from typing import Any, Callable, Optional
 
 from ..core.config import settings
@@ -12,7 +15,19 @@ except Exception:  # pragma: no cover - optional dependency
     Client = None  # type: ignore[assignment]
     traceable = None  # type: ignore[assignment]
 
+_PROJECT_NAME = settings.llm_obs.langsmith_project or "marketplace-copilot"
+
 _langsmith_client: Optional["Client"] = None
+_langsmith_client_lock = threading.Lock()
+
+
+def _tracing_configured() -> bool:
+    return (
+        Client is not None
+        and traceable is not None
+        and bool(settings.llm_obs.tracing_v2)
+        and bool(settings.llm_obs.langsmith_api_key)
+    )
 
 
 def get_langsmith_client() -> Optional["Client"]:
@@ -21,28 +36,22 @@ def get_langsmith_client() -> Optional["Client"]:
     """
     global _langsmith_client
 
-    if Client is None:
-        return None
-
     if _langsmith_client is not None:
         return _langsmith_client
 
-    if not settings.llm_obs.tracing_v2:
+    if not _tracing_configured():
         return None
 
-    if not settings.llm_obs.langsmith_api_key:
-        return None
+    with _langsmith_client_lock:
+        if _langsmith_client is None:
+            # Ensure LangSmith runtime env aligns with app settings.
+            os.environ["LANGSMITH_TRACING"] = "true"
+            os.environ["LANGSMITH_PROJECT"] = _PROJECT_NAME
+            os.environ["LANGSMITH_API_KEY"] = settings.llm_obs.langsmith_api_key
 
-    # Ensure LangSmith runtime env aligns with app settings.
-    os.environ["LANGSMITH_TRACING"] = "true"
-    os.environ["LANGSMITH_PROJECT"] = (
-        settings.llm_obs.langsmith_project or "marketplace-copilot"
-    )
-    os.environ["LANGSMITH_API_KEY"] = settings.llm_obs.langsmith_api_key
-
-    _langsmith_client = Client(
-        api_key=settings.llm_obs.langsmith_api_key,
-    )
+            _langsmith_client = Client(
+                api_key=settings.llm_obs.langsmith_api_key,
+            )
     return _langsmith_client
 
 
@@ -53,17 +62,48 @@ def traceable_node(name: str) -> Callable[..., Any]:
     Usage:
         @traceable_node("planner_agent")
         def run_planner(...): ...
+
+    The LangSmith client is created on the first call of a decorated
+    function, not at import/decoration time.
     """
-    client = get_langsmith_client()
-    if client is None or traceable is None:
+    if not _tracing_configured():
         # Fallback: no-op decorator if LangSmith is not configured.
         def noop_decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             return func
 
         return noop_decorator
 
-    return traceable(
-        name=name,
-        client=client,
-        project_name=settings.llm_obs.langsmith_project or "marketplace-copilot",
-    )
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        traced: Optional[Callable[..., Any]] = None
+
+        def resolve() -> Callable[..., Any]:
+            nonlocal traced
+            if traced is None:
+                client = get_langsmith_client()
+                traced = (
+                    func
+                    if client is None
+                    else traceable(
+                        name=name,
+                        client=client,
+                        project_name=_PROJECT_NAME,
+                    )(func)
+                )
+            return traced
+
+        # Keep coroutine functions awaitable; LangGraph inspects node types.
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                return await resolve()(*args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return resolve()(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
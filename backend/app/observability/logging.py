@@ -1,14 +1,23 @@
 from __future__ import annotations
 
-import json
 import logging
 import sys
-from typing import Any, Dict, Optional
+from contextvars import ContextVar
+from typing import Any, Dict, Optional, Tuple
 
+import orjson
 from opentelemetry.trace import get_current_span
 
 from ..core.config import settings
 
+_TIME_FMT = "%Y-%m-%dT%H:%M:%S%z"
+_EXTRA_KEYS = ("path", "method", "status_code", "mode")
+
+# (trace_id, span_id, trace_hex, span_hex) of the last span seen in this context.
+_trace_hex_cv: ContextVar[Optional[Tuple[int, int, str, str]]] = ContextVar(
+    "trace_hex", default=None
+)
+
 
 class JsonFormatter(logging.Formatter):
     """
@@ -20,12 +29,12 @@ class JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         log_record: Dict[str, Any] = {
             "level": record.levelname,
-            "time": self.formatTime(record, "%Y-%m-%dT%H:%M:%S%z"),
+            "time": self.formatTime(record, _TIME_FMT),
             "logger": record.name,
             "message": record.getMessage(),
         }
 
-        for key in ("path", "method", "status_code", "mode"):
+        for key in _EXTRA_KEYS:
             value = getattr(record, key, None)
             if value is not None:
                 log_record[key] = value
@@ -42,7 +51,7 @@ class JsonFormatter(logging.Formatter):
 
     @staticmethod
     def _to_json_line(payload: Dict[str, Any]) -> str:
-        return json.dumps(payload, separators=(",", ":"))
+        return orjson.dumps(payload, default=str).decode("utf-8")
 
 
 def _install_log_record_factory() -> None:
@@ -58,8 +67,22 @@ def _install_log_record_factory() -> None:
         ctx = span.get_span_context() if span is not None else None
 
         if ctx is not None and ctx.is_valid:
-            record.trace_id = f"{ctx.trace_id:032x}"
-            record.span_id = f"{ctx.span_id:016x}"
+            # Spans usually emit several log lines; format their ids once.
+            cached = _trace_hex_cv.get()
+            if (
+                cached is None
+                or cached[0] != ctx.trace_id
+                or cached[1] != ctx.span_id
+            ):
+                cached = (
+                    ctx.trace_id,
+                    ctx.span_id,
+                    f"{ctx.trace_id:032x}",
+                    f"{ctx.span_id:016x}",
+                )
+                _trace_hex_cv.set(cached)
+            record.trace_id = cached[2]
+            record.span_id = cached[3]
         else:
             record.trace_id = None
             record.span_id = None
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import asyncio
 import time
-from typing import Awaitable, Callable
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Request, Response
+from fastapi import APIRouter, Response
 from prometheus_client import CONTENT_TYPE_LATEST, Counter, Histogram, generate_latest
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 REQUEST_COUNTER = Counter(
     "copilot_http_requests_total",
@@ -13,51 +14,104 @@ REQUEST_COUNTER = Counter(
     ["method", "path", "status_code"],
 )
 
+# Fewer buckets than the prometheus_client default; 0.5s and 1s must stay
+# bucket edges for the p95/p99 latency alerts.
+_HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
 REQUEST_LATENCY = Histogram(
     "copilot_http_request_latency_seconds",
     "Latency of HTTP requests in seconds",
     ["method", "path"],
+    buckets=_HTTP_LATENCY_BUCKETS,
 )
 
+# Upper bound on cached label children, in case paths are not normalized.
+_LABEL_CACHE_MAX = 10_000
+
 
-class MetricsMiddleware(BaseHTTPMiddleware):
+class MetricsMiddleware:
     """
     Middleware that tracks basic HTTP metrics.
+
+    Implemented as plain ASGI (no BaseHTTPMiddleware task group / streams);
+    the status code is captured from the response start message.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        start = time.perf_counter()
-        response = await call_next(request)
-        latency = time.perf_counter() - start
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # Bound label children, so hot endpoints skip labels() lookups.
+        self._counter_cache: Dict[Tuple[str, str, Optional[int]], Any] = {}
+        self._hist_cache: Dict[Tuple[str, str], Any] = {}
 
-        path = request.url.path
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Scrapes aren't worth timing; skip all instrumentation up front.
+        if scope["type"] != "http" or scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
 
-        if path != "/metrics":
-            REQUEST_COUNTER.labels(
-                method=request.method,
-                path=path,
-                status_code=response.status_code,
-            ).inc()
+        status_code: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-            REQUEST_LATENCY.labels(
-                method=request.method,
+        start = time.monotonic_ns()
+        await self.app(scope, receive, send_wrapper)
+        latency = (time.monotonic_ns() - start) / 1_000_000_000
+
+        # Label by the matched route template (e.g. /sessions/{session_id}),
+        # not the raw path, so label cardinality stays O(routes).
+        path = getattr(scope.get("route"), "path", scope["path"])
+        method = scope["method"]
+        counter_key = (method, path, status_code)
+        counter = self._counter_cache.get(counter_key)
+        if counter is None:
+            counter = REQUEST_COUNTER.labels(
+                method=method,
                 path=path,
-            ).observe(latency)
+                status_code=status_code,
+            )
+            if len(self._counter_cache) < _LABEL_CACHE_MAX:
+                self._counter_cache[counter_key] = counter
+        counter.inc()
 
-        return response
+        hist_key = (method, path)
+        hist = self._hist_cache.get(hist_key)
+        if hist is None:
+            hist = REQUEST_LATENCY.labels(
+                method=method,
+                path=path,
+            )
+            if len(self._hist_cache) < _LABEL_CACHE_MAX:
+                self._hist_cache[hist_key] = hist
+        hist.observe(latency)
 
 
 metrics_router = APIRouter(tags=["metrics"])
 
+# Serialized exposition, reused by scrapes within the TTL.
+_METRICS_TTL_SECONDS = 2.0
+_metrics_cache: Optional[Tuple[float, bytes]] = None
+_metrics_lock = asyncio.Lock()
+
 
 @metrics_router.get("/metrics")
 async def metrics() -> Response:
     """
     Prometheus metrics endpoint.
+
+    Scrapes arriving within _METRICS_TTL_SECONDS share one serialization.
     """
-    data: bytes = generate_latest()
+    global _metrics_cache
+
+    cached = _metrics_cache
+    if cached is None or time.monotonic() - cached[0] >= _METRICS_TTL_SECONDS:
+        async with _metrics_lock:
+            cached = _metrics_cache
+            if cached is None or time.monotonic() - cached[0] >= _METRICS_TTL_SECONDS:
+                cached = (time.monotonic(), generate_latest())
+                _metrics_cache = cached
+    data: bytes = cached[1]
     return Response(content=data, media_type=CONTENT_TYPE_LATEST)
@@ -1,35 +1,45 @@
 from __future__ import annotations
 
 import logging
-from typing import Awaitable, Callable
+from typing import Any, MutableMapping, Optional
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 logger = logging.getLogger("request")
 
 
-class TraceLoggingMiddleware(BaseHTTPMiddleware):
+class TraceLoggingMiddleware:
     """
     Logs each request with trace_id/span_id injected by the logging factory.
+
+    Plain ASGI middleware: unlike BaseHTTPMiddleware it adds no task group or
+    memory streams per request; the status code is read off the response
+    start message.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:  # type: ignore[override]
-        logger.info(
-            "Incoming request",
-            extra={"path": request.url.path, "method": request.method},
-        )
-        response = await call_next(request)
-        logger.info(
-            "Completed request",
-            extra={
-                "path": request.url.path,
-                "method": request.method,
-                "status_code": response.status_code,
-            },
-        )
-        return response
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
+
+        log_extra: MutableMapping[str, Any] = {
+            "path": scope["path"],
+            "method": scope["method"],
+        }
+        logger.info("Incoming request", extra=log_extra)
+
+        status_code: Optional[int] = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        # extra is copied onto the LogRecord, so the dict can be reused.
+        log_extra["status_code"] = status_code
+        logger.info("Completed request", extra=log_extra)
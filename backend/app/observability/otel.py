@@ -1,15 +1,76 @@
 from __future__ import annotations
 
+import logging
+import threading
+import time
+from typing import Sequence
+
 from fastapi import FastAPI
+from grpc import Compression
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider
+from opentelemetry.sdk.trace.export import (
+    BatchSpanProcessor,
+    SpanExporter,
+    SpanExportResult,
+)
 
 from ..core.config import settings
 
+logger = logging.getLogger("observability.otel")
+
+_BREAKER_FAILURE_THRESHOLD = 5
+_BREAKER_COOLDOWN_SECONDS = 30.0
+
+
+class _CircuitBreakingSpanExporter(SpanExporter):
+    """
+    Wraps an exporter so an unreachable collector can't wedge the batch worker.
+
+    After a run of consecutive failures, exports fail immediately for a
+    cool-down window (the batch is dropped) instead of waiting on the
+    network; one warning is logged per window.
+    """
+
+    def __init__(self, exporter: SpanExporter) -> None:
+        self._exporter = exporter
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._open_until = 0.0
+
+    def export(self, spans: Sequence[ReadableSpan]) -> SpanExportResult:
+        if time.monotonic() < self._open_until:
+            return SpanExportResult.FAILURE
+
+        try:
+            result = self._exporter.export(spans)
+        except Exception:
+            result = SpanExportResult.FAILURE
+
+        with self._lock:
+            if result is SpanExportResult.SUCCESS:
+                self._failures = 0
+                return result
+
+            self._failures += 1
+            if self._failures >= _BREAKER_FAILURE_THRESHOLD:
+                self._failures = 0
+                self._open_until = time.monotonic() + _BREAKER_COOLDOWN_SECONDS
+                logger.warning(
+                    "OTLP export failing; dropping spans for %.0fs",
+                    _BREAKER_COOLDOWN_SECONDS,
+                )
+        return result
+
+    def shutdown(self) -> None:
+        self._exporter.shutdown()
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return self._exporter.force_flush(timeout_millis)
+
 
 def init_otel(app: FastAPI) -> None:
     """
@@ -28,12 +89,22 @@ def init_otel(app: FastAPI) -> None:
     tracer_provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(tracer_provider)
 
+    otel_settings = settings.otel
+    # One deadline for both the OTLP call and the batch processor's export.
     span_exporter = OTLPSpanExporter(
-        endpoint=settings.otel.exporter_otlp_endpoint,
+        endpoint=otel_settings.exporter_otlp_endpoint,
         insecure=True,
+        compression=Compression.Gzip,
+        timeout=otel_settings.export_timeout_millis / 1000,
     )
 
-    span_processor = BatchSpanProcessor(span_exporter)
+    span_processor = BatchSpanProcessor(
+        _CircuitBreakingSpanExporter(span_exporter),
+        max_queue_size=otel_settings.max_queue_size,
+        max_export_batch_size=otel_settings.max_export_batch_size,
+        schedule_delay_millis=otel_settings.schedule_delay_millis,
+        export_timeout_millis=otel_settings.export_timeout_millis,
+    )
     tracer_provider.add_span_processor(span_processor)
 
     # Instrument FastAPI + Uvicorn
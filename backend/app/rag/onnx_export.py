@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from ..core.config import settings
+
+_DEFAULT_OUTPUT_DIR = Path("data/rag/embedder_onnx")
+
+
+def export_quantized_embedder(
+    output_dir: Path | None = None,
+    quantization: str = "avx512_vnni",
+) -> Path:
+    """
+    Offline export of the query embedder to ONNX with dynamic int8 quantization.
+
+    - Exports settings.llm.embed_model to ONNX (graph optimizations are applied
+      by ONNX Runtime at session creation)
+    - Writes a dynamically quantized copy, onnx/model_qint8_<quantization>.onnx
+    - Saves tokenizer + pooling config next to it so the directory is loadable
+      as a regular SentenceTransformer model
+
+    Point the API at the result with:
+
+        COPILOT_EMBED_MODEL=<output_dir>
+        COPILOT_EMBED_BACKEND=onnx
+        COPILOT_EMBED_ONNX_FILE=onnx/model_qint8_<quantization>.onnx
+
+    Requires the optional extra: pip install "sentence-transformers[onnx]".
+    This function is NOT used at request time.
+    """
+    from sentence_transformers import (
+        SentenceTransformer,
+        export_dynamic_quantized_onnx_model,
+    )
+
+    if output_dir is None:
+        output_dir = _DEFAULT_OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    model = SentenceTransformer(settings.llm.embed_model, backend="onnx")
+    model.save_pretrained(str(output_dir))
+    export_dynamic_quantized_onnx_model(
+        model,
+        quantization_config=quantization,
+        model_name_or_path=str(output_dir),
+    )
+    return output_dir
+
+
+if __name__ == "__main__":
+    out = Path(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(export_quantized_embedder(out))
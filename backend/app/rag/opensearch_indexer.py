@@ -3,18 +3,38 @@ from __future__ import annotations
 import json
 import time
 from pathlib import Path
-from typing import Dict, List
-
-from opensearchpy import OpenSearch, helpers
-from sentence_transformers import SentenceTransformer
+from typing import TYPE_CHECKING, Dict, Iterator, List
 
 from ..core.config import settings
 from ..observability.logging import get_logger
 
+if TYPE_CHECKING:
+    from opensearchpy import OpenSearch
+
 logger = get_logger("rag.opensearch_indexer")
 
+_ENCODE_BATCH_SIZE = 64
+_BULK_CHUNK_SIZE = 500
+
+
+def _iter_chunk_groups(chunks_path: Path, size: int) -> Iterator[List[Dict]]:
+    group: List[Dict] = []
+    with chunks_path.open("r", encoding="utf-8") as f:
+        for line in f:
+            raw = line.strip()
+            if not raw:
+                continue
+            group.append(json.loads(raw))
+            if len(group) >= size:
+                yield group
+                group = []
+    if group:
+        yield group
+
 
 def _new_client() -> OpenSearch:
+    from opensearchpy import OpenSearch
+
     return OpenSearch(
         hosts=[settings.rag.opensearch_url],
         use_ssl=False,
@@ -38,12 +58,46 @@ def _mapping(dims: int) -> Dict:
                 "marketplace": {"type": "keyword"},
                 "section": {"type": "keyword"},
                 "source": {"type": "keyword"},
-                "embedding": {"type": "knn_vector", "dimension": dims},
+                "embedding": {
+                    "type": "knn_vector",
+                    "dimension": dims,
+                    # HNSW on faiss with fp16 scalar quantization: half the
+                    # vector memory/bandwidth; queries stay float32.
+                    "method": {
+                        "name": "hnsw",
+                        "engine": "faiss",
+                        "space_type": "l2",
+                        "parameters": {
+                            "encoder": {
+                                "name": "sq",
+                                "parameters": {"type": "fp16"},
+                            }
+                        },
+                    },
+                },
             }
         },
     }
 
 
+def _hybrid_pipeline() -> Dict:
+    # Min-max normalize the lexical and k-NN sub-query scores, then average.
+    return {
+        "description": "Marketplace copilot hybrid (BM25 + k-NN) retrieval",
+        "phase_results_processors": [
+            {
+                "normalization-processor": {
+                    "normalization": {"technique": "min_max"},
+                    "combination": {
+                        "technique": "arithmetic_mean",
+                        "parameters": {"weights": [0.5, 0.5]},
+                    },
+                }
+            }
+        ],
+    }
+
+
 def seed_opensearch_index(chunks_path: Path | None = None) -> None:
     if chunks_path is None:
         chunks_path = Path("data/rag/index/chunks.jsonl")
@@ -53,6 +107,10 @@ def seed_opensearch_index(chunks_path: Path | None = None) -> None:
             f"RAG chunks file not found: {chunks_path}. Run `index_builder` first."
         )
 
+    # Imported here so loading this module doesn't pull in torch.
+    from opensearchpy import helpers
+    from sentence_transformers import SentenceTransformer
+
     client = _new_client()
     index = settings.rag.opensearch_index
     try:
@@ -84,37 +142,46 @@ def seed_opensearch_index(chunks_path: Path | None = None) -> None:
     if client.indices.exists(index=index):
         client.indices.delete(index=index)
     client.indices.create(index=index, body=_mapping(dims))
+    client.search_pipeline.put(
+        id=settings.rag.opensearch_hybrid_pipeline,
+        body=_hybrid_pipeline(),
+    )
 
-    actions: List[Dict] = []
-    with chunks_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            raw = line.strip()
-            if not raw:
-                continue
-            chunk = json.loads(raw)
-            source_doc = {
-                "id": chunk.get("id"),
-                "text": chunk.get("text", ""),
-                "marketplace": chunk.get("marketplace"),
-                "section": chunk.get("section"),
-                "source": chunk.get("source"),
-                "embedding": embedder.encode(chunk.get("text", "")).tolist(),
-            }
-
-            actions.append(
-                {
+    def gen_actions() -> Iterator[Dict]:
+        # Embed and yield one group at a time so memory stays O(group).
+        for group in _iter_chunk_groups(chunks_path, _BULK_CHUNK_SIZE):
+            embeddings = embedder.encode(
+                [chunk.get("text", "") for chunk in group],
+                batch_size=_ENCODE_BATCH_SIZE,
+                convert_to_numpy=True,
+                show_progress_bar=False,
+            )
+            for chunk, embedding in zip(group, embeddings):
+                yield {
                     "_index": index,
                     "_id": chunk["id"],
-                    "_source": source_doc,
+                    "_source": {
+                        "id": chunk.get("id"),
+                        "text": chunk.get("text", ""),
+                        "marketplace": chunk.get("marketplace"),
+                        "section": chunk.get("section"),
+                        "source": chunk.get("source"),
+                        "embedding": embedding.tolist(),
+                    },
                 }
-            )
 
-    if actions:
-        helpers.bulk(client, actions, refresh=True)
+    num_chunks, _ = helpers.bulk(
+        client,
+        gen_actions(),
+        chunk_size=_BULK_CHUNK_SIZE,
+        request_timeout=60,
+        refresh=False,
+    )
+    client.indices.refresh(index=index)
 
     logger.info(
         "OpenSearch seed complete",
-        extra={"index": index, "num_chunks": len(actions)},
+        extra={"index": index, "num_chunks": num_chunks},
     )
 
 
@@ -1,20 +1,65 @@
 from __future__ import annotations
 
 import asyncio
-import math
-from functools import lru_cache
+import atexit
+import contextvars
+import heapq
+import logging
+import re
+import threading
+import time
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
-
-from opensearchpy import OpenSearch
-from sentence_transformers import SentenceTransformer
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+import numpy as np
+import orjson
 
 from ..core.config import settings
 from ..observability.logging import get_logger
 from ..schemas.rag import RAGChunk
+from .index_builder import RAGConfig, load_rag_config
+
+if TYPE_CHECKING:
+    # Heavy (sentence_transformers pulls in torch); imported on first use.
+    from opensearchpy import OpenSearch
+    from sentence_transformers import SentenceTransformer
 
 logger = get_logger("rag.store")
 
+_T = TypeVar("_T")
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+# BM25 parameters; OpenSearch's defaults, so both backends rank lexically alike.
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_RAG_CONFIG_PATH = Path("config/rag.yaml")
+_CHUNKS_PATH = Path("data/rag/index/chunks.jsonl")
+# Keep-alive connections the shared OpenSearch client may hold.
+_OPENSEARCH_POOL_MAXSIZE = 32
+
+# Dedicated, bounded pool for blocking retrieval work, so bursts queue here
+# instead of competing for the loop's default executor.
+_RAG_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.rag.max_concurrent,
+    thread_name_prefix="rag",
+)
+
 
 class RAGStoreError(Exception):
     """Base exception for RAG store errors."""
@@ -22,31 +67,137 @@ class RAGStoreError(Exception):
 
 @lru_cache(maxsize=1)
 def _load_local_chunks() -> List[RAGChunk]:
-    chunks_path = Path("data/rag/index/chunks.jsonl")
+    chunks_path = _CHUNKS_PATH
     if not chunks_path.exists():
         raise RAGStoreError(
             f"Local RAG chunks file not found: {chunks_path}. Run index builder first."
         )
 
+    # The file is written by our own index builder, so well-formed rows skip
+    # pydantic validation; anything missing required fields is validated
+    # (and rejected) normally.
     chunks: List[RAGChunk] = []
-    with chunks_path.open("r", encoding="utf-8") as f:
-        for line in f:
-            text = line.strip()
-            if not text:
-                continue
-            chunks.append(RAGChunk.model_validate_json(text))
+    for line in chunks_path.read_bytes().splitlines():
+        if not line.strip():
+            continue
+        obj = orjson.loads(line)
+        if "id" in obj and "text" in obj:
+            chunks.append(RAGChunk.model_construct(**obj))
+        else:
+            chunks.append(RAGChunk.model_validate(obj))
     return chunks
 
 
-def _score_text_overlap(query: str, text: str) -> float:
-    query_terms = {t for t in query.lower().split() if t}
-    if not query_terms:
-        return 0.0
+@lru_cache(maxsize=1)
+def _cached_rag_config(path_str: str, mtime: float) -> RAGConfig:
+    # mtime is part of the key so an edited config is picked up.
+    return load_rag_config(Path(path_str))
+
 
-    text_terms = {t for t in text.lower().split() if t}
-    overlap = len(query_terms.intersection(text_terms))
-    denom = math.sqrt(len(query_terms) * max(1, len(text_terms)))
-    return overlap / denom if denom > 0 else 0.0
+def _get_rag_config() -> RAGConfig:
+    return _cached_rag_config(
+        str(_RAG_CONFIG_PATH), _RAG_CONFIG_PATH.stat().st_mtime
+    )
+
+
+def _terms(text: str) -> FrozenSet[str]:
+    # Alphanumeric runs, so "title," and "title" are the same term.
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+@dataclass(frozen=True)
+class _LocalIndex:
+    """
+    Inverted index over the local chunks.
+
+    postings[term_id] holds the (sorted) row numbers of chunks containing the
+    term and weights[term_id] that term's precomputed BM25 contribution for
+    each of those rows, so a query's scores for every chunk are one bincount.
+    Marketplace/section are stored as parallel integer code arrays so
+    filters are a vectorized compare, not a walk over chunk objects.
+    """
+
+    chunks: List[RAGChunk]
+    vocab: Dict[str, int]
+    postings: List[np.ndarray]
+    weights: List[np.ndarray]
+    marketplace_codes: Dict[Optional[str], int]
+    marketplaces: np.ndarray
+    section_codes: Dict[Optional[str], int]
+    sections: np.ndarray
+
+
+_local_index: Optional[_LocalIndex] = None
+
+
+def _build_local_index(chunks: List[RAGChunk]) -> _LocalIndex:
+    vocab: Dict[str, int] = {}
+    rows_by_term: List[List[int]] = []
+    tfs_by_term: List[List[int]] = []
+    doc_lens = np.empty(len(chunks), dtype=np.float64)
+    marketplace_codes: Dict[Optional[str], int] = {}
+    marketplaces = np.empty(len(chunks), dtype=np.int32)
+    section_codes: Dict[Optional[str], int] = {}
+    sections = np.empty(len(chunks), dtype=np.int32)
+    for row, chunk in enumerate(chunks):
+        marketplaces[row] = marketplace_codes.setdefault(
+            chunk.marketplace, len(marketplace_codes)
+        )
+        sections[row] = section_codes.setdefault(chunk.section, len(section_codes))
+        tokens = _TOKEN_RE.findall(chunk.text.lower())
+        doc_lens[row] = len(tokens)
+        for term, tf in Counter(tokens).items():
+            term_id = vocab.setdefault(term, len(vocab))
+            if term_id == len(rows_by_term):
+                rows_by_term.append([])
+                tfs_by_term.append([])
+            rows_by_term[term_id].append(row)
+            tfs_by_term[term_id].append(tf)
+
+    # Per-row length normalization: k1 * (1 - b + b * dl / avgdl).
+    num_docs = len(chunks)
+    avg_len = float(doc_lens.mean()) if num_docs else 0.0
+    if avg_len > 0:
+        norm = _BM25_K1 * (1.0 - _BM25_B + _BM25_B * doc_lens / avg_len)
+    else:
+        norm = np.full(num_docs, _BM25_K1)
+
+    postings: List[np.ndarray] = []
+    weights: List[np.ndarray] = []
+    for rows_list, tfs_list in zip(rows_by_term, tfs_by_term):
+        rows = np.asarray(rows_list, dtype=np.int32)
+        tf = np.asarray(tfs_list, dtype=np.float64)
+        df = len(rows)
+        idf = np.log1p((num_docs - df + 0.5) / (df + 0.5))
+        postings.append(rows)
+        weights.append(idf * tf * (_BM25_K1 + 1.0) / (tf + norm[rows]))
+
+    return _LocalIndex(
+        chunks=chunks,
+        vocab=vocab,
+        postings=postings,
+        weights=weights,
+        marketplace_codes=marketplace_codes,
+        marketplaces=marketplaces,
+        section_codes=section_codes,
+        sections=sections,
+    )
+
+
+def _get_local_index() -> _LocalIndex:
+    """
+    Index over _load_local_chunks(), tokenized once per chunk list.
+
+    Rebuilt only when _load_local_chunks() hands back a different list.
+    """
+    global _local_index
+
+    chunks = _load_local_chunks()
+    cached = _local_index
+    if cached is None or cached.chunks is not chunks:
+        cached = _build_local_index(chunks)
+        _local_index = cached
+    return cached
 
 
 def _retrieve_local_chunks(
@@ -55,51 +206,105 @@ def _retrieve_local_chunks(
     section: Optional[str],
     top_k: int,
 ) -> List[RAGChunk]:
-    chunks = _load_local_chunks()
-
-    filtered = []
-    for chunk in chunks:
-        if marketplace and chunk.marketplace != marketplace:
-            continue
-        if section and chunk.section != section:
-            continue
-        filtered.append(chunk)
-
-    scored = sorted(
-        filtered,
-        key=lambda c: _score_text_overlap(query=query, text=c.text),
-        reverse=True,
-    )
-    out: List[RAGChunk] = []
-    for chunk in scored[:top_k]:
-        out.append(
-            RAGChunk(
-                id=chunk.id,
-                text=chunk.text,
-                marketplace=chunk.marketplace,
-                section=chunk.section,
-                source=chunk.source,
-                score=_score_text_overlap(query=query, text=chunk.text),
-            )
+    index = _get_local_index()
+    num_chunks = len(index.chunks)
+
+    # Filter: row numbers of eligible chunks (None = all of them).
+    candidates: Optional[np.ndarray] = None
+    if marketplace or section:
+        mask = np.ones(num_chunks, dtype=bool)
+        # Unknown values map to -1, which no row carries.
+        if marketplace:
+            mask &= index.marketplaces == index.marketplace_codes.get(marketplace, -1)
+        if section:
+            mask &= index.sections == index.section_codes.get(section, -1)
+        candidates = np.flatnonzero(mask)
+    num_candidates = num_chunks if candidates is None else len(candidates)
+
+    # Score: BM25 over every chunk in one weighted bincount.
+    term_ids = [index.vocab[term] for term in _terms(query) if term in index.vocab]
+    if not term_ids or top_k <= 0:
+        # No overlap anywhere: every score is 0, keep corpus order.
+        scores = np.zeros(num_chunks, dtype=np.float64)
+        rows = np.arange(num_chunks) if candidates is None else candidates
+        rows = rows[:max(top_k, 0)]
+    else:
+        scores = np.bincount(
+            np.concatenate([index.postings[t] for t in term_ids]),
+            weights=np.concatenate([index.weights[t] for t in term_ids]),
+            minlength=num_chunks,
         )
-    return out
+        cand_scores = scores if candidates is None else scores[candidates]
+
+        # Top-k: partition to the k-th best score, then stable-sort only
+        # the rows at or above it (ties keep corpus order).
+        keep = np.arange(num_candidates)
+        if top_k < num_candidates:
+            kth = np.partition(cand_scores, num_candidates - top_k)[
+                num_candidates - top_k
+            ]
+            keep = np.flatnonzero(cand_scores >= kth)
+        order = keep[np.argsort(-cand_scores[keep], kind="stable")[:top_k]]
+        rows = order if candidates is None else candidates[order]
+
+    # Only the top-k rows become new models; fields are already validated.
+    chunks = index.chunks
+    return [
+        chunks[row].model_copy(update={"score": float(scores[row])})
+        for row in rows.tolist()
+    ]
 
 
 def _new_opensearch_client() -> OpenSearch:
+    from opensearchpy import OpenSearch
+
     return OpenSearch(
         hosts=[settings.rag.opensearch_url],
         timeout=settings.rag.opensearch_timeout_seconds,
         use_ssl=False,
         verify_certs=False,
+        pool_maxsize=_OPENSEARCH_POOL_MAXSIZE,
+        http_compress=True,
     )
 
 
+_opensearch_client: Optional[OpenSearch] = None
+_opensearch_client_lock = threading.Lock()
+
+
+def _get_opensearch_client() -> OpenSearch:
+    """
+    Process-wide OpenSearch client.
+
+    The client owns a keep-alive connection pool, so sharing it avoids a new
+    TCP connect per retrieval.
+    """
+    global _opensearch_client
+
+    if _opensearch_client is None:
+        with _opensearch_client_lock:
+            if _opensearch_client is None:
+                client = _new_opensearch_client()
+                atexit.register(client.close)
+                _opensearch_client = client
+    return _opensearch_client
+
+
 @lru_cache(maxsize=1)
 def _get_embedder() -> SentenceTransformer:
+    llm = settings.llm
+    backend_kwargs: Dict[str, Any] = {}
+    if llm.embed_backend == "onnx":
+        backend_kwargs["backend"] = "onnx"
+        if llm.embed_onnx_file:
+            backend_kwargs["model_kwargs"] = {"file_name": llm.embed_onnx_file}
     try:
-        return SentenceTransformer(
-            settings.llm.embed_model,
+        from sentence_transformers import SentenceTransformer
+
+        model = SentenceTransformer(
+            llm.embed_model,
             local_files_only=True,
+            **backend_kwargs,
         )
     except Exception as exc:
         raise RAGStoreError(
@@ -109,6 +314,137 @@ def _get_embedder() -> SentenceTransformer:
             f"SentenceTransformer('{settings.llm.embed_model}')\""
         ) from exc
 
+    if llm.embed_backend == "onnx":
+        return model
+    model.eval()
+    if model.device.type == "cuda":
+        # fp16 halves weight bandwidth on GPU; retrieval quality is unaffected.
+        # CPUs stay fp32: without native bf16/fp16 units half precision is slower.
+        model.half()
+    return model
+
+
+class _PendingEncode:
+    """One caller's query waiting in the _QueryEncodeBatcher queue."""
+
+    __slots__ = ("query", "future", "wake")
+
+    def __init__(self, query: str) -> None:
+        self.query = query
+        self.future: Future = Future()
+        # Set once the result is in, or when this caller is made the leader.
+        self.wake = threading.Event()
+
+
+class _QueryEncodeBatcher:
+    """
+    Coalesces concurrent single-query encodes into padded mini-batches.
+
+    The first caller becomes the leader and encodes a batch of whatever is
+    queued (its own query included); callers arriving while that forward pass
+    runs are picked up by the next round, so batches form only under load and
+    a lone query never waits. Once its own result is in, the leader hands
+    leadership to the oldest waiting caller instead of draining the queue for
+    everyone else.
+    """
+
+    def __init__(self, max_batch: int = 32) -> None:
+        self._max_batch = max_batch
+        self._lock = threading.Lock()
+        self._pending: List[_PendingEncode] = []
+        self._draining = False
+
+    def encode(self, query: str) -> Tuple[float, ...]:
+        item = _PendingEncode(query)
+        with self._lock:
+            self._pending.append(item)
+            lead = not self._draining
+            self._draining = True
+        if not lead:
+            item.wake.wait()
+        if not item.future.done():
+            # Woken without a result: this caller is the new leader.
+            self._drain(item)
+        return item.future.result()
+
+    def _drain(self, own: _PendingEncode) -> None:
+        try:
+            while not own.future.done():
+                with self._lock:
+                    batch = self._pending[: self._max_batch]
+                    del self._pending[: self._max_batch]
+                self._encode_batch(batch)
+        finally:
+            with self._lock:
+                if self._pending:
+                    self._pending[0].wake.set()
+                else:
+                    self._draining = False
+
+    def _encode_batch(self, batch: List[_PendingEncode]) -> None:
+        # Similar lengths share a padding width inside each batch.
+        batch.sort(key=lambda item: len(item.query), reverse=True)
+        try:
+            vectors = _get_embedder().encode(
+                [item.query for item in batch],
+                batch_size=self._max_batch,
+                convert_to_numpy=True,
+            )
+        except Exception as exc:
+            for item in batch:
+                item.future.set_exception(exc)
+                item.wake.set()
+            return
+        except BaseException:
+            # Don't leave the rest of the batch waiting forever.
+            for item in batch:
+                item.future.set_exception(RAGStoreError("Query encoding was interrupted"))
+                item.wake.set()
+            raise
+        for item, vec in zip(batch, vectors):
+            item.future.set_result(tuple(vec.tolist()))
+            item.wake.set()
+
+
+_ENCODE_BATCHER = _QueryEncodeBatcher()
+
+
+@lru_cache(maxsize=4096)
+def _encode_query(query: str) -> Tuple[float, ...]:
+    # Repeated queries skip the embedding model's forward pass entirely.
+    return _ENCODE_BATCHER.encode(query)
+
+
+# Cleared when the cluster rejects a native hybrid query (no neural-search
+# plugin or missing search pipeline); hybrid mode then uses client-side RRF.
+_native_hybrid_supported = True
+
+# Error texts that mean the cluster cannot run native hybrid queries at all,
+# as opposed to a 400 caused by one particular request.
+_HYBRID_UNSUPPORTED_RE = re.compile(
+    r"unknown query \[hybrid\]"
+    r"|no \[query\] registered for \[hybrid\]"
+    r"|pipeline \S+ (?:is not defined|not defined|does not exist|not found)",
+    re.IGNORECASE,
+)
+
+
+def _native_hybrid_unsupported(exc: Exception) -> bool:
+    # str() of an opensearch-py error only carries the first root cause;
+    # the response body (`info`) has the rest.
+    return bool(_HYBRID_UNSUPPORTED_RE.search(f"{exc} {getattr(exc, 'info', '')}"))
+
+
+def _disable_native_hybrid(exc: Exception) -> None:
+    global _native_hybrid_supported
+
+    if _native_hybrid_supported:
+        _native_hybrid_supported = False
+        logger.warning(
+            "Native hybrid query unavailable; falling back to client-side RRF",
+            extra={"error": str(exc)},
+        )
+
 
 def _retrieve_opensearch_chunks(
     query: str,
@@ -123,6 +459,20 @@ def _retrieve_opensearch_chunks(
     if section:
         filters.append({"term": {"section": section}})
 
+    lexical_clause: Dict[str, Any] = {
+        "bool": {
+            "must": [
+                {
+                    "multi_match": {
+                        "query": query,
+                        "fields": ["text^3", "source", "section"],
+                    }
+                }
+            ],
+            "filter": filters,
+        }
+    }
+
     def _apply_python_filters(hits: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
         out: List[Dict[str, Any]] = []
         for hit in hits:
@@ -134,51 +484,71 @@ def _retrieve_opensearch_chunks(
             out.append(hit)
         return out
 
+    def _query_vector() -> List[float]:
+        try:
+            return list(_encode_query(query))
+        except Exception as exc:
+            raise RAGStoreError(
+                f"Embedding generation failed for hybrid retrieval: {exc}"
+            ) from exc
+
     def _search_lexical(client: OpenSearch, k: int) -> List[Dict[str, Any]]:
         payload: Dict[str, Any] = {
             "size": max(k, top_k),
             "_source": ["id", "text", "marketplace", "section", "source"],
-            "query": {
-                "bool": {
-                    "must": [
-                        {
-                            "multi_match": {
-                                "query": query,
-                                "fields": ["text^3", "source", "section"],
-                            }
-                        }
-                    ],
-                    "filter": filters,
-                }
-            },
+            "query": lexical_clause,
         }
         response = client.search(index=settings.rag.opensearch_index, body=payload)
         return response.get("hits", {}).get("hits", [])
 
-    def _search_vector(client: OpenSearch, k: int) -> List[Dict[str, Any]]:
-        try:
-            query_vector = _get_embedder().encode(query).tolist()
-        except Exception as exc:
-            raise RAGStoreError(
-                f"Embedding generation failed for hybrid retrieval: {exc}"
-            ) from exc
-
-        # OpenSearch k-NN query; we apply metadata filters in Python for broad compatibility.
+    def _knn_clause(k: int, with_filter: bool = True) -> Dict[str, Any]:
+        # Filters are applied during the faiss graph search (efficient
+        # filtering), so selective filters still return k matching hits.
+        knn: Dict[str, Any] = {"vector": _query_vector(), "k": max(k, top_k)}
+        if filters and with_filter:
+            knn["filter"] = {"bool": {"filter": filters}}
+        return {"knn": {"embedding": knn}}
+
+    def _search_hybrid(client: OpenSearch, k: int) -> List[Dict[str, Any]]:
+        # One round trip: OpenSearch runs both sub-queries and fuses the
+        # scores in the search pipeline's normalization processor.
         payload: Dict[str, Any] = {
             "size": max(k, top_k),
             "_source": ["id", "text", "marketplace", "section", "source"],
             "query": {
-                "knn": {
-                    "embedding": {
-                        "vector": query_vector,
-                        "k": max(k, top_k),
-                    }
+                "hybrid": {
+                    "queries": [lexical_clause, _knn_clause(k)],
                 }
             },
         }
-        response = client.search(index=settings.rag.opensearch_index, body=payload)
-        hits = response.get("hits", {}).get("hits", [])
-        return _apply_python_filters(hits)
+        response = client.search(
+            index=settings.rag.opensearch_index,
+            body=payload,
+            params={"search_pipeline": settings.rag.opensearch_hybrid_pipeline},
+        )
+        return response.get("hits", {}).get("hits", [])
+
+    def _search_vector(client: OpenSearch, k: int) -> List[Dict[str, Any]]:
+        payload: Dict[str, Any] = {
+            "size": max(k, top_k),
+            "_source": ["id", "text", "marketplace", "section", "source"],
+            "query": _knn_clause(k),
+        }
+        try:
+            response = client.search(index=settings.rag.opensearch_index, body=payload)
+        except Exception as exc:
+            if not filters or getattr(exc, "status_code", None) != 400:
+                raise
+            # Indexes on the nmslib engine reject k-NN filters; search
+            # unfiltered and apply the metadata filters in Python instead.
+            logger.debug(
+                "Filtered k-NN query rejected; filtering in Python",
+                extra={"error": str(exc)},
+            )
+            payload["query"] = _knn_clause(k, with_filter=False)
+            response = client.search(index=settings.rag.opensearch_index, body=payload)
+            return _apply_python_filters(response.get("hits", {}).get("hits", []))
+        return response.get("hits", {}).get("hits", [])
 
     def _to_chunk(hit: Dict[str, Any], fused_score: float | None = None) -> RAGChunk:
         source = hit.get("_source", {})
@@ -194,6 +564,7 @@ def _retrieve_opensearch_chunks(
     def _rrf_fuse(
         lexical_hits: Sequence[Dict[str, Any]],
         vector_hits: Sequence[Dict[str, Any]],
+        limit: int,
         k_rrf: int = 60,
     ) -> List[Dict[str, Any]]:
         by_id: Dict[str, Dict[str, Any]] = {}
@@ -213,7 +584,9 @@ def _retrieve_opensearch_chunks(
             by_id[hid] = hit
             fused[hid] = fused.get(hid, 0.0) + (1.0 / (k_rrf + rank))
 
-        ranked_ids = sorted(fused.keys(), key=lambda hid: fused[hid], reverse=True)
+        # Partial selection: only the top `limit` ids are ordered and copied
+        # (same result and tie order as sorted(...)[:limit]).
+        ranked_ids = heapq.nlargest(limit, fused, key=fused.__getitem__)
         out: List[Dict[str, Any]] = []
         for hid in ranked_ids:
             h = by_id[hid].copy()
@@ -222,7 +595,7 @@ def _retrieve_opensearch_chunks(
         return out
 
     try:
-        client = _new_opensearch_client()
+        client = _get_opensearch_client()
         if mode == "bm25":
             hits = _search_lexical(client, k=top_k)
             return [_to_chunk(hit) for hit in hits[:top_k]]
@@ -230,15 +603,114 @@ def _retrieve_opensearch_chunks(
             hits = _search_vector(client, k=top_k)
             return [_to_chunk(hit) for hit in hits[:top_k]]
 
-        # hybrid -> lexical + vector fused with Reciprocal Rank Fusion (RRF)
+        if _native_hybrid_supported:
+            try:
+                hits = _search_hybrid(client, k=max(top_k * 3, 20))
+                return [_to_chunk(hit) for hit in hits[:top_k]]
+            except Exception as exc:
+                # 400/404: the cluster rejected this hybrid request; use RRF
+                # for it. Only give up on native hybrid for good when the
+                # error says the query type or pipeline is unsupported.
+                # Anything else (timeouts, connection errors) is a real failure.
+                if getattr(exc, "status_code", None) not in (400, 404):
+                    raise
+                if _native_hybrid_unsupported(exc):
+                    _disable_native_hybrid(exc)
+                else:
+                    logger.warning(
+                        "Native hybrid query rejected; using client-side RRF",
+                        extra={"error": str(exc)},
+                    )
+
+        # Fallback: lexical + vector fused client-side with Reciprocal Rank Fusion (RRF)
         lexical_hits = _search_lexical(client, k=max(top_k * 3, 20))
         vector_hits = _search_vector(client, k=max(top_k * 3, 20))
-        fused_hits = _rrf_fuse(lexical_hits, vector_hits)
-        return [_to_chunk(hit, fused_score=hit.get("_rrf_score")) for hit in fused_hits[:top_k]]
+        fused_hits = _rrf_fuse(lexical_hits, vector_hits, limit=top_k)
+        return [_to_chunk(hit, fused_score=hit.get("_rrf_score")) for hit in fused_hits]
     except Exception as exc:
         raise RAGStoreError(f"OpenSearch query failed: {exc}") from exc
 
 
+_ResultKey = Tuple[str, str, str, int, str, str]
+
+
+class _RetrievalResultCache:
+    """
+    Bounded LRU of retrieval results.
+
+    Entries expire after ttl_seconds and are all dropped when chunks.jsonl is
+    rewritten (re-index), since either backend is built from that file.
+    """
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        # key -> (expires_at, chunks)
+        self._entries: OrderedDict[
+            _ResultKey, Tuple[float, Tuple[RAGChunk, ...]]
+        ] = OrderedDict()
+        self._index_mtime: Optional[float] = None
+
+    def _check_index(self) -> None:
+        try:
+            mtime = _CHUNKS_PATH.stat().st_mtime
+        except OSError:
+            mtime = 0.0
+        if mtime != self._index_mtime:
+            self._entries.clear()
+            self._index_mtime = mtime
+
+    def get(self, key: _ResultKey) -> Optional[List[RAGChunk]]:
+        if self._maxsize <= 0:
+            return None
+        with self._lock:
+            self._check_index()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, chunks = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return list(chunks)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def put(self, key: _ResultKey, chunks: List[RAGChunk]) -> None:
+        if self._maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, tuple(chunks))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+
+_RESULT_CACHE = _RetrievalResultCache(
+    maxsize=settings.rag.result_cache_size,
+    ttl_seconds=settings.rag.result_cache_ttl_seconds,
+)
+
+
+def clear_retrieval_cache() -> None:
+    """
+    Drop all cached retrieval results (e.g. between tests that swap corpora).
+    """
+    _RESULT_CACHE.clear()
+
+
+async def _run_in_rag_executor(func: Callable[..., _T], *args: Any) -> _T:
+    # Like asyncio.to_thread, carry contextvars (OTel span, log trace ids)
+    # into the worker thread.
+    ctx = contextvars.copy_context()
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_RAG_EXECUTOR, partial(ctx.run, func, *args))
+
+
 async def async_retrieve_chunks(
     query: str,
     marketplace: Optional[str] = None,
@@ -246,11 +718,7 @@ async def async_retrieve_chunks(
     top_k: Optional[int] = None,
     mode: Optional[str] = None,
 ) -> List[RAGChunk]:
-    from pathlib import Path
-
-    from .index_builder import load_rag_config
-
-    rag_config = load_rag_config(Path("config/rag.yaml"))
+    rag_config = _get_rag_config()
     final_top_k = top_k or rag_config.retrieval.default_top_k
     final_top_k = min(final_top_k, rag_config.retrieval.max_top_k)
 
@@ -259,30 +727,46 @@ async def async_retrieve_chunks(
         raise RAGStoreError(f"Unsupported retrieval mode: {final_mode}")
 
     backend = settings.rag.backend
-    logger.info(
-        "RAG retrieval",
-        extra={
-            "backend": backend,
-            "mode": final_mode,
-            "top_k": final_top_k,
-            "marketplace": marketplace or "any",
-        },
+    cache_key: _ResultKey = (
+        query.strip().lower(),
+        marketplace or "",
+        section or "",
+        final_top_k,
+        final_mode,
+        backend,
     )
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "RAG retrieval",
+            extra={
+                "backend": backend,
+                "mode": final_mode,
+                "top_k": final_top_k,
+                "marketplace": marketplace or "any",
+            },
+        )
 
     if backend == "local_file":
-        return await asyncio.to_thread(
+        chunks = await _run_in_rag_executor(
             _retrieve_local_chunks,
             query,
             marketplace,
             section,
             final_top_k,
         )
+    else:
+        chunks = await _run_in_rag_executor(
+            _retrieve_opensearch_chunks,
+            query,
+            marketplace,
+            section,
+            final_top_k,
+            final_mode,
+        )
 
-    return await asyncio.to_thread(
-        _retrieve_opensearch_chunks,
-        query,
-        marketplace,
-        section,
-        final_top_k,
-        final_mode,
-    )
+    _RESULT_CACHE.put(cache_key, chunks)
+    return chunks
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
-import json
+import re
 from datetime import date
 from typing import Any, Dict, List, Literal, Optional
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 from pydantic.config import ConfigDict
 
+# Comma separators with any surrounding whitespace, so split parts need no strip.
+_MARKET_SPLIT_RE = re.compile(r"\s*,\s*")
+
 
 class Product(BaseModel):
     """
@@ -52,15 +56,15 @@ class Product(BaseModel):
 
             if text.startswith("["):
                 try:
-                    parsed = json.loads(text)
+                    parsed = orjson.loads(text)
                     if isinstance(parsed, list):
                         return [str(v).strip() for v in parsed if str(v).strip()]
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     # Fall back to comma-separated
                     pass
 
             # Fallback: comma-separated string
-            return [part.strip() for part in text.split(",") if part.strip()]
+            return [part for part in _MARKET_SPLIT_RE.split(text) if part]
 
         # Fallback for unexpected types
         return [str(value).strip()]
@@ -86,10 +90,10 @@ class Product(BaseModel):
             if not text:
                 return {}
             try:
-                parsed = json.loads(text)
+                parsed = orjson.loads(text)
                 if isinstance(parsed, dict):
                     return parsed
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 return {}
 
         # Fallback: cannot parse to dict
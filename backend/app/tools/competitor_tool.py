@@ -45,8 +45,11 @@ class CompetitorOverviewOutput(BaseModel):
 
 
 def _compute_seller_avg_price(sales_records: List[SalesRecord]) -> Optional[float]:
-    total_units = sum(r.units_sold for r in sales_records)
-    total_revenue = sum(r.gross_revenue for r in sales_records)
+    total_units = 0
+    total_revenue = 0.0
+    for r in sales_records:
+        total_units += r.units_sold
+        total_revenue += r.gross_revenue
     if total_units <= 0:
         return None
     return total_revenue / total_units
@@ -81,19 +84,18 @@ def get_competitor_overview(
 
     seller_avg_price = _compute_seller_avg_price(sales_records)
 
-    enriched: List[CompetitorWithDelta] = []
-    for comp in competitors:
-        if seller_avg_price is not None:
-            price_delta = comp.price - seller_avg_price
-        else:
-            price_delta = None
-        enriched.append(
-            CompetitorWithDelta(
-                competitor=comp,
-                seller_avg_price=seller_avg_price,
-                price_delta=price_delta,
-            )
+    # Inputs are already-validated models and seller_avg_price is a ratio of
+    # non-negative totals, so the wrappers skip re-validation.
+    enriched: List[CompetitorWithDelta] = [
+        CompetitorWithDelta.model_construct(
+            competitor=comp,
+            seller_avg_price=seller_avg_price,
+            price_delta=(
+                comp.price - seller_avg_price if seller_avg_price is not None else None
+            ),
         )
+        for comp in competitors
+    ]
 
     return CompetitorOverviewOutput(
         product=product,
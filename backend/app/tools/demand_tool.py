@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 from datetime import date, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from ..db import seller_repository
 from ..observability.llm_obs import traceable_node
 from ..observability.logging import get_logger
-from ..schemas.seller import SalesRecord
 
 logger = get_logger("tools.demand")
 
@@ -24,7 +24,10 @@ class DemandForecastRequest(BaseModel):
         default=28,
         ge=7,
         le=365,
-        description="How many past days to use for a simple moving-average forecast.",
+        description=(
+            "How many past days to use (and the span of the exponentially "
+            "weighted average) for the forecast."
+        ),
     )
 
 
@@ -50,23 +53,60 @@ class DemandForecastResponse(BaseModel):
     forecast: List[DemandForecastPoint]
 
 
-def _compute_moving_average(records: List[SalesRecord]) -> float:
-    total_units = sum(r.units_sold for r in records)
-    days_with_data = len({r.date for r in records})
-    if days_with_data <= 0:
-        return 0.0
-    return total_units / days_with_data
+class DemandForecastCompactResponse(BaseModel):
+    """
+    Columnar variant of DemandForecastResponse: one list per point field.
 
+    Position i across the lists is the i-th forecast day; for callers that
+    aggregate the forecast rather than walk individual points.
+    """
 
-@traceable_node("tool.demand")
-def forecast_demand(input_data: DemandForecastRequest) -> DemandForecastResponse:
+    product_id: str
+    horizon_days: int
+    history_window_days: int
+    dates: List[date]
+    expected_units: List[float]
+    lower_ci: List[Optional[float]]
+    upper_ci: List[Optional[float]]
+
+
+def _daily_units(cols: Dict[str, np.ndarray]) -> np.ndarray:
     """
-    Tool: Compute a simple moving-average-based demand forecast.
+    Units sold per day with data (marketplaces summed), in date order.
+    """
+    _, day_index = np.unique(cols["date"], return_inverse=True)
+    return np.bincount(day_index, weights=cols["units_sold"]).astype(np.float64)
 
-    This is intentionally simple but production-friendly:
-    - no heavy ML here
-    - deterministic and explainable
-    - agents can still call LLMs to explain/interpret this forecast
+
+def _smoothed_forecast(
+    daily_units: np.ndarray, span_days: int
+) -> Tuple[float, Optional[float], Optional[float]]:
+    """
+    Exponentially weighted daily average plus a ~95% band.
+
+    alpha = 2 / (span + 1), weights normalized over the observed days (the
+    same estimate as pandas' ewm(adjust=True).mean()). The band is
+    +/- 1.96 sample std of daily units, clipped at 0; None with < 2 days.
+    """
+    n = len(daily_units)
+    if n == 0:
+        return 0.0, None, None
+
+    alpha = 2.0 / (span_days + 1)
+    weights = (1.0 - alpha) ** np.arange(n - 1, -1, -1, dtype=np.float64)
+    expected = float(weights @ daily_units / weights.sum())
+
+    if n < 2:
+        return expected, None, None
+    half_width = 1.96 * float(daily_units.std(ddof=1))
+    return expected, max(0.0, expected - half_width), expected + half_width
+
+
+def _forecast_level(
+    input_data: DemandForecastRequest,
+) -> Optional[Tuple[date, float, Optional[float], Optional[float]]]:
+    """
+    (latest sale date, expected units, lower_ci, upper_ci), or None without history.
     """
     logger.info(
         "Running demand forecast",
@@ -78,39 +118,56 @@ def forecast_demand(input_data: DemandForecastRequest) -> DemandForecastResponse
     )
 
     # We consider "today" as the latest date in the sales history (warehouse time).
-    all_records = seller_repository.list_sales_history(
+    latest_date = seller_repository.get_latest_sale_date(input_data.product_id)
+    if latest_date is None:
+        return None
+
+    history_start = latest_date - timedelta(days=input_data.history_window_days - 1)
+
+    # The window is filtered in the warehouse and read as columns.
+    history = seller_repository.list_sales_history_columns(
         product_id=input_data.product_id,
-        start_date=None,
-        end_date=None,
+        start_date=history_start,
+        end_date=latest_date,
+    )
+
+    expected_units, lower_ci, upper_ci = _smoothed_forecast(
+        _daily_units(history), input_data.history_window_days
     )
-    if not all_records:
+    return latest_date, expected_units, lower_ci, upper_ci
+
+
+@traceable_node("tool.demand")
+def forecast_demand(input_data: DemandForecastRequest) -> DemandForecastResponse:
+    """
+    Tool: Compute an exponentially weighted demand forecast with a ~95% band.
+
+    This is intentionally simple but production-friendly:
+    - no heavy ML here
+    - deterministic and explainable
+    - agents can still call LLMs to explain/interpret this forecast
+    """
+    level = _forecast_level(input_data)
+    if level is None:
         return DemandForecastResponse(
             product_id=input_data.product_id,
             horizon_days=input_data.horizon_days,
             history_window_days=input_data.history_window_days,
             forecast=[],
         )
-
-    latest_date = max(r.date for r in all_records)
-    history_start = latest_date - timedelta(days=input_data.history_window_days - 1)
-
-    history_records = [
-        r for r in all_records if r.date >= history_start and r.date <= latest_date
-    ]
-
-    avg_daily_units = _compute_moving_average(history_records)
-
-    forecast_points: List[DemandForecastPoint] = []
-    for i in range(1, input_data.horizon_days + 1):
-        target_date = latest_date + timedelta(days=i)
-        forecast_points.append(
-            DemandForecastPoint(
-                date=target_date,
-                expected_units=avg_daily_units,
-                lower_ci=None,
-                upper_ci=None,
-            )
+    latest_date, expected_units, lower_ci, upper_ci = level
+
+    # Flat forecast: the same smoothed level on each of the next horizon days.
+    base_ordinal = latest_date.toordinal()
+    forecast_points: List[DemandForecastPoint] = [
+        DemandForecastPoint.model_construct(
+            date=date.fromordinal(base_ordinal + i),
+            expected_units=expected_units,
+            lower_ci=lower_ci,
+            upper_ci=upper_ci,
         )
+        for i in range(1, input_data.horizon_days + 1)
+    ]
 
     return DemandForecastResponse(
         product_id=input_data.product_id,
@@ -118,3 +175,33 @@ def forecast_demand(input_data: DemandForecastRequest) -> DemandForecastResponse
         history_window_days=input_data.history_window_days,
         forecast=forecast_points,
     )
+
+
+@traceable_node("tool.demand_compact")
+def forecast_demand_compact(
+    input_data: DemandForecastRequest,
+) -> DemandForecastCompactResponse:
+    """
+    Tool: same forecast as forecast_demand, returned column-wise.
+
+    No per-point models are built; the flat level is repeated per day.
+    """
+    level = _forecast_level(input_data)
+    horizon = input_data.horizon_days if level is not None else 0
+    if level is None:
+        dates: List[date] = []
+        expected_units, lower_ci, upper_ci = 0.0, None, None
+    else:
+        latest_date, expected_units, lower_ci, upper_ci = level
+        first = np.datetime64(latest_date, "D") + 1
+        dates = np.arange(first, first + horizon).tolist()
+
+    return DemandForecastCompactResponse.model_construct(
+        product_id=input_data.product_id,
+        horizon_days=input_data.horizon_days,
+        history_window_days=input_data.history_window_days,
+        dates=dates,
+        expected_units=[expected_units] * horizon,
+        lower_ci=[lower_ci] * horizon,
+        upper_ci=[upper_ci] * horizon,
+    )
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, fields
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
@@ -13,8 +14,16 @@ from ..observability.logging import get_logger
 
 logger = get_logger("tools.profit")
 
+# libyaml's C parser when available; same safe subset as yaml.safe_load.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@dataclass(frozen=True, slots=True)
+class FeeConfig:
+    """
+    Per-marketplace fee assumptions; plain slots, read on every simulation.
+    """
 
-class FeeConfig(BaseModel):
     referral_fee_percent: float = 0.0
     closing_fee_flat: float = 0.0
     fba_pick_pack_fee: float = 0.0
@@ -22,6 +31,20 @@ class FeeConfig(BaseModel):
     return_handling_fee: float = 0.0
     payment_gateway_fee_percent: float = 0.0
 
+    @classmethod
+    def from_dict(cls, raw: Optional[Dict[str, Any]]) -> FeeConfig:
+        """
+        Build from a fees.yaml tier, coercing to float once; unknown keys ignored.
+        """
+        raw = raw or {}
+        return cls(
+            **{
+                f.name: float(raw[f.name])
+                for f in fields(cls)
+                if raw.get(f.name) is not None
+            }
+        )
+
 
 class FeeComponent(BaseModel):
     name: str
@@ -45,30 +68,37 @@ class ProfitSimulationOutput(BaseModel):
     fee_breakdown: List[FeeComponent]
 
 
-@lru_cache()
-def _load_fee_configs() -> Dict[str, FeeConfig]:
+_FEES_PATH = Path(__file__).resolve().parents[3] / "config" / "fees.yaml"
+
+
+@lru_cache(maxsize=1)
+def _parse_fee_configs(
+    path_str: str, stat_key: Optional[Tuple[int, int, int]]
+) -> Dict[str, FeeConfig]:
     """
-    Load fee configuration from config/fees.yaml once.
+    Parse fees.yaml into per-marketplace default fee configs.
 
     Structure expected:
       amazon:
         default:
           referral_fee_percent: ...
           ...
+
+    stat_key is (mtime_ns, size, inode) and only part of the cache key, so an
+    edited (or atomically replaced) file is re-parsed; None means missing.
     """
-    config_path = Path(__file__).resolve().parents[3] / "config" / "fees.yaml"
-    if not config_path.exists():
+    if stat_key is None:
         logger.warning("fees.yaml not found; using zero fees")
         return {}
 
-    with config_path.open("r", encoding="utf-8") as f:
-        raw = yaml.safe_load(f) or {}
+    with open(path_str, "r", encoding="utf-8") as f:
+        raw = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     configs: Dict[str, FeeConfig] = {}
     for marketplace, tiers in raw.items():
         default_cfg = tiers.get("default") if isinstance(tiers, dict) else {}
         try:
-            configs[marketplace] = FeeConfig.model_validate(default_cfg)
+            configs[marketplace] = FeeConfig.from_dict(default_cfg)
         except Exception as exc:
             logger.warning(
                 "Failed to parse fee config for marketplace",
@@ -77,6 +107,22 @@ def _load_fee_configs() -> Dict[str, FeeConfig]:
     return configs
 
 
+def _load_fee_configs() -> Dict[str, FeeConfig]:
+    """
+    Fee configs from config/fees.yaml, re-read only when the file changes.
+    """
+    try:
+        st = _FEES_PATH.stat()
+        stat_key: Optional[Tuple[int, int, int]] = (
+            st.st_mtime_ns,
+            st.st_size,
+            st.st_ino,
+        )
+    except FileNotFoundError:
+        stat_key = None
+    return _parse_fee_configs(str(_FEES_PATH), stat_key)
+
+
 def _get_fee_config(marketplace: str) -> FeeConfig:
     configs = _load_fee_configs()
     cfg = configs.get(marketplace)
@@ -108,16 +154,29 @@ def simulate_profit(input_data: ProfitSimulationInput) -> ProfitSimulationOutput
         input_data.candidate_price * fee_cfg.payment_gateway_fee_percent / 100.0
     )
 
+    # Amounts are floats from the validated FeeConfig/input; no re-validation.
     fee_breakdown = [
-        FeeComponent(name="referral_fee", amount_per_unit=referral_fee),
-        FeeComponent(name="closing_fee", amount_per_unit=fee_cfg.closing_fee_flat),
-        FeeComponent(name="pick_pack_fee", amount_per_unit=fee_cfg.fba_pick_pack_fee),
-        FeeComponent(name="storage_fee", amount_per_unit=fee_cfg.storage_fee_per_unit),
-        FeeComponent(
+        FeeComponent.model_construct(
+            name="referral_fee",
+            amount_per_unit=referral_fee,
+        ),
+        FeeComponent.model_construct(
+            name="closing_fee",
+            amount_per_unit=fee_cfg.closing_fee_flat,
+        ),
+        FeeComponent.model_construct(
+            name="pick_pack_fee",
+            amount_per_unit=fee_cfg.fba_pick_pack_fee,
+        ),
+        FeeComponent.model_construct(
+            name="storage_fee",
+            amount_per_unit=fee_cfg.storage_fee_per_unit,
+        ),
+        FeeComponent.model_construct(
             name="return_handling_fee",
             amount_per_unit=fee_cfg.return_handling_fee,
         ),
-        FeeComponent(
+        FeeComponent.model_construct(
             name="payment_gateway_fee",
             amount_per_unit=payment_gateway_fee,
         ),
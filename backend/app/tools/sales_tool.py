@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 from ..db import seller_repository
 from ..observability.llm_obs import traceable_node
 from ..observability.logging import get_logger
-from ..schemas.seller import Product, SalesRecord
+from ..schemas.seller import Product
 
 logger = get_logger("tools.sales")
 
@@ -61,12 +62,13 @@ class ProductSalesOverviewOutput(BaseModel):
     timeseries: List[SalesTimeSeriesPoint]
 
 
-def _summarize_sales(records: List[SalesRecord]) -> SalesSummary:
-    total_units = sum(r.units_sold for r in records)
-    total_revenue = sum(r.gross_revenue for r in records)
-    total_returns = sum(r.returns for r in records)
-    total_ad_spend = sum(r.ad_spend for r in records)
-    total_page_views = sum(r.page_views for r in records)
+def _summarize_sales(cols: Dict[str, np.ndarray]) -> SalesSummary:
+    # Column-wise reductions over the warehouse arrays; no per-row objects.
+    total_units = int(cols["units_sold"].sum())
+    total_revenue = float(cols["gross_revenue"].sum())
+    total_returns = int(cols["returns"].sum())
+    total_ad_spend = float(cols["ad_spend"].sum())
+    total_page_views = int(cols["page_views"].sum())
 
     if total_units > 0:
         avg_price = total_revenue / total_units
@@ -89,17 +91,25 @@ def _summarize_sales(records: List[SalesRecord]) -> SalesSummary:
     )
 
 
-def _to_timeseries(records: List[SalesRecord]) -> List[SalesTimeSeriesPoint]:
+def _to_timeseries(cols: Dict[str, np.ndarray]) -> List[SalesTimeSeriesPoint]:
+    # Columns are already typed by the warehouse query; skip re-validation.
     return [
-        SalesTimeSeriesPoint(
-            date=r.date,
-            units_sold=r.units_sold,
-            gross_revenue=r.gross_revenue,
-            returns=r.returns,
-            ad_spend=r.ad_spend,
-            page_views=r.page_views,
+        SalesTimeSeriesPoint.model_construct(
+            date=d,
+            units_sold=units,
+            gross_revenue=revenue,
+            returns=returns,
+            ad_spend=ad_spend,
+            page_views=views,
+        )
+        for d, units, revenue, returns, ad_spend, views in zip(
+            cols["date"].tolist(),
+            cols["units_sold"].tolist(),
+            cols["gross_revenue"].tolist(),
+            cols["returns"].tolist(),
+            cols["ad_spend"].tolist(),
+            cols["page_views"].tolist(),
         )
-        for r in records
     ]
 
 
@@ -123,14 +133,14 @@ def get_product_sales_overview(
     if product is None:
         raise ValueError(f"Product {input_data.product_id} not found in warehouse")
 
-    records = seller_repository.list_sales_history(
+    cols = seller_repository.list_sales_history_columns(
         product_id=input_data.product_id,
         start_date=input_data.start_date,
         end_date=input_data.end_date,
     )
 
-    summary = _summarize_sales(records)
-    timeseries = _to_timeseries(records)
+    summary = _summarize_sales(cols)
+    timeseries = _to_timeseries(cols)
 
     return ProductSalesOverviewOutput(
         product=product,
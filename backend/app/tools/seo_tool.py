@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from pydantic import BaseModel, Field
 
@@ -32,6 +33,74 @@ class SEOEvaluationOutput(BaseModel):
     suggestions: List[SEOSuggestion]
 
 
+# (issue, suggestion) per heuristic; content is static, so built once.
+_TITLE_TOO_SHORT = (
+    "Title is too short.",
+    SEOSuggestion(
+        field="title",
+        suggestion="Add more descriptive keywords to the title.",
+        rationale="Short titles often miss important search terms.",
+    ),
+)
+_TITLE_TOO_LONG = (
+    "Title may be too long.",
+    SEOSuggestion(
+        field="title",
+        suggestion="Shorten the title while keeping key phrases.",
+        rationale="Very long titles can be truncated and may reduce clarity.",
+    ),
+)
+_FEW_BULLETS = (
+    "Too few bullet points for features/benefits.",
+    SEOSuggestion(
+        field="bullets",
+        suggestion="Add at least 3–5 bullet points covering key features and benefits.",
+        rationale="Bullet points help buyers quickly scan product advantages.",
+    ),
+)
+_SHORT_DESCRIPTION = (
+    "Description is very short.",
+    SEOSuggestion(
+        field="description",
+        suggestion="Expand the description to cover use cases, materials, sizing, and care.",
+        rationale="Richer descriptions can improve conversion and reduce returns.",
+    ),
+)
+# Each failed heuristic costs this many points.
+_SEO_DEDUCTION = 10.0
+
+
+@lru_cache(maxsize=32)
+def _evaluate(
+    title_band: int,
+    few_bullets: bool,
+    short_description: bool,
+) -> Tuple[float, Tuple[str, ...], Tuple[SEOSuggestion, ...]]:
+    """
+    Score + findings for one combination of heuristic outcomes.
+
+    The heuristics only look at lengths, so the result is fully determined
+    by these three flags (title_band: -1 too short, 0 ok, 1 too long).
+    """
+    findings = [
+        finding
+        for failed, finding in (
+            (title_band < 0, _TITLE_TOO_SHORT),
+            (title_band > 0, _TITLE_TOO_LONG),
+            (few_bullets, _FEW_BULLETS),
+            (short_description, _SHORT_DESCRIPTION),
+        )
+        if failed
+    ]
+
+    score = max(0.0, min(100.0 - _SEO_DEDUCTION * len(findings), 100.0))
+    return (
+        score,
+        tuple(issue for issue, _ in findings),
+        tuple(suggestion for _, suggestion in findings),
+    )
+
+
 @traceable_node("tool.seo")
 def evaluate_seo(input_data: SEOEvaluationInput) -> SEOEvaluationOutput:
     """
@@ -42,67 +111,25 @@ def evaluate_seo(input_data: SEOEvaluationInput) -> SEOEvaluationOutput:
       - Presence of bullets
       - Description length
     """
-    issues: List[str] = []
-    suggestions: List[SEOSuggestion] = []
-
     title_len = len(input_data.title)
-    desc_len = len(input_data.description)
-    num_bullets = len(input_data.bullets)
-
-    score = 100.0
-
-    # Title checks
     if title_len < 30:
-        score -= 10
-        issues.append("Title is too short.")
-        suggestions.append(
-            SEOSuggestion(
-                field="title",
-                suggestion="Add more descriptive keywords to the title.",
-                rationale="Short titles often miss important search terms.",
-            )
-        )
+        title_band = -1
     elif title_len > 150:
-        score -= 10
-        issues.append("Title may be too long.")
-        suggestions.append(
-            SEOSuggestion(
-                field="title",
-                suggestion="Shorten the title while keeping key phrases.",
-                rationale="Very long titles can be truncated and may reduce clarity.",
-            )
-        )
-
-    # Bullets
-    if num_bullets < 3:
-        score -= 10
-        issues.append("Too few bullet points for features/benefits.")
-        suggestions.append(
-            SEOSuggestion(
-                field="bullets",
-                suggestion="Add at least 3–5 bullet points covering key features and benefits.",
-                rationale="Bullet points help buyers quickly scan product advantages.",
-            )
-        )
-
-    # Description
-    if desc_len < 100:
-        score -= 10
-        issues.append("Description is very short.")
-        suggestions.append(
-            SEOSuggestion(
-                field="description",
-                suggestion="Expand the description to cover use cases, materials, sizing, and care.",
-                rationale="Richer descriptions can improve conversion and reduce returns.",
-            )
-        )
-
-    score = max(0.0, min(score, 100.0))
+        title_band = 1
+    else:
+        title_band = 0
+
+    score, issues, suggestions = _evaluate(
+        title_band,
+        len(input_data.bullets) < 3,
+        len(input_data.description) < 100,
+    )
 
-    return SEOEvaluationOutput(
+    # Cached parts are already-validated models/values.
+    return SEOEvaluationOutput.model_construct(
         product_id=input_data.product_id,
         marketplace=input_data.marketplace,
         score=score,
-        issues=issues,
-        suggestions=suggestions,
+        issues=list(issues),
+        suggestions=list(suggestions),
     )
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-import re
-from typing import Any, Dict, List
+import threading
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Set
 
+import duckdb
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 from ..db.session import get_warehouse_connection
@@ -11,15 +14,82 @@ from ..observability.logging import get_logger
 
 logger = get_logger("tools.sql")
 
+# Bound on query text so validation work stays proportional to sane input.
+_MAX_QUERY_CHARS = 64 * 1024
+_ALLOWED_TABLES = frozenset(
+    {
+        "products",
+        "competitors",
+        "inventory",
+        "reviews",
+        "sales_history",
+    }
+)
+
+# In-memory connection used only to run DuckDB's own parser.
+_parser_conn: Optional[duckdb.DuckDBPyConnection] = None
+_parser_lock = threading.Lock()
+
+
+def _iter_nodes(node: Any) -> Iterator[Dict[str, Any]]:
+    if isinstance(node, dict):
+        yield node
+        for child in node.values():
+            yield from _iter_nodes(child)
+    elif isinstance(node, list):
+        for child in node:
+            yield from _iter_nodes(child)
+
+
+@lru_cache(maxsize=512)
+def _referenced_tables(query: str) -> FrozenSet[str]:
+    """
+    Parse `query` with DuckDB's parser and return the tables it reads.
+
+    Raises ValueError unless it is exactly one SELECT statement reading only
+    plain tables (no table functions, file scans or other schemas).
+    """
+    global _parser_conn
+
+    with _parser_lock:
+        if _parser_conn is None:
+            _parser_conn = duckdb.connect(":memory:")
+        row = _parser_conn.execute("SELECT json_serialize_sql(?)", [query]).fetchone()
+    tree = orjson.loads(row[0])
+
+    if tree.get("error"):
+        if tree.get("error_type") == "not implemented":
+            # json_serialize_sql only accepts SELECT statements.
+            raise ValueError("Only SELECT queries are allowed for sql_tool")
+        raise ValueError(f"Invalid SQL for sql_tool: {tree.get('error_message')}")
+    if len(tree["statements"]) != 1:
+        raise ValueError("Only a single SELECT statement is allowed in sql_tool")
+
+    ctes: Set[str] = set()
+    tables: Set[str] = set()
+    for node in _iter_nodes(tree["statements"]):
+        cte_map = node.get("cte_map")
+        if cte_map:
+            ctes.update(entry["key"].lower() for entry in cte_map.get("map", []))
+        node_type = node.get("type")
+        if node_type == "TABLE_FUNCTION":
+            raise ValueError("Table functions are not allowed in sql_tool")
+        if node_type == "BASE_TABLE":
+            schema = node.get("schema_name")
+            if node.get("catalog_name") or schema not in ("", "main"):
+                raise ValueError("Only warehouse tables are allowed in sql_tool")
+            tables.add(node["table_name"].lower())
+    return frozenset(tables - ctes)
+
 
 class SQLQueryInput(BaseModel):
     """
     Internal tool input model for running read-only SQL against the seller warehouse.
 
     This is mainly for debugging and advanced analysis agents.
-    We enforce:
-      - SELECT-only queries
-      - No obvious DDL/DML keywords
+    We enforce (via DuckDB's own parser):
+      - a single SELECT statement
+      - reads from allow-listed warehouse tables only
     """
 
     query: str = Field(..., description="SQL SELECT query to run against the warehouse")
@@ -31,35 +101,14 @@ class SQLQueryInput(BaseModel):
     @field_validator("query")
     @classmethod
     def validate_select_only(cls, value: str) -> str:
-        text = value.strip().lower()
-
-        if not text.startswith("select"):
-            raise ValueError("Only SELECT queries are allowed for sql_tool")
-
-        forbidden_keywords = [
-            "insert",
-            "update",
-            "delete",
-            "drop",
-            "alter",
-            "create table",
-            "truncate",
-            "merge",
-        ]
-        if any(kw in text for kw in forbidden_keywords):
-            raise ValueError("DDL/DML statements are not allowed in sql_tool")
-
-        allowed_tables = [
-            "products",
-            "competitors",
-            "inventory",
-            "reviews",
-            "sales_history",
-        ]
-        pattern = r"\bfrom\s+([a-zA-Z0-9_]+)"
-        table_matches = re.findall(pattern, text)
-        for tbl in table_matches:
-            if tbl not in allowed_tables:
+        if len(value) > _MAX_QUERY_CHARS:
+            raise ValueError(
+                f"Query is too long for sql_tool (max {_MAX_QUERY_CHARS} characters)"
+            )
+
+        # One real parse (cached per query text) instead of keyword scanning.
+        for tbl in _referenced_tables(value):
+            if tbl not in _ALLOWED_TABLES:
                 raise ValueError(f"Table '{tbl}' is not allowed in sql_tool")
 
         return value
@@ -90,13 +139,15 @@ def run_sql_query(input_data: SQLQueryInput) -> SQLQueryOutput:
     """
     logger.info("Running SQL query via sql_tool")
 
+    # Straight from DuckDB tuples to dicts; no pandas DataFrame in between.
     with get_warehouse_connection() as conn:
         if input_data.params:
-            df = conn.execute(input_data.query, input_data.params).df()
+            cursor = conn.execute(input_data.query, input_data.params)
         else:
-            df = conn.execute(input_data.query).df()
+            cursor = conn.execute(input_data.query)
+        cols = [d[0] for d in cursor.description]
+        raw_rows = cursor.fetchall()
 
-    records = df.to_dict(orient="records")
-    rows = [SQLQueryRow(data=row) for row in records]
+    rows = [SQLQueryRow.model_construct(data=dict(zip(cols, r))) for r in raw_rows]
 
     return SQLQueryOutput(rows=rows, row_count=len(rows))
@@ -0,0 +1,39 @@
+from contextlib import contextmanager
+
+import duckdb
+import pytest
+
+from backend.app.db import seller_repository
+from backend.app.db.init_seller_warehouse import SALES_HISTORY_TABLE
+
+
+@pytest.fixture
+def varchar_date_warehouse(monkeypatch):
+    # Mirrors the shipped warehouse, where sales_history.date is VARCHAR.
+    conn = duckdb.connect(":memory:")
+    conn.execute(
+        f"""
+        CREATE TABLE {SALES_HISTORY_TABLE} (
+            date VARCHAR, product_id VARCHAR, marketplace VARCHAR,
+            units_sold BIGINT, gross_revenue BIGINT, price BIGINT,
+            returns BIGINT, ad_spend BIGINT, page_views BIGINT
+        )
+        """
+    )
+    conn.executemany(
+        f"INSERT INTO {SALES_HISTORY_TABLE} VALUES (?, 'P001', ?, ?, 100, 20, 0, 5, 50)",
+        [
+            ("2025-01-08", "amazon", 4),
+            ("2025-01-09", "amazon", 6),
+            ("2025-01-10", "amazon", 5),
+            ("2025-01-10", "flipkart", 3),
+        ],
+    )
+
+    @contextmanager
+    def _conn(*args, **kwargs):
+        yield conn.cursor()
+
+    monkeypatch.setattr(seller_repository, "get_warehouse_connection", _conn)
+    yield conn
+    conn.close()
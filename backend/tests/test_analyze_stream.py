@@ -0,0 +1,108 @@
+import asyncio
+from types import SimpleNamespace
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.app.api.endpoints import analyze
+from backend.app.api.endpoints.analyze import AnalyzeRequest
+
+
+class _FakeGraph:
+    """Emits two node updates, then the final state (or raises)."""
+
+    def __init__(self, fail: bool = False, hang: bool = False) -> None:
+        self.fail = fail
+        self.hang = hang
+        self.cancelled = False
+
+    async def astream(self, initial_state, stream_mode):
+        assert stream_mode == ["updates", "values"]
+        yield "updates", {"router": {}}
+        if self.hang:
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        if self.fail:
+            raise RuntimeError("graph exploded")
+        yield "updates", {"final_answer": {}}
+        final = dict(initial_state)
+        final["query"] = {**final["query"], "routing_confidence": 1.0}
+        final["final_answer"] = {"answer_markdown": "done"}
+        yield "values", final
+
+
+@pytest.fixture
+def fake_backend(monkeypatch):
+    graph = _FakeGraph()
+    monkeypatch.setattr(analyze, "get_copilot_graph", lambda: graph)
+    # Keep the chat store out of the test: sessions and messages are no-ops.
+    monkeypatch.setattr(analyze, "create_session", lambda **kw: SimpleNamespace(session_id="s1"))
+    monkeypatch.setattr(analyze, "ensure_session", lambda **kw: SimpleNamespace(session_id="s1"))
+    monkeypatch.setattr(analyze, "upsert_memory_fact", lambda *a, **kw: None)
+    monkeypatch.setattr(analyze, "get_memory_facts", lambda session_id: {})
+    monkeypatch.setattr(analyze, "get_recent_turns", lambda **kw: [])
+    monkeypatch.setattr(analyze, "add_message", lambda **kw: None)
+    return graph
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.include_router(analyze.router, prefix="/api/v1")
+    return TestClient(app)
+
+
+def _events(response):
+    events, name = [], None
+    for line in response.iter_lines():
+        if line.startswith("event:"):
+            name = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            events.append((name, orjson.loads(line[len("data:"):])))
+    return events
+
+
+def test_stream_emits_node_events_then_result(fake_backend):
+    with _client().stream("POST", "/api/v1/analyze/stream", json={"query": "hi"}) as resp:
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _events(resp)
+
+    assert [name for name, _ in events] == ["node", "node", "result"]
+    assert [data["node"] for _, data in events[:2]] == ["router", "final_answer"]
+    result = events[-1][1]
+    assert result["final_answer"]["answer_markdown"] == "done"
+    assert result["session_id"] == "s1"
+
+
+def test_stream_reports_graph_failure_as_error_event(fake_backend):
+    fake_backend.fail = True
+    with _client().stream("POST", "/api/v1/analyze/stream", json={"query": "hi"}) as resp:
+        events = _events(resp)
+
+    assert [name for name, _ in events] == ["node", "error"]
+    assert events[-1][1]["status_code"] == 500
+
+
+def test_closing_the_stream_cancels_the_graph_run(fake_backend):
+    fake_backend.hang = True
+
+    async def _consume_then_disconnect():
+        response = await analyze.analyze_stream(AnalyzeRequest(query="hi"))
+        body = response.body_iterator
+        first = await body.__anext__()
+        # What the server does when the client goes away mid-stream.
+        await body.aclose()
+        for _ in range(5):
+            await asyncio.sleep(0)
+        # Checked inside the loop: asyncio.run would cancel leftovers anyway.
+        return first, fake_backend.cancelled
+
+    first, cancelled = asyncio.run(_consume_then_disconnect())
+
+    assert first.startswith(b"event: node")
+    assert cancelled
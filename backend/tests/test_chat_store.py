@@ -0,0 +1,106 @@
+import threading
+
+import pytest
+
+from backend.app.db import chat_store
+from backend.app.db.chat_store import NewChatMessage
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setattr(chat_store, "CHAT_DB_PATH", tmp_path / "chat.sqlite3")
+    monkeypatch.setattr(chat_store, "_conn", None)
+    chat_store._ensure_initialized.cache_clear()
+    yield chat_store
+    if chat_store._conn is not None:
+        chat_store._conn.close()
+    chat_store._ensure_initialized.cache_clear()
+
+
+def test_add_message_returns_the_stored_row(store):
+    session = store.create_session(seller_id="s", seller_name=None, title="t")
+
+    msg = store.add_message(session.session_id, "user", "hello", "r1", {"k": [1]})
+
+    assert store.get_message(msg.id) == msg
+    assert msg.metadata == {"k": [1]}
+
+
+def test_add_messages_batch_matches_ids_and_order(store):
+    a = store.create_session(seller_id=None, seller_name=None, title="a")
+    b = store.create_session(seller_id=None, seller_name=None, title="b")
+    store.add_message(b.session_id, "user", "other session")
+
+    added = store.add_messages(
+        a.session_id,
+        [
+            NewChatMessage(role="user", content="q", request_id="r"),
+            NewChatMessage(role="assistant", content="ans", request_id="r", metadata={"x": 1}),
+        ],
+    )
+
+    assert [m.content for m in added] == ["q", "ans"]
+    assert added[0].id < added[1].id
+    assert [store.get_message(m.id) for m in added] == added
+    assert store.add_messages(a.session_id, []) == []
+
+
+def test_recent_turns_are_newest_messages_oldest_first(store):
+    session = store.create_session(seller_id=None, seller_name=None, title="t")
+    for i in range(5):
+        store.add_message(session.session_id, "user" if i % 2 == 0 else "assistant", f"m{i}")
+
+    recent = store._list_recent_messages(session.session_id, n=3)
+
+    assert [m.content for m in recent] == ["m2", "m3", "m4"]
+    assert store.get_recent_turns(session.session_id, limit_pairs=1) == [
+        "assistant: m3",
+        "user: m4",
+    ]
+
+
+def test_failed_block_rolls_back_and_connection_stays_usable(store):
+    session = store.create_session(seller_id=None, seller_name=None, title="t")
+
+    with pytest.raises(RuntimeError):
+        with store._connect() as conn:
+            conn.execute(
+                "INSERT INTO chat_messages(session_id, role, content) VALUES (?, 'user', 'x')",
+                (session.session_id,),
+            )
+            # The lock is re-entrant: nested helpers on the same thread work.
+            with store._connect() as nested:
+                assert nested is conn
+            raise RuntimeError("boom")
+
+    assert store.list_messages(session.session_id) == []
+    store.add_message(session.session_id, "user", "after")
+    assert [m.content for m in store.list_messages(session.session_id)] == ["after"]
+
+
+def test_concurrent_batches_get_their_own_ids(store):
+    sessions = [
+        store.create_session(seller_id=None, seller_name=None, title=str(i)).session_id
+        for i in range(4)
+    ]
+    results = {}
+
+    def _write(session_id):
+        results[session_id] = [
+            msg
+            for i in range(10)
+            for msg in store.add_messages(
+                session_id,
+                [NewChatMessage(role="user", content=f"{session_id}-{i}-{j}") for j in range(3)],
+            )
+        ]
+
+    threads = [threading.Thread(target=_write, args=(sid,)) for sid in sessions]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for session_id, msgs in results.items():
+        assert [store.get_message(m.id).content for m in msgs] == [m.content for m in msgs]
+        assert len(store.list_messages(session_id)) == 30
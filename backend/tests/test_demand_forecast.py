@@ -0,0 +1,52 @@
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.app.db import seller_repository
+from backend.app.tools import demand_tool
+from backend.app.tools.demand_tool import DemandForecastRequest, _smoothed_forecast
+
+
+def test_latest_sale_date_is_a_date_for_varchar_column(varchar_date_warehouse):
+    assert seller_repository.get_latest_sale_date("P001") == date(2025, 1, 10)
+    assert seller_repository.get_latest_sale_date("missing") is None
+
+
+def test_forecast_demand_on_varchar_date_warehouse(varchar_date_warehouse):
+    req = DemandForecastRequest(product_id="P001", horizon_days=3, history_window_days=7)
+
+    full = demand_tool.forecast_demand(req)
+    compact = demand_tool.forecast_demand_compact(req)
+
+    assert [p.date for p in full.forecast] == [
+        date(2025, 1, 11),
+        date(2025, 1, 12),
+        date(2025, 1, 13),
+    ]
+    assert compact.dates == [p.date for p in full.forecast]
+    assert compact.expected_units == [p.expected_units for p in full.forecast]
+    # Three days with data: 4, 6 and 5 + 3 units.
+    assert 4.0 <= full.forecast[0].expected_units <= 8.0
+
+
+def test_smoothed_forecast_matches_pandas_ewm_and_normal_band():
+    daily = np.array([4.0, 5.0, 6.0, 9.0, 5.0, 7.0])
+
+    expected, lower, upper = _smoothed_forecast(daily, span_days=7)
+
+    assert expected == pytest.approx(pd.Series(daily).ewm(span=7, adjust=True).mean().iloc[-1])
+    half_width = 1.96 * pd.Series(daily).std()  # sample std (ddof=1)
+    assert lower == pytest.approx(expected - half_width)
+    assert upper == pytest.approx(expected + half_width)
+
+
+def test_smoothed_forecast_edge_cases():
+    assert _smoothed_forecast(np.array([]), span_days=7) == (0.0, None, None)
+    assert _smoothed_forecast(np.array([3.0]), span_days=7) == (3.0, None, None)
+
+    # Volatile sparse sales: the lower bound is clipped at zero.
+    expected, lower, upper = _smoothed_forecast(np.array([0.0, 20.0, 0.0, 0.0]), span_days=7)
+    assert lower == 0.0
+    assert upper > expected > 0
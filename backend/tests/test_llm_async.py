@@ -0,0 +1,178 @@
+import asyncio
+import threading
+import time
+from functools import partial
+from types import SimpleNamespace
+
+import httpx
+import orjson
+import pytest
+from pydantic import BaseModel
+
+from backend.app.agents import critic_agent
+from backend.app.agents.state import SellerState
+from backend.app.core import llm
+from backend.app.core.llm import LLMClient, LLMError
+
+
+class _Out(BaseModel):
+    value: int
+
+
+def _ollama_client():
+    client = LLMClient(breakers={})
+    client.cfg = SimpleNamespace(
+        provider="ollama",
+        ollama_base_url="http://ollama.test",
+        ollama_model="qwen3:14b",
+        model="qwen3:14b",
+    )
+    client._ollama_chat_url = "http://ollama.test/api/chat"
+    return client
+
+
+def _mock_ollama(monkeypatch, value=3):
+    requests = []
+
+    async def _handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.01)  # let concurrent callers overlap
+        event = {"message": {"content": orjson.dumps({"value": value}).decode()}, "done": True}
+        return httpx.Response(200, content=orjson.dumps(event) + b"\n")
+
+    monkeypatch.setattr(
+        llm.httpx,
+        "AsyncClient",
+        partial(httpx.AsyncClient, transport=httpx.MockTransport(_handler)),
+    )
+    return requests
+
+
+def test_async_clients_are_bound_to_the_running_loop(monkeypatch):
+    _mock_ollama(monkeypatch)
+    client = _ollama_client()
+
+    async def _http():
+        return client._async_http_client()
+
+    first = asyncio.run(_http())
+    second = asyncio.run(_http())
+
+    assert first is not second
+    # The first loop is closed, so its clients were dropped.
+    assert len(client._loop_resources) == 1
+
+
+def test_async_generate_works_across_asyncio_runs(monkeypatch):
+    requests = _mock_ollama(monkeypatch)
+    client = _ollama_client()
+
+    async def _call():
+        out = await client.agenerate_structured("hi", _Out)
+        await client.aclose()
+        return out
+
+    assert asyncio.run(_call()).value == 3
+    assert asyncio.run(_call()).value == 3
+    assert len(requests) == 2
+    assert client._loop_resources == {}
+
+
+def test_concurrent_identical_async_calls_share_one_request(monkeypatch):
+    requests = _mock_ollama(monkeypatch)
+    client = _ollama_client()
+
+    async def _calls():
+        return await asyncio.gather(
+            *(client.agenerate_structured("same", _Out, temperature=0.2) for _ in range(3))
+        )
+
+    results = asyncio.run(_calls())
+
+    assert [r.value for r in results] == [3, 3, 3]
+    assert len(requests) == 1
+
+
+def test_async_critic_agent_sets_and_preserves_critique(monkeypatch):
+    calls = []
+
+    class _FakeClient:
+        async def agenerate_structured(self, prompt, output_model, **kwargs):
+            calls.append(kwargs)
+            if len(calls) > 1:
+                raise LLMError("down")
+            return output_model(overall_comment="ok", weaknesses=["w"], missing_areas=["m"])
+
+    monkeypatch.setattr(critic_agent, "get_llm_client", lambda: _FakeClient())
+
+    state = asyncio.run(critic_agent.update_critique(SellerState()))
+    assert state.critique.comments == "ok"
+    assert state.critique.detected_risks == ["w"]
+
+    # A failing LLM call leaves the previous critique in place.
+    again = asyncio.run(critic_agent.update_critique(state))
+    assert again.critique.comments == "ok"
+    assert len(calls) == 2
+    # Deterministic sampling, so identical critic prompts are cacheable.
+    assert calls[0]["temperature"] == 0.0
+
+
+def test_cancelled_leader_does_not_cancel_followers(monkeypatch):
+    requests = _mock_ollama(monkeypatch)
+    client = _ollama_client()
+
+    async def _calls():
+        leader = asyncio.create_task(client.agenerate_structured("same", _Out))
+        await asyncio.sleep(0)
+        follower = asyncio.create_task(client.agenerate_structured("same", _Out))
+        await asyncio.sleep(0)
+        # One client disconnecting must not kill another's identical request.
+        leader.cancel()
+        out = await follower
+        return leader.cancelled(), out
+
+    leader_cancelled, out = asyncio.run(_calls())
+
+    assert leader_cancelled
+    assert out.value == 3
+    # The follower retried as the new leader.
+    assert len(requests) == 2
+
+
+def test_interrupted_sync_leader_hands_over_to_followers(monkeypatch):
+    client = _ollama_client()
+    leader_started = threading.Event()
+    follower_waiting = threading.Event()
+    calls = []
+
+    class _Interrupted(BaseException):
+        pass
+
+    def _generate(prompt, output_model, system_prompt, temperature):
+        calls.append(1)
+        if len(calls) == 1:
+            leader_started.set()
+            follower_waiting.wait(timeout=5)
+            time.sleep(0.05)  # let the follower block on the shared future
+            raise _Interrupted()
+        return output_model(value=5)
+
+    monkeypatch.setattr(client, "_generate_uncached", _generate)
+    results = []
+
+    def _leader():
+        with pytest.raises(_Interrupted):
+            client.generate_structured("same", _Out)
+
+    def _follower():
+        leader_started.wait(timeout=5)
+        follower_waiting.set()
+        results.append(client.generate_structured("same", _Out))
+
+    threads = [threading.Thread(target=_leader), threading.Thread(target=_follower)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout=5)
+
+    assert [r.value for r in results] == [5]
@@ -1,7 +1,10 @@
+import asyncio
 from types import SimpleNamespace
 
+import pytest
 from pydantic import BaseModel
 
+from backend.app.core import llm
 from backend.app.core.llm import LLMClient, LLMError
 
 
@@ -9,8 +12,23 @@ class _Out(BaseModel):
     value: int
 
 
+def _fresh_breakers(**kwargs):
+    return {"ollama": llm._CircuitBreaker(**kwargs), "groq": llm._CircuitBreaker()}
+
+
+def _hybrid_client(breakers):
+    client = LLMClient(breakers=breakers)
+    client.cfg = SimpleNamespace(
+        provider="hybrid",
+        primary_provider="ollama",
+        fallback_provider="groq",
+        model="qwen3:14b",
+    )
+    return client
+
+
 def test_hybrid_falls_back_when_primary_fails(monkeypatch):
-    client = LLMClient()
+    client = LLMClient(breakers=_fresh_breakers())
     client.cfg = SimpleNamespace(
         provider="hybrid",
         primary_provider="ollama",
@@ -39,3 +57,182 @@ def test_hybrid_falls_back_when_primary_fails(monkeypatch):
 
     out = client.generate_structured("test", _Out)
     assert out.value == 42
+
+
+def test_transient_errors_are_retried_before_failing_over(monkeypatch):
+    client = LLMClient()
+    attempts = []
+
+    def _flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise llm._TransientLLMError("503", retry_after=0)
+        return {"value": 7}
+
+    monkeypatch.setattr(llm.time, "sleep", lambda _seconds: None)
+    assert client._with_retries("ollama", _flaky) == {"value": 7}
+    assert len(attempts) == 3
+
+
+def test_open_breaker_skips_primary(monkeypatch):
+    breakers = _fresh_breakers(failure_threshold=2, reset_timeout=30.0)
+    breaker = breakers["ollama"]
+    client = _hybrid_client(breakers)
+
+    primary_calls = []
+
+    def _raise_ollama(*args, **kwargs):
+        primary_calls.append(1)
+        raise LLMError("down")
+
+    monkeypatch.setattr(client, "_generate_with_ollama", _raise_ollama)
+    monkeypatch.setattr(
+        client,
+        "_generate_with_groq",
+        lambda prompt, system_prompt, temperature: {"value": 1},
+    )
+
+    for _ in range(4):
+        assert client.generate_structured("test", _Out).value == 1
+    assert len(primary_calls) == 2
+    assert breaker.state == "open"
+
+
+class _Interrupted(BaseException):
+    pass
+
+
+def _half_open_breakers():
+    breakers = _fresh_breakers(failure_threshold=1, reset_timeout=0.0)
+    breakers["ollama"].record_failure()
+    assert breakers["ollama"].state == "open"
+    return breakers
+
+
+def test_interrupted_half_open_probe_reopens_breaker(monkeypatch):
+    breakers = _half_open_breakers()
+    client = _hybrid_client(breakers)
+
+    def _interrupted(*args, **kwargs):
+        raise _Interrupted()
+
+    monkeypatch.setattr(client, "_generate_with_ollama", _interrupted)
+
+    with pytest.raises(_Interrupted):
+        client.generate_structured("test", _Out)
+    assert breakers["ollama"].state == "open"
+
+
+def test_cancelled_async_probe_reopens_breaker(monkeypatch):
+    breakers = _half_open_breakers()
+    client = _hybrid_client(breakers)
+
+    async def _hang(*args, **kwargs):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(client, "_agenerate_with_ollama", _hang)
+
+    async def _run():
+        task = asyncio.create_task(client.agenerate_structured("test", _Out))
+        await asyncio.sleep(0)
+        assert breakers["ollama"].state == "half_open"
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(_run())
+    assert breakers["ollama"].state == "open"
+
+
+def test_cancelled_calls_do_not_trip_a_closed_breaker(monkeypatch):
+    breakers = _fresh_breakers(failure_threshold=2)
+    client = _hybrid_client(breakers)
+
+    async def _hang(*args, **kwargs):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(client, "_agenerate_with_ollama", _hang)
+
+    async def _run():
+        for i in range(5):
+            # Distinct prompts, so each call is its own leader.
+            task = asyncio.create_task(client.agenerate_structured(f"test {i}", _Out))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(_run())
+    assert breakers["ollama"].state == "closed"
+    assert breakers["ollama"].failure_count == 0
+
+
+def test_retries_give_up_after_max_attempts_sync_and_async(monkeypatch):
+    client = LLMClient(breakers=_fresh_breakers())
+    attempts = []
+    delays = []
+
+    def _always_down():
+        attempts.append(1)
+        raise llm._TransientLLMError("503", retry_after=0)
+
+    async def _always_down_async():
+        return _always_down()
+
+    async def _fake_async_sleep(seconds):
+        delays.append(seconds)
+
+    monkeypatch.setattr(llm.time, "sleep", delays.append)
+    monkeypatch.setattr(llm.asyncio, "sleep", _fake_async_sleep)
+
+    with pytest.raises(llm._TransientLLMError):
+        client._with_retries("ollama", _always_down)
+    with pytest.raises(llm._TransientLLMError):
+        asyncio.run(client._awith_retries("ollama", _always_down_async))
+
+    assert len(attempts) == 2 * llm._RETRY_ATTEMPTS
+    # No sleep after the final attempt of either loop.
+    assert delays == [0] * (2 * (llm._RETRY_ATTEMPTS - 1))
+
+
+def test_retries_stop_at_the_overall_budget(monkeypatch):
+    client = LLMClient(breakers=_fresh_breakers())
+    clock = [0.0]
+    attempts = []
+
+    def _advance(seconds):
+        clock[0] += seconds
+
+    async def _async_advance(seconds):
+        _advance(seconds)
+
+    monkeypatch.setattr(llm.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(llm.time, "sleep", _advance)
+    monkeypatch.setattr(llm.asyncio, "sleep", _async_advance)
+
+    def _read_timeout():
+        attempts.append(clock[0])
+        _advance(60.0)
+        raise llm._TransientLLMError("Ollama chat request timed out")
+
+    async def _read_timeout_async():
+        return _read_timeout()
+
+    # A hung provider is not retried: one read timeout exceeds the budget.
+    with pytest.raises(llm._TransientLLMError):
+        client._with_retries("ollama", _read_timeout)
+    with pytest.raises(llm._TransientLLMError):
+        asyncio.run(client._awith_retries("ollama", _read_timeout_async))
+    assert len(attempts) == 2
+
+    attempts.clear()
+    clock[0] = 0.0
+
+    def _rate_limited():
+        attempts.append(clock[0])
+        raise llm._TransientLLMError("429", retry_after=16.0)
+
+    with pytest.raises(llm._TransientLLMError):
+        client._with_retries("groq", _rate_limited)
+    # 0s, 16s, 32s; a fourth attempt at 48s would overrun the 45s budget.
+    assert attempts == [0.0, 16.0, 32.0]
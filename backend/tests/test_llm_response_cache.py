@@ -0,0 +1,100 @@
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+from pydantic import BaseModel
+
+from backend.app.core.llm import LLMClient
+
+
+class _Out(BaseModel):
+    value: int
+
+
+def _ollama_client(monkeypatch):
+    client = LLMClient()
+    client.cfg = SimpleNamespace(
+        provider="ollama",
+        ollama_base_url="http://localhost:11434",
+        ollama_model="qwen3:14b",
+        model="qwen3:14b",
+    )
+    calls = []
+
+    def _fake_ollama(prompt, system_prompt, temperature):
+        calls.append(prompt)
+        return {"value": len(calls)}
+
+    monkeypatch.setattr(client, "_generate_with_ollama", _fake_ollama)
+    return client, calls
+
+
+def test_deterministic_calls_are_memoized(monkeypatch):
+    client, calls = _ollama_client(monkeypatch)
+
+    first = client.generate_structured("same", _Out, system_prompt="sys", temperature=0.0)
+    second = client.generate_structured("same", _Out, system_prompt="sys", temperature=0.0)
+    other = client.generate_structured("different", _Out, system_prompt="sys", temperature=0.0)
+
+    assert first.value == second.value == 1
+    assert other.value == 2
+    assert len(calls) == 2
+
+
+def test_sampled_calls_are_not_memoized(monkeypatch):
+    client, calls = _ollama_client(monkeypatch)
+
+    client.generate_structured("same", _Out, temperature=0.2)
+    client.generate_structured("same", _Out, temperature=0.2)
+
+    assert len(calls) == 2
+
+
+def test_concurrent_identical_calls_share_one_request(monkeypatch):
+    client, calls = _ollama_client(monkeypatch)
+    release = threading.Event()
+
+    def _slow_ollama(prompt, system_prompt, temperature):
+        calls.append(prompt)
+        release.wait(timeout=5)
+        return {"value": len(calls)}
+
+    monkeypatch.setattr(client, "_generate_with_ollama", _slow_ollama)
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(client.generate_structured("burst", _Out).value)
+        )
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.1)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [1, 1, 1, 1]
+
+
+def test_async_identical_calls_are_coalesced(monkeypatch):
+    client, calls = _ollama_client(monkeypatch)
+
+    async def _fake_aollama(prompt, system_prompt, temperature):
+        calls.append(prompt)
+        await asyncio.sleep(0.01)
+        return {"value": len(calls)}
+
+    monkeypatch.setattr(client, "_agenerate_with_ollama", _fake_aollama)
+
+    async def _run():
+        return await asyncio.gather(
+            *[client.agenerate_structured("burst", _Out) for _ in range(3)]
+        )
+
+    results = asyncio.run(_run())
+    assert [r.value for r in results] == [1, 1, 1]
+    assert len(calls) == 1
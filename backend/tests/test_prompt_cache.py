@@ -0,0 +1,40 @@
+import os
+
+import pytest
+
+from backend.app.core import prompt
+
+
+@pytest.fixture
+def prompt_root(tmp_path, monkeypatch):
+    monkeypatch.setattr(prompt, "PROMPT_ROOT", tmp_path)
+    monkeypatch.setattr(prompt, "_PROMPT_CACHE", {})
+    return tmp_path
+
+
+def test_edited_prompt_is_reloaded(prompt_root):
+    path = prompt_root / "critic_v9.md"
+    path.write_text("first", encoding="utf-8")
+    os.utime(path, ns=(1_000_000_000, 1_000_000_000))
+    assert prompt.load_prompt("critic", "v9") == "first"
+
+    path.write_text("second", encoding="utf-8")
+    os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+    assert prompt.load_prompt("critic", "v9") == "second"
+
+
+def test_unchanged_prompt_is_served_from_cache(prompt_root, monkeypatch):
+    path = prompt_root / "critic_v9.md"
+    path.write_text("cached", encoding="utf-8")
+    assert prompt.load_prompt("critic", "v9") == "cached"
+
+    def _no_read(*args, **kwargs):
+        raise AssertionError("template re-read although mtime is unchanged")
+
+    monkeypatch.setattr(type(path), "read_text", _no_read)
+    assert prompt.load_prompt("critic", "v9") == "cached"
+
+
+def test_missing_prompt_raises(prompt_root):
+    with pytest.raises(FileNotFoundError, match="Prompt file not found"):
+        prompt.load_prompt("critic", "v404")
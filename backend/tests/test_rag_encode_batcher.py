@@ -0,0 +1,81 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from backend.app.rag import store
+
+
+class _FakeEmbedder:
+    """Blocks the first forward pass until `hold` is set."""
+
+    def __init__(self):
+        self.hold = threading.Event()
+        self.batches = []
+
+    def encode(self, queries, batch_size, convert_to_numpy):
+        if not self.batches:
+            self.hold.wait(timeout=5)
+        self.batches.append(list(queries))
+        return np.array([[float(len(q))] for q in queries])
+
+
+def _wait_for(predicate):
+    deadline = time.monotonic() + 5
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.001)
+
+
+def test_leader_returns_once_its_own_query_is_encoded(monkeypatch):
+    embedder = _FakeEmbedder()
+    monkeypatch.setattr(store, "_get_embedder", lambda: embedder)
+    batcher = store._QueryEncodeBatcher(max_batch=1)
+    results = {}
+    batches_when_leader_returned = []
+
+    def _leader():
+        results["a"] = batcher.encode("a")
+        batches_when_leader_returned.append(len(embedder.batches))
+
+    def _follower(query):
+        results[query] = batcher.encode(query)
+
+    threads = [threading.Thread(target=_leader)]
+    threads[0].start()
+    _wait_for(lambda: batcher._draining)
+    threads += [threading.Thread(target=_follower, args=(q,)) for q in ("bb", "ccc", "dddd")]
+    for t in threads[1:]:
+        t.start()
+    _wait_for(lambda: len(batcher._pending) == 3)
+    embedder.hold.set()
+    for t in threads:
+        t.join(timeout=5)
+
+    # The leader did not drain the followers' queue before returning.
+    assert batches_when_leader_returned == [1]
+    assert results == {"a": (1.0,), "bb": (2.0,), "ccc": (3.0,), "dddd": (4.0,)}
+    assert not batcher._draining
+
+
+def test_interrupted_leader_fails_its_batch_and_hands_over(monkeypatch):
+    class _Interrupted(BaseException):
+        pass
+
+    calls = []
+
+    class _Embedder:
+        def encode(self, queries, batch_size, convert_to_numpy):
+            calls.append(queries)
+            if len(calls) == 1:
+                raise _Interrupted()
+            return np.array([[1.0] for _ in queries])
+
+    monkeypatch.setattr(store, "_get_embedder", lambda: _Embedder())
+    batcher = store._QueryEncodeBatcher()
+
+    with pytest.raises(_Interrupted):
+        batcher.encode("a")
+    assert not batcher._draining
+    assert batcher.encode("b") == (1.0,)
@@ -1,3 +1,7 @@
+import math
+
+import pytest
+
 from backend.app.rag import store
 from backend.app.schemas.rag import RAGChunk
 
@@ -29,3 +33,86 @@ def test_local_rag_retrieval_filters_by_marketplace(monkeypatch):
     )
     assert len(result) == 1
     assert result[0].marketplace == "amazon"
+
+
+def _chunk(id: str, text: str, marketplace: str = "amazon") -> RAGChunk:
+    return RAGChunk(
+        id=id,
+        text=text,
+        marketplace=marketplace,
+        section="policies",
+        source=f"{marketplace}/policies.md",
+    )
+
+
+def _bm25(query_terms, docs):
+    # Textbook Okapi BM25 (idf = ln(1 + (N - df + 0.5) / (df + 0.5))).
+    tokenized = [store._TOKEN_RE.findall(d.lower()) for d in docs]
+    avg_len = sum(map(len, tokenized)) / len(tokenized)
+    k1, b = store._BM25_K1, store._BM25_B
+    scores = []
+    for tokens in tokenized:
+        score = 0.0
+        for term in query_terms:
+            tf = tokens.count(term)
+            if not tf:
+                continue
+            df = sum(term in t for t in tokenized)
+            idf = math.log1p((len(docs) - df + 0.5) / (df + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * len(tokens) / avg_len))
+        scores.append(score)
+    return scores
+
+
+def test_bm25_scores_match_reference_and_rank_rare_terms_first(monkeypatch):
+    texts = [
+        "Shipping window for standard orders",
+        "Shipping label printing",
+        "Refund window after delivery",
+        "Shipping speed and shipping partners",
+    ]
+    chunks = [_chunk(f"c{i}", t) for i, t in enumerate(texts)]
+    monkeypatch.setattr(store, "_load_local_chunks", lambda: chunks)
+
+    result = store._retrieve_local_chunks("shipping refund", None, None, top_k=4)
+
+    # "refund" is in one chunk, "shipping" in three: the rare term wins.
+    assert result[0].id == "c2"
+    expected = dict(zip((c.id for c in chunks), _bm25(["shipping", "refund"], texts)))
+    for chunk in result:
+        assert chunk.score == pytest.approx(expected[chunk.id])
+    assert [c.score for c in result] == sorted((c.score for c in result), reverse=True)
+
+
+def test_bm25_prefers_shorter_chunk_at_equal_term_frequency(monkeypatch):
+    chunks = [
+        _chunk("long", "GST invoice rules apply to every seller account on the platform"),
+        _chunk("short", "GST invoice rules"),
+        _chunk("other", "Return policy"),
+    ]
+    monkeypatch.setattr(store, "_load_local_chunks", lambda: chunks)
+
+    result = store._retrieve_local_chunks("gst invoice", None, None, top_k=2)
+
+    assert [c.id for c in result] == ["short", "long"]
+    assert result[0].score > result[1].score > 0
+
+
+def test_bm25_top_k_filter_and_no_overlap(monkeypatch):
+    chunks = [
+        _chunk("a1", "Catalog image rules"),
+        _chunk("f1", "Catalog image rules", marketplace="flipkart"),
+        _chunk("a2", "Catalog pricing"),
+        _chunk("a3", "Seller onboarding"),
+    ]
+    monkeypatch.setattr(store, "_load_local_chunks", lambda: chunks)
+
+    top = store._retrieve_local_chunks("catalog image", "amazon", None, top_k=2)
+    assert [c.id for c in top] == ["a1", "a2"]
+
+    assert store._retrieve_local_chunks("catalog", None, None, top_k=0) == []
+    assert store._retrieve_local_chunks("catalog", "ebay", None, top_k=3) == []
+
+    # No query term in the corpus: corpus order, zero scores.
+    none = store._retrieve_local_chunks("warranty", "amazon", None, top_k=2)
+    assert [(c.id, c.score) for c in none] == [("a1", 0.0), ("a2", 0.0)]
@@ -0,0 +1,75 @@
+import pytest
+from opensearchpy.exceptions import RequestError
+
+from backend.app.rag import store
+
+
+def _hit(id: str, marketplace: str) -> dict:
+    return {
+        "_id": id,
+        "_score": 1.0,
+        "_source": {"id": id, "text": id, "marketplace": marketplace, "section": "fees"},
+    }
+
+
+def _rejected(reason: str) -> RequestError:
+    body = {"error": {"root_cause": [{"reason": reason}], "reason": "all shards failed"}}
+    return RequestError(400, "search_phase_execution_exception", body)
+
+
+class _FakeOpenSearch:
+    """Rejects filtered k-NN (like an nmslib index) and optionally hybrid queries."""
+
+    def __init__(self, hybrid_error=None):
+        self.hybrid_error = hybrid_error
+        self.bodies = []
+
+    def search(self, index, body, params=None):
+        self.bodies.append(body)
+        query = body["query"]
+        if "hybrid" in query:
+            raise self.hybrid_error
+        if "knn" in query and "filter" in query["knn"]["embedding"]:
+            raise _rejected("Engine [NMSLIB] does not support filters")
+        hits = [_hit("a1", "amazon"), _hit("f1", "flipkart")]
+        for clause in query.get("bool", {}).get("filter", []):
+            wanted = clause["term"]["marketplace"]
+            hits = [h for h in hits if h["_source"]["marketplace"] == wanted]
+        return {"hits": {"hits": hits}}
+
+
+@pytest.fixture
+def fake_client(monkeypatch):
+    client = _FakeOpenSearch()
+    monkeypatch.setattr(store, "_get_opensearch_client", lambda: client)
+    monkeypatch.setattr(store, "_encode_query", lambda query: (0.1, 0.2))
+    monkeypatch.setattr(store, "_native_hybrid_supported", True)
+    return client
+
+
+def test_vector_search_filters_in_python_when_knn_filter_is_rejected(fake_client):
+    chunks = store._retrieve_opensearch_chunks("fees", "amazon", None, top_k=5, mode="vector")
+
+    assert [c.id for c in chunks] == ["a1"]
+    assert "filter" not in fake_client.bodies[-1]["query"]["knn"]["embedding"]
+
+
+def test_rejected_hybrid_request_falls_back_without_disabling_it(fake_client):
+    fake_client.hybrid_error = _rejected("failed to parse field [marketplace]")
+
+    chunks = store._retrieve_opensearch_chunks("fees", "amazon", None, top_k=5, mode="hybrid")
+
+    assert [c.id for c in chunks] == ["a1"]
+    assert store._native_hybrid_supported
+
+
+@pytest.mark.parametrize(
+    "reason",
+    ["unknown query [hybrid]", "Pipeline copilot-hybrid is not defined"],
+)
+def test_unsupported_hybrid_disables_native_hybrid(fake_client, reason):
+    fake_client.hybrid_error = _rejected(reason)
+
+    store._retrieve_opensearch_chunks("fees", None, None, top_k=5, mode="hybrid")
+
+    assert not store._native_hybrid_supported
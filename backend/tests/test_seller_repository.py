@@ -0,0 +1,33 @@
+from datetime import date
+
+from backend.app.db import seller_repository
+
+
+def test_sales_history_is_unbounded_by_default(varchar_date_warehouse):
+    records = seller_repository.list_sales_history("P001")
+    cols = seller_repository.list_sales_history_columns("P001")
+
+    assert len(records) == 4
+    assert len(cols["date"]) == 4
+
+
+def test_sales_history_limit_keeps_most_recent_rows_and_warns(
+    varchar_date_warehouse, monkeypatch
+):
+    warnings = []
+    monkeypatch.setattr(
+        seller_repository, "_warn_truncated", lambda pid, limit: warnings.append((pid, limit))
+    )
+
+    records = seller_repository.list_sales_history("P001", limit=2)
+    cols = seller_repository.list_sales_history_columns("P001", limit=2)
+
+    assert [(r.date, r.marketplace) for r in records] == [
+        (date(2025, 1, 10), "amazon"),
+        (date(2025, 1, 10), "flipkart"),
+    ]
+    assert cols["marketplace"].tolist() == ["amazon", "flipkart"]
+    assert warnings == [("P001", 2), ("P001", 2)]
+
+    seller_repository.list_sales_history("P001", limit=4)
+    assert len(warnings) == 2
@@ -0,0 +1,50 @@
+import pytest
+from pydantic import ValidationError
+
+from backend.app.tools import sql_tool
+from backend.app.tools.sql_tool import SQLQueryInput
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT * FROM products",
+        "select p.product_id, s.units_sold from products p join sales_history s using (product_id)",
+        "with recent as (select * from sales_history) select * from recent",
+        "select * from main.products where product_id in (select product_id from inventory)",
+        "select 1",
+    ],
+)
+def test_validator_accepts_warehouse_selects(query):
+    assert SQLQueryInput(query=query).query == query
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ("DROP TABLE products", "Only SELECT queries"),
+        ("insert into products values (1)", "Only SELECT queries"),
+        ("select 1; select 2", "single SELECT statement"),
+        ("select * from read_csv('/etc/passwd')", "Table functions"),
+        ("select * from '/etc/passwd'", "is not allowed"),
+        ("select * from information_schema.tables", "Only warehouse tables"),
+        ("select * from other.main.products", "Only warehouse tables"),
+        ("select * from chat_sessions", "Table 'chat_sessions' is not allowed"),
+        # A CTE named like a warehouse table must not hide what it reads.
+        (
+            "with products as (select * from chat_sessions) select * from products",
+            "Table 'chat_sessions' is not allowed",
+        ),
+        ("selec * from products", "Invalid SQL"),
+    ],
+)
+def test_validator_rejects_unsafe_queries(query, message):
+    with pytest.raises(ValidationError, match=message):
+        SQLQueryInput(query=query)
+
+
+def test_validator_rejects_oversized_queries():
+    query = "SELECT * FROM products WHERE product_id = '" + "x" * sql_tool._MAX_QUERY_CHARS + "'"
+
+    with pytest.raises(ValidationError, match="too long"):
+        SQLQueryInput(query=query)
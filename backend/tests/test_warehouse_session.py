@@ -0,0 +1,62 @@
+import duckdb
+import pytest
+
+from backend.app.core.config import settings
+from backend.app.db import session
+from backend.app.db.session import get_warehouse_connection
+
+
+@pytest.fixture
+def warehouse_path(tmp_path, monkeypatch):
+    path = tmp_path / "warehouse.duckdb"
+    # WarehouseSettings is frozen; swap the cached_property value instead.
+    settings.warehouse  # populate the cache before overriding it
+    monkeypatch.setitem(
+        settings.__dict__,
+        "warehouse",
+        settings.warehouse.model_copy(update={"seller_warehouse_dsn": str(path)}),
+    )
+    yield path
+    with session._state:
+        session._close_shared_connection()
+
+
+def _write(value: int) -> None:
+    with get_warehouse_connection(read_only=False) as conn:
+        conn.execute("CREATE OR REPLACE TABLE t AS SELECT ? AS v", [value])
+
+
+def _read() -> int:
+    with get_warehouse_connection() as conn:
+        return conn.execute("SELECT v FROM t").fetchone()[0]
+
+
+def test_writer_can_reopen_after_shared_reads(warehouse_path):
+    _write(1)
+    assert _read() == 1
+    assert session._shared_conn is not None
+
+    # Re-initialising in the same process used to fail with a
+    # "different configuration" ConnectionException.
+    _write(2)
+    assert _read() == 2
+
+
+def test_reads_before_the_file_exists(warehouse_path):
+    with pytest.raises(duckdb.CatalogException):
+        _read()
+    assert not warehouse_path.exists()
+
+    _write(3)
+    assert _read() == 3
+
+
+def test_cursor_pool_uses_pool_size_at_open(warehouse_path, monkeypatch):
+    _write(1)
+    monkeypatch.setitem(
+        settings.__dict__, "warehouse", settings.warehouse.model_copy(update={"pool_size": 2})
+    )
+
+    assert _read() == 1
+    assert session._cursor_pool is not None
+    assert session._cursor_pool.maxsize == 2
@@ -1,37 +1,68 @@
 from __future__ import annotations
 
+import json
 import os
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
 
 API_BASE_URL_DEFAULT = os.getenv("COPILOT_API_BASE_URL", "http://localhost:8000/api/v1")
 
 
-def _get_api_base_url() -> str:
-    return st.session_state.get("api_base_url", API_BASE_URL_DEFAULT).rstrip("/")
+@lru_cache(maxsize=8)
+def _normalize_base_url(raw: str) -> str:
+    return raw.rstrip("/")
 
 
-def _api_get(path: str, params: Optional[Dict[str, Any]] = None) -> Any:
-    url = f"{_get_api_base_url()}{path}"
-    resp = requests.get(url, params=params, timeout=30)
+def _get_api_base_url() -> str:
+    return _normalize_base_url(st.session_state.get("api_base_url", API_BASE_URL_DEFAULT))
+
+
+@st.cache_resource
+def _http_session() -> requests.Session:
+    # One keep-alive pool shared across reruns instead of a new connection per call.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _api_get(
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    base_url: Optional[str] = None,
+) -> Any:
+    url = f"{base_url or _get_api_base_url()}{path}"
+    resp = _http_session().get(url, params=params, timeout=30)
     resp.raise_for_status()
     return resp.json()
 
 
 def _api_post(path: str, payload: Dict[str, Any]) -> Any:
     url = f"{_get_api_base_url()}{path}"
-    resp = requests.post(url, json=payload, timeout=180)
+    resp = _http_session().post(url, json=payload, timeout=180)
     resp.raise_for_status()
     return resp.json()
 
 
-def _load_sessions(seller_id: Optional[str]) -> List[Dict[str, Any]]:
+# Reads are cached briefly so widget-driven reruns don't refetch; the base
+# URL is part of the key because it is editable from the sidebar.
+@st.cache_data(ttl=5, show_spinner=False)
+def _load_sessions(api_base_url: str, seller_id: Optional[str]) -> List[Dict[str, Any]]:
     params: Dict[str, Any] = {"limit": 100}
     if seller_id:
         params["seller_id"] = seller_id
-    return _api_get("/chat/sessions", params=params)
+    sessions = _api_get("/chat/sessions", params=params, base_url=api_base_url)
+    # Labels are built here so they are cached with the list, not per rerun.
+    for s in sessions:
+        s["label"] = (
+            f"{s.get('title', 'Seller chat')} · {s['session_id'][:8]} · {s.get('updated_at', '')}"
+        )
+    return sessions
 
 
 def _create_session(
@@ -49,30 +80,46 @@ def _create_session(
     )
 
 
-def _load_session_detail(session_id: str) -> Dict[str, Any]:
-    return _api_get(f"/chat/sessions/{session_id}", params={"limit": 300})
+@st.cache_data(ttl=5, show_spinner=False)
+def _load_session_detail(api_base_url: str, session_id: str) -> Dict[str, Any]:
+    return _api_get(
+        f"/chat/sessions/{session_id}", params={"limit": 300}, base_url=api_base_url
+    )
+
+
+def _invalidate_session_cache() -> None:
+    _load_sessions.clear()
+    _load_session_detail.clear()
 
 
-def _send_analyze(
+def _send_analyze_stream(
     query: str,
     marketplaces: List[str],
     session_id: str,
     seller_id: Optional[str],
     seller_name: Optional[str],
-) -> Dict[str, Any]:
-    return _api_post(
-        "/analyze",
-        {
-            "query": query,
-            "marketplaces": marketplaces,
-            "session_id": session_id,
-            "seller_id": seller_id,
-            "seller_name": seller_name,
-        },
-    )
-
-
-def _render_trust_block(metadata: Dict[str, Any]) -> None:
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Yield (event, data) pairs from the /analyze/stream SSE endpoint."""
+    url = f"{_get_api_base_url()}/analyze/stream"
+    payload = {
+        "query": query,
+        "marketplaces": marketplaces,
+        "session_id": session_id,
+        "seller_id": seller_id,
+        "seller_name": seller_name,
+    }
+    # Read timeout applies between events, not to the whole run.
+    with _http_session().post(url, json=payload, stream=True, timeout=(10, 180)) as resp:
+        resp.raise_for_status()
+        event = "message"
+        for line in resp.iter_lines(decode_unicode=True):
+            if line.startswith("event:"):
+                event = line[len("event:"):].strip()
+            elif line.startswith("data:"):
+                yield event, json.loads(line[len("data:"):])
+
+
+def _render_trust_block(metadata: Dict[str, Any], key: str) -> None:
     used_tools = metadata.get("used_tools") or []
     used_rag_evidence = metadata.get("used_rag_evidence") or []
     rag_debug = metadata.get("rag_debug") or {}
@@ -90,24 +137,22 @@ def _render_trust_block(metadata: Dict[str, Any]) -> None:
     cols[2].metric("Trace steps", len(execution_trace))
     cols[3].metric("Citations", len(citations))
 
-    if rag_debug:
-        st.write("`rag_debug`")
-        st.json(rag_debug)
-    if routing_debug:
-        st.write("`routing_debug`")
-        st.json(routing_debug)
-    if used_tools:
-        st.write("`used_tools`")
-        st.json(used_tools)
-    if used_rag_evidence:
-        st.write("`used_rag_evidence`")
-        st.json(used_rag_evidence)
-    if citations:
-        st.write("`citations`")
-        st.json(citations)
-    if execution_trace:
-        st.write("`execution_trace`")
-        st.json(execution_trace)
+    details = [
+        ("rag_debug", rag_debug),
+        ("routing_debug", routing_debug),
+        ("used_tools", used_tools),
+        ("used_rag_evidence", used_rag_evidence),
+        ("citations", citations),
+        ("execution_trace", execution_trace),
+    ]
+    details = [(label, blob) for label, blob in details if blob]
+    # Collapsed expanders still ship their content on every rerun, so the raw
+    # payloads are only rendered once the user asks for them.
+    if not details or not st.toggle("Show debug details", key=f"trust-{key}"):
+        return
+    for label, blob in details:
+        st.write(f"`{label}`")
+        st.json(blob, expanded=False)
 
 
 def _render_sidebar() -> Optional[str]:
@@ -139,7 +184,7 @@ def _render_sidebar() -> Optional[str]:
     st.session_state["marketplaces"] = marketplaces or ["amazon"]
 
     try:
-        sessions = _load_sessions(seller_id=seller_id)
+        sessions = _load_sessions(_get_api_base_url(), seller_id=seller_id)
     except Exception as exc:
         st.sidebar.error(f"Failed to load sessions: {exc}")
         return None
@@ -152,6 +197,7 @@ def _render_sidebar() -> Optional[str]:
                 title="Seller chat",
             )
             st.session_state["active_session_id"] = created["session_id"]
+            _invalidate_session_cache()
             st.rerun()
         except Exception as exc:
             st.sidebar.error(f"Failed to create session: {exc}")
@@ -160,10 +206,7 @@ def _render_sidebar() -> Optional[str]:
         st.sidebar.info("No sessions yet. Create one.")
         return None
 
-    labels = [
-        f"{s.get('title', 'Seller chat')} · {s['session_id'][:8]} · {s.get('updated_at', '')}"
-        for s in sessions
-    ]
+    labels = [s["label"] for s in sessions]
     selected_idx = 0
     active_session_id = st.session_state.get("active_session_id")
     if active_session_id:
@@ -185,7 +228,7 @@ def _render_sidebar() -> Optional[str]:
 
 def _render_chat(session_id: str) -> None:
     try:
-        session_detail = _load_session_detail(session_id)
+        session_detail = _load_session_detail(_get_api_base_url(), session_id)
     except Exception as exc:
         st.error(f"Failed to load chat session: {exc}")
         return
@@ -204,14 +247,14 @@ def _render_chat(session_id: str) -> None:
             for key, value in memory_facts.items():
                 st.write(f"- `{key}`: {value}")
 
-    for message in messages:
+    for idx, message in enumerate(messages):
         role = "assistant" if message["role"] == "assistant" else "user"
         with st.chat_message(role):
             st.markdown(message["content"])
             if role == "assistant":
                 metadata = message.get("metadata") or {}
                 if metadata:
-                    _render_trust_block(metadata)
+                    _render_trust_block(metadata, key=metadata.get("request_id") or f"msg-{idx}")
 
     user_prompt = st.chat_input("Ask about pricing, compliance, inventory, SEO...")
     if not user_prompt:
@@ -221,18 +264,32 @@ def _render_chat(session_id: str) -> None:
         st.markdown(user_prompt)
 
     with st.chat_message("assistant"):
-        with st.spinner("Thinking..."):
+        response: Optional[Dict[str, Any]] = None
+        with st.status("Thinking...") as status:
             try:
-                response = _send_analyze(
+                for event, data in _send_analyze_stream(
                     query=user_prompt,
                     marketplaces=st.session_state.get("marketplaces", ["amazon"]),
                     session_id=session_id,
                     seller_id=st.session_state.get("seller_id"),
                     seller_name=st.session_state.get("seller_name"),
-                )
+                ):
+                    if event == "node":
+                        status.update(label=f"Thinking... ({data['node']})")
+                        status.write(f"`{data['node']}` done")
+                    elif event == "result":
+                        response = data
+                    elif event == "error":
+                        raise RuntimeError(data.get("detail") or "analyze failed")
+                if response is None:
+                    raise RuntimeError("stream ended without a result")
             except Exception as exc:
+                status.update(label="Analyze failed", state="error")
                 st.error(f"Analyze failed: {exc}")
                 return
+            status.update(label="Done", state="complete", expanded=False)
+            # The turn was persisted server-side; drop the cached reads.
+            _invalidate_session_cache()
 
         answer = response["final_answer"]["answer_markdown"]
         st.markdown(answer)
@@ -250,7 +307,8 @@ def _render_chat(session_id: str) -> None:
                 ),
                 "session_id": response.get("session_id"),
                 "request_id": response.get("request_id"),
-            }
+            },
+            key=f"new-{response.get('request_id')}",
         )
     st.rerun()
 